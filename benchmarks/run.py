@@ -0,0 +1,264 @@
+# /// script
+# requires-python = ">=3.12"
+# dependencies = [
+#     "thingsmith",
+# ]
+#
+# [tool.uv.sources]
+# thingsmith = { path = "../", editable = true }
+# ///
+"""
+Benchmark Gridfinity primitives, organizers and exports.
+
+Every case is built from scratch: the in-memory geometry caches are cleared and the disk cache is disabled
+before each run. Results are written as JSON tagged with the machine and library versions, and two result
+files can be compared to flag regressions.
+
+    uv run benchmarks/run.py run --suite quick
+    uv run benchmarks/run.py compare benchmarks/results/a.json benchmarks/results/b.json --threshold 0.1
+"""
+
+import argparse
+import functools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+from thingsmith import drive_socket as socket, wrench
+from thingsmith._gridfinity import Block, BlockGrid, OrganizerFrame, block_cache, frame_mesh, grid_cache
+from thingsmith._label import glyph_cache, label_cache
+from thingsmith._parts import part_cache
+from thingsmith.cache import configure_brep_cache
+from thingsmith.drive_socket._cutter import cutter_cache
+from thingsmith.export import ExportFormat, Quality, export_shape
+from thingsmith.profiling import Recorder
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+type Case = tuple[str, Callable[[], object]]
+
+
+def _package_version(name: str) -> str:
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _git_revision() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return out.stdout.strip()
+
+
+def machine() -> dict[str, Any]:
+    return {
+        "host": platform.node(),
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+        "build123d": _package_version("build123d"),
+        "ocp": _package_version("cadquery-ocp"),
+        "revision": _git_revision(),
+    }
+
+
+def _clear_caches() -> None:
+    for cache in (block_cache, grid_cache, cutter_cache, glyph_cache, label_cache, part_cache):
+        cache.clear()
+
+
+def _sockets(n: int) -> list[socket.Socket]:
+    builder = socket.SocketBuilder().drive(socket.DriveSize.QUARTER_INCH)
+    return [builder.metric(4 + i).diameter(11.9 + (i % 8)).build() for i in range(n)]
+
+
+def _socket_case(n: int, *, labels: bool, split: bool) -> Case:
+    name = f"socket-{n}" + ("-labels" if labels else "") + ("-split" if split else "")
+    spec = socket.OrganizerSpec(
+        sockets=_sockets(n),
+        insert_labels=labels,
+        organizer_label="Metric" if labels else "",
+        organizer_split_face_plate=2 if split else 0,
+    )
+    return name, lambda: socket.Organizer(spec)
+
+
+WRENCH_SETS: dict[int, tuple[list[float], bool]] = {
+    1: ([17], True),
+    5: ([8, 13, 14, 15, 17], True),
+    10: (list(range(8, 18)), True),
+    # twenty labels do not fit in front of their inserts
+    20: (list(range(10, 30)), False),
+}
+"""Wrench sizes and whether they are labeled per set size, starting from the set in example/catalog.toml."""
+
+
+def _wrench_case(n: int) -> Case:
+    sizes, labels = WRENCH_SETS[n]
+    wrenches = [wrench.Wrench(size) for size in sizes]
+    spec = wrench.OrganizerSpec(add_labels=labels)
+    name = f"wrench-{n}" + ("" if spec.add_labels else "-nolabels")
+    return name, lambda: wrench.Organizer(wrenches, spec)
+
+
+@functools.cache
+def _export_organizer() -> socket.Organizer:
+    return socket.Organizer(socket.OrganizerSpec(sockets=_sockets(10), organizer_split_face_plate=2))
+
+
+def _export(path: Path, fmt: ExportFormat, quality: Quality) -> Path:
+    return export_shape(_export_organizer(), path, fmt, quality)
+
+
+def _export_cases(directory: Path) -> list[Case]:
+    formats: list[ExportFormat] = ["stl", "3mf"]
+    return [
+        (f"export-{fmt}-{quality.name.lower()}", functools.partial(_export, directory / f"bench.{fmt}", fmt, quality))
+        for fmt in formats
+        for quality in (Quality.PREVIEW, Quality.ARCHIVAL)
+    ]
+
+
+def cases(suite: str, directory: Path) -> list[Case]:
+    full = suite == "full"
+    grid_sizes = range(1, 9) if full else (1, 4, 8)
+    socket_counts = (1, 5, 10, 20, 40) if full else (1, 10)
+    wrench_counts = (1, 5, 10, 20) if full else (1, 5)
+    toggles = [(False, False), (True, False), (False, True), (True, True)] if full else [(True, True)]
+
+    selected: list[Case] = [("block", Block)]
+    selected += [(f"grid-{n}x{n}", functools.partial(BlockGrid, n, n)) for n in grid_sizes]
+    selected += [("frame-4x1", lambda: OrganizerFrame(grid_x=4, grid_y=1, radius=3, height=10))]
+    selected += [("frame-4x1-mesh", lambda: frame_mesh(grid_x=4, grid_y=1, radius=3, height=10))]
+    selected += [_socket_case(n, labels=lbl, split=split) for n in socket_counts for lbl, split in toggles]
+    selected += [_wrench_case(n) for n in wrench_counts]
+    selected += _export_cases(directory)
+    return selected
+
+
+def measure(build: Callable[[], object], repeat: int, warmup: int) -> dict[str, Any]:
+    """Time `build`, or return the error it raised so that one broken case does not end the run."""
+    runs = []
+    phases: list[dict[str, float]] = []
+    try:
+        # warm up outside the timing, e.g. fonts loaded once per process or the organizer the exports write
+        for _ in range(warmup):
+            build()
+        for _ in range(repeat):
+            _clear_caches()
+            with Recorder() as rec:
+                start = time.perf_counter()
+                build()
+                runs.append(time.perf_counter() - start)
+            phases.append(rec.totals())
+    except Exception as ex:  # noqa: BLE001
+        return {"error": f"{type(ex).__name__}: {ex}"}
+    return {"min": min(runs), "median": statistics.median(runs), "runs": runs, "phases": phases}
+
+
+def run(args: argparse.Namespace) -> int:
+    configure_brep_cache(None)
+    results: dict[str, Any] = {}
+    failed = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, build in cases(args.suite, Path(tmp)):
+            if args.filter and args.filter not in name:
+                continue
+            results[name] = measure(build, args.repeat, args.warmup)
+            if "error" in results[name]:
+                failed += 1
+                print(f"{name:32} FAILED {results[name]['error']}")
+            else:
+                print(f"{name:32} {results[name]['median']:8.3f}s")
+
+    report = {
+        "machine": machine(),
+        "suite": args.suite,
+        "repeat": args.repeat,
+        "warmup": args.warmup,
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "results": results,
+    }
+    output = args.output
+    if output is None:
+        tag = f"{platform.node()}-{datetime.now(UTC):%Y%m%dT%H%M%S}"
+        output = RESULTS_DIR / f"{tag}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"results written to {output}")
+    return 1 if failed else 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    base = json.loads(args.base.read_text())
+    new = json.loads(args.new.read_text())
+    if base["machine"] != new["machine"]:
+        print("warning: results are from different machines or versions")
+        for key in sorted(base["machine"].keys() | new["machine"].keys()):
+            if base["machine"].get(key) != new["machine"].get(key):
+                print(f"  {key}: {base['machine'].get(key)} -> {new['machine'].get(key)}")
+
+    regressions = 0
+    for name in [n for n in base["results"] if n in new["results"]]:
+        if "error" in base["results"][name] or "error" in new["results"][name]:
+            print(f"{name:32} failed in {'the base' if 'error' in base['results'][name] else 'the new'} results")
+            continue
+        before = base["results"][name]["median"]
+        after = new["results"][name]["median"]
+        change = after / before - 1
+        flag = ""
+        if change > args.threshold:
+            flag = "REGRESSION"
+            regressions += 1
+        elif change < -args.threshold:
+            flag = "improved"
+        print(f"{name:32} {before:8.3f}s {after:8.3f}s {change:+8.1%} {flag}")
+    print(f"{regressions} regression(s) above {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark thingsmith builds")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks and store the results")
+    run_parser.add_argument("--suite", choices=["quick", "full"], default="quick")
+    run_parser.add_argument("--repeat", type=int, default=3, help="runs per case; the median is compared")
+    run_parser.add_argument("--warmup", type=int, default=1, help="untimed runs per case before measuring")
+    run_parser.add_argument("--filter", help="only run cases whose name contains this text")
+    run_parser.add_argument("--output", type=Path, help="result file, defaults to results/<host>-<time>.json")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("base", type=Path)
+    compare_parser.add_argument("new", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="relative slowdown to flag")
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
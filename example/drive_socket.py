@@ -11,11 +11,13 @@
 
 import argparse
 from fractions import Fraction
+from pathlib import Path
 from typing import NamedTuple
 
-from build123d import Axis, Location, Mesher, export_stl
+from build123d import Location
 from ocp_vscode import show_object
-from thingsmith import drive_socket as socket
+from thingsmith import drive_socket as socket, plate
+from thingsmith.batch import BuildResult, iter_build
 from thingsmith.drive_socket import SocketType
 
 
@@ -63,9 +65,9 @@ def make_spec(drive: str, socket_type: socket.SocketType, dimensions: list[Dimen
     )
 
 
-def metric_organizers() -> list[socket.Organizer]:
+def metric_organizers() -> list[socket.LazyOrganizer]:
     return [
-        socket.Organizer(
+        socket.LazyOrganizer(
             make_spec(
                 "1/4",
                 SocketType.METRIC | SocketType.SIX_POINT,
@@ -83,7 +85,7 @@ def metric_organizers() -> list[socket.Organizer]:
                 ],
             ),
         ),
-        socket.Organizer(
+        socket.LazyOrganizer(
             make_spec(
                 "1/4",
                 SocketType.METRIC | SocketType.SIX_POINT | SocketType.DEEP,
@@ -98,7 +100,7 @@ def metric_organizers() -> list[socket.Organizer]:
                 ],
             ),
         ),
-        socket.Organizer(
+        socket.LazyOrganizer(
             make_spec(
                 "1/2",
                 SocketType.METRIC | SocketType.SIX_POINT,
@@ -116,7 +118,7 @@ def metric_organizers() -> list[socket.Organizer]:
                 ],
             ),
         ),
-        socket.Organizer(
+        socket.LazyOrganizer(
             make_spec(
                 "1/2",
                 SocketType.METRIC | SocketType.SIX_POINT | SocketType.DEEP,
@@ -133,7 +135,7 @@ def metric_organizers() -> list[socket.Organizer]:
                 ],
             ),
         ),
-        socket.Organizer(
+        socket.LazyOrganizer(
             make_spec(
                 "3/8",
                 SocketType.METRIC | SocketType.TWELVE_POINT,
@@ -154,9 +156,9 @@ def metric_organizers() -> list[socket.Organizer]:
     ]
 
 
-def sae_organizers() -> list[socket.Organizer]:
+def sae_organizers() -> list[socket.LazyOrganizer]:
     return [
-        socket.Organizer(
+        socket.LazyOrganizer(
             make_spec(
                 "1/4",
                 SocketType.SAE | SocketType.SIX_POINT,
@@ -173,7 +175,7 @@ def sae_organizers() -> list[socket.Organizer]:
                 ],
             ),
         ),
-        socket.Organizer(
+        socket.LazyOrganizer(
             make_spec(
                 "1/4",
                 SocketType.SAE | SocketType.SIX_POINT | SocketType.DEEP,
@@ -188,7 +190,7 @@ def sae_organizers() -> list[socket.Organizer]:
                 ],
             ),
         ),
-        socket.Organizer(
+        socket.LazyOrganizer(
             make_spec(
                 "1/2",
                 SocketType.SAE | SocketType.SIX_POINT,
@@ -205,7 +207,7 @@ def sae_organizers() -> list[socket.Organizer]:
                 ],
             ),
         ),
-        socket.Organizer(
+        socket.LazyOrganizer(
             make_spec(
                 "1/2",
                 SocketType.SAE | SocketType.SIX_POINT | SocketType.DEEP,
@@ -227,6 +229,9 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate socket organizers")
     parser.add_argument("-show", action="store_true", help="Show objects in viewer")
     parser.add_argument("-output", type=str, action="append", choices=["3mf", "stl"], default=[])
+    parser.add_argument("-plates", action="store_true", help="Export one 3MF per printer bed")
+    parser.add_argument("-bed", type=float, nargs=2, default=(256, 256), help="Printer bed width and depth in mm")
+    parser.add_argument("-memory", type=int, help="Memory budget of the build workers in MB")
     parser.add_argument("types", nargs="+", type=str, choices=["metric", "sae"])
     args = parser.parse_args()
 
@@ -237,26 +242,54 @@ if __name__ == "__main__":
         elif t == "sae":
             objs.extend(sae_organizers())
 
-    offset = 10
-    for i, o in enumerate(objs):
-        if i != 0:
-            prev = objs[i - 1]
-            v = prev.edges().sort_by(Axis.Y)[-1].vertices()[0]
-            o.move(Location((0, v.Y + offset, 0)))
-        if args.show:
-            show_object(o)
-        for output in args.output:
-            if output == "stl":
-                f = f"example/stl/{o.name}.stl"
-                ok = export_stl(o, f)
-                print(f"{'✅' if ok else '🚫'} {f}")
-            if output == "3mf":
-                f = f"example/3mf/{o.name}.model.3mf"
-                exporter = Mesher()
-                exporter.add_shape(o, part_number=o.name)
-                exporter.add_code_to_metadata()
-                try:
-                    exporter.write(f)
-                    print(f"✅ {f}")
-                except ValueError as ex:
-                    print(f"🚫 {f}: {ex}")
+    budget = args.memory * 2**20 if args.memory else None
+    # the build workers write each organizer's files into example/<format>
+    export_dirs = {fmt: f"example/{fmt}" for fmt in args.output} or None
+
+    def report(result: BuildResult) -> None:
+        if not result.ok:
+            print(f"🚫 {result.name}: {result.error}")
+        for f in result.files:
+            print(f"✅ {f}")
+
+    def build(items: list[socket.LazyOrganizer]) -> None:
+        # workers export and hand the shapes back, so organizers built for showing are not built again for plates
+        pending = [o for o in items if not o.built]
+        specs = [o.spec for o in pending]
+        for result in iter_build(specs, export_dir=export_dirs, with_shapes=True, memory_budget=budget):
+            report(result)
+            if result.shape is not None:
+                pending[result.index].adopt(result.shape)
+
+    if args.show:
+        # organizers are shown in a row along Y, without packing them onto beds
+        build(objs)
+        y = 0.0
+        for o in objs:
+            if o.built:
+                show_object(o.shape.moved(Location((0, y, 0))), name=o.name)
+            y += o.footprint[1] + 10
+
+    if args.plates:
+        # packing only needs the grid footprints, so organizers are built one plate at a time and dropped after it
+        bed = tuple(args.bed)
+        oversized = [o for o in objs if not plate.fits(o, bed)]
+        plates = [
+            (f"plate-{i}", p) for i, p in enumerate(plate.pack([o for o in objs if o not in oversized], bed=bed), 1)
+        ]
+        for o in oversized:
+            print(f"⚠️ {o.name} does not fit a {bed[0]:g}x{bed[1]:g}mm bed, it gets a plate of its own")
+            plates.append((o.name, plate.Plate(o.footprint, [plate.Placement(o, 0, 0)])))
+        for name, p in plates:
+            items = [placement.item for placement in p.placements]
+            build(items)
+            p.placements = [placement for placement in p.placements if placement.item.built]
+            if p.placements:
+                print(f"✅ {p.export(Path('example/plates') / f'{name}.3mf')}")
+            if not args.show:
+                for o in items:
+                    o.release()
+
+    if args.output and not (args.show or args.plates):
+        for result in iter_build([o.spec for o in objs], export_dir=export_dirs, memory_budget=budget):
+            report(result)
@@ -0,0 +1,107 @@
+import time
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+
+import pytest
+from thingsmith import drive_socket as socket
+from thingsmith._transfer import SharedPack, pack, share, unpack
+from thingsmith.batch import build_many, iter_build
+
+SHM = Path("/dev/shm")  # noqa: S108
+
+
+def test_build_many_keeps_order_and_reports_failures():
+    builder = socket.SocketBuilder().drive(socket.DriveSize.QUARTER_INCH)
+    good = socket.OrganizerSpec(
+        sockets=[builder.metric(4).diameter(11.9).build(), builder.metric(5).diameter(11.9).build()],
+        organizer_split_face_plate=2,
+    )
+    bad = socket.OrganizerSpec(sockets=[])
+
+    results = build_many([bad, good], workers=1)
+
+    assert [r.index for r in results] == [0, 1]
+    assert not results[0].ok
+    assert results[1].ok
+    assert results[1].shape is not None
+    base = results[1].shape.children[0]
+    assert [c.label for c in base.children] == ["Base", "Face Plate"]
+    assert base.children[1].color is not None
+    assert "sockets: at least one socket is required" in (results[0].error or "")
+
+
+def test_iter_build_recycles_workers_over_budget():
+    builder = socket.SocketBuilder().drive(socket.DriveSize.QUARTER_INCH)
+    specs = [socket.OrganizerSpec(sockets=[builder.metric(size).diameter(11.9).build()]) for size in (4, 5, 6)]
+    specs.insert(1, socket.OrganizerSpec(sockets=[]))
+
+    # a budget of one byte retires every worker after its first job
+    results = list(iter_build(iter(specs), workers=2, memory_budget=1))
+
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert [r.ok for r in results] == [True, False, True, True]
+    assert all(r.shape is not None for r in results if r.ok)
+
+
+def test_iter_build_exports_per_format_and_keeps_shapes(tmp_path: Path):
+    spec = socket.OrganizerSpec(
+        sockets=[socket.SocketBuilder().drive(socket.DriveSize.QUARTER_INCH).metric(4).diameter(11.9).build()],
+    )
+    dirs = {"stl": tmp_path / "stl", "3mf": tmp_path / "3mf"}
+
+    (result,) = iter_build([spec], workers=1, export_dir=dirs, with_shapes=True)
+
+    assert result.ok
+    assert result.shape is not None
+    assert {f.parent for f in result.files} == set(dirs.values())
+    assert all(f.is_file() for f in result.files)
+
+
+@pytest.mark.skipif(not SHM.is_dir(), reason="shared memory blocks are not listed on this platform")
+def test_closing_iter_build_frees_unread_results():
+    builder = socket.SocketBuilder().drive(socket.DriveSize.QUARTER_INCH)
+    specs = [socket.OrganizerSpec(sockets=[builder.metric(size).diameter(11.9).build()]) for size in (4, 5, 6, 7)]
+    before = set(SHM.iterdir())
+
+    results = iter_build(specs, workers=3)
+    assert next(results).ok
+    results.close()
+
+    assert set(SHM.iterdir()) <= before
+
+
+@pytest.mark.skipif(not SHM.is_dir(), reason="shared memory blocks are not listed on this platform")
+def test_closing_iter_build_does_not_wait_for_running_jobs():
+    builder = socket.SocketBuilder().drive(socket.DriveSize.QUARTER_INCH)
+    fast = socket.OrganizerSpec(sockets=[builder.metric(4).diameter(11.9).build()])
+    slow = socket.OrganizerSpec(sockets=[builder.metric(size).diameter(11.9).build() for size in range(4, 52)])
+    before = set(SHM.iterdir())
+
+    results = iter_build([fast, slow], workers=2)
+    assert next(results).ok
+    start = time.perf_counter()
+    results.close()
+
+    # building the slow organizer takes several times as long
+    assert time.perf_counter() - start < 2  # noqa: PLR2004
+    assert set(SHM.iterdir()) <= before
+
+
+def test_shared_transfer_keeps_assembly():
+    spec = socket.OrganizerSpec(
+        sockets=[socket.SocketBuilder().drive(socket.DriveSize.QUARTER_INCH).metric(4).diameter(11.9).build()],
+        organizer_split_face_plate=2,
+    )
+    organizer = socket.Organizer(spec)
+    shared = share(pack(organizer))
+    assert isinstance(shared, SharedPack)
+
+    copy = unpack(shared)
+
+    # the block is freed once read
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(shared.name)
+    assert [c.label for c in copy.children] == [c.label for c in organizer.children]
+    base, face_plate = copy.children[0].children
+    assert face_plate.color.to_tuple() == pytest.approx(organizer.children[0].children[1].color.to_tuple())
+    assert base.volume == pytest.approx(organizer.children[0].children[0].volume)
@@ -0,0 +1,106 @@
+import subprocess
+import sys
+
+import pytest
+from thingsmith import batch
+from thingsmith.catalog import CatalogError, parse_catalog
+from thingsmith.cli import main
+
+CATALOG = """
+[socket_defaults]
+insert_labels = false
+
+[[socket]]
+drive = "1/4"
+types = ["metric"]
+sizes = [[4, 11.9], [5, 11.9]]
+name = "{name}"
+"""
+
+SECOND = """
+[[socket]]
+drive = "1/4"
+sizes = [[6, 11.9]]
+name = "{name}"
+"""
+
+
+def test_skips_unchanged(tmp_path, capsys):
+    catalog = tmp_path / "catalog.toml"
+    catalog.write_text(CATALOG.format(name="quarter"))
+    out = tmp_path / "out"
+
+    assert main([str(catalog), "-o", str(out), "-j", "1"]) == 0
+    assert (out / "quarter.stl").exists()
+    assert main([str(catalog), "-o", str(out), "-j", "1"]) == 0
+    assert "1 up to date, building 0" in capsys.readouterr().out
+
+    catalog.write_text(CATALOG.format(name="renamed"))
+    assert main([str(catalog), "-o", str(out), "-j", "1"]) == 0
+    assert "0 up to date, building 1" in capsys.readouterr().out
+
+
+def test_interrupted_run_keeps_finished_jobs(tmp_path, capsys, monkeypatch):
+    catalog = tmp_path / "catalog.toml"
+    catalog.write_text(CATALOG.format(name="first") + SECOND.format(name="second"))
+    out = tmp_path / "out"
+    iter_build = batch.iter_build
+
+    def interrupted(*args, **kwargs):
+        yield next(iter_build(*args, **kwargs))
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(batch, "iter_build", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        main([str(catalog), "-o", str(out), "-j", "1"])
+    monkeypatch.undo()
+
+    assert main([str(catalog), "-o", str(out), "-j", "1"]) == 0
+    assert "1 up to date, building 1" in capsys.readouterr().out
+
+
+def test_rejects_clashing_names(tmp_path, capsys):
+    catalog = tmp_path / "catalog.toml"
+    catalog.write_text(CATALOG.format(name="same") + SECOND.format(name="same"))
+
+    assert main([str(catalog), "-o", str(tmp_path / "out")]) == 2  # noqa: PLR2004
+    assert "jobs 0, 1 all export as 'same'" in capsys.readouterr().err
+    assert not (tmp_path / "out").exists()
+
+
+def test_check_names_sockets_without_types(tmp_path, capsys):
+    catalog = tmp_path / "catalog.toml"
+    catalog.write_text('[[socket]]\ndrive = "1/4"\nsizes = [[6, 11.9]]\n')
+
+    assert main([str(catalog), "--check"]) == 0
+    assert "1 of 1 valid" in capsys.readouterr().out
+
+
+def test_malformed_sizes_name_the_entry():
+    with pytest.raises(CatalogError, match=r"wrench\[0\]: invalid sizes"):
+        parse_catalog({"wrench": [{"sizes": ["3/0"]}]})
+    with pytest.raises(CatalogError, match=r"socket\[0\]: sizes must be"):
+        parse_catalog({"socket": [{"drive": "1/4", "sizes": [4, 5]}]})
+
+
+def test_unknown_spec_field():
+    with pytest.raises(CatalogError, match="insert_dpeth"):
+        parse_catalog({"socket": [{"drive": "1/4", "sizes": [[4, 11.9]], "insert_dpeth": 6}]})
+
+
+def test_check_does_not_load_geometry(tmp_path):
+    catalog = tmp_path / "catalog.toml"
+    wrenches = "\n[[wrench]]\nsizes = [8, 13, 14, 15, 17]\n"
+    catalog.write_text(CATALOG.format(name="quarter") + 'face_color = "red"\n' + wrenches)
+    script = (
+        "import sys\n"
+        "from thingsmith.cli import main\n"
+        f"code = main([{str(catalog)!r}, '--check'])\n"
+        "assert 'build123d' not in sys.modules and 'OCP' not in sys.modules\n"
+        "sys.exit(code)\n"
+    )
+
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=False)  # noqa: S603
+
+    assert result.returncode == 0, result.stderr
+    assert "2 of 2 valid" in result.stdout
@@ -0,0 +1,63 @@
+import pytest
+from build123d import Color, Cylinder, Location, Mesher, Part, Pos, import_stl
+from thingsmith.export import ExportPipeline, Quality, export_shape
+
+
+def _assembly() -> Part:
+    base = Cylinder(10, 2)
+    base.label = "Base"
+    label = Pos(30, 0, 0) * Cylinder(10, 2)
+    label.label = "Labels"
+    return Part(children=[base, label], label="assembly")
+
+
+def _triangles(path) -> int:
+    return int.from_bytes(path.read_bytes()[80:84], "little")
+
+
+def test_quality_presets(tmp_path):
+    shape = _assembly()
+    preview = _triangles(export_shape(shape, tmp_path / "preview.stl", "stl", Quality.PREVIEW))
+    archival = _triangles(export_shape(shape, tmp_path / "archival.stl", "stl", Quality.ARCHIVAL))
+
+    assert preview < archival
+
+
+def test_quality_override_per_part(tmp_path):
+    shape = _assembly()
+    preview = _triangles(export_shape(shape, tmp_path / "preview.stl", "stl", Quality.PREVIEW))
+    labels_fine = _triangles(
+        export_shape(shape, tmp_path / "mixed.stl", "stl", Quality.PREVIEW, {"Labels": Quality.ARCHIVAL}),
+    )
+    archival = _triangles(export_shape(shape, tmp_path / "archival.stl", "stl", Quality.ARCHIVAL))
+
+    assert preview < labels_fine < archival
+
+
+def test_export_keeps_assembly_location(tmp_path):
+    shape = _assembly()
+    shape.move(Location((0, 100, 0)))
+    path = export_shape(shape, tmp_path / "moved.stl", "stl", Quality.PREVIEW)
+
+    assert pytest.approx(90, abs=0.5) == import_stl(path).bounding_box().min.Y
+
+
+def test_streamed_3mf(tmp_path):
+    shape = _assembly()
+    shape.children[0].color = Color(0x1F79E5)
+    path = export_shape(shape, tmp_path / "assembly.3mf", "3mf", Quality.PREVIEW)
+
+    parts = Mesher().read(str(path))
+    assert [p.label for p in parts] == ["Base", "Labels"]
+    assert parts[0].color.to_tuple() == pytest.approx(Color(0x1F79E5).to_tuple(), abs=0.01)
+    assert pytest.approx(shape.volume, rel=0.02) == sum(p.volume for p in parts)
+
+
+def test_pipeline_raises_export_errors_on_exit(tmp_path):
+    # the export directory is a file, so writing into it fails in the worker
+    blocked = tmp_path / "blocked"
+    blocked.write_text("")
+
+    pipeline = ExportPipeline(blocked, workers=1, quality=Quality.PREVIEW)
+    with pytest.raises(OSError, match="blocked"), pipeline:
+        pipeline.submit(_assembly())
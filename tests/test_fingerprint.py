@@ -0,0 +1,88 @@
+import subprocess
+import sys
+from fractions import Fraction
+
+import pytest
+from thingsmith import drive_socket as socket, wrench
+from thingsmith._fonts import font_path
+from thingsmith.batch import WrenchSet
+from thingsmith.catalog import job_hash
+from thingsmith.export import Quality
+from thingsmith.fingerprint import Font, canonical, fingerprint
+
+
+def test_equal_values_share_a_fingerprint():
+    sae = wrench.WrenchUnit.SAE
+    assert canonical(wrench.Wrench("3/8", unit=sae)) == canonical(wrench.Wrench(Fraction(3, 8), unit=sae))
+    assert canonical(0.1 + 0.2) == canonical(0.3)
+    assert canonical(-0.0) == canonical(0)
+    assert canonical(socket.SocketType.SAE | socket.SocketType.DEEP) == ("DEEP", "SAE")
+
+
+def test_sizes_that_label_differently_do_not():
+    sae = wrench.WrenchUnit.SAE
+    fraction, decimal = wrench.Wrench("3/8", unit=sae), wrench.Wrench(0.375, unit=sae)
+    assert str(fraction) != str(decimal)
+
+    assert job_hash(WrenchSet([fraction]), ["stl"], Quality.PREVIEW) != job_hash(
+        WrenchSet([decimal]),
+        ["stl"],
+        Quality.PREVIEW,
+    )
+    metric = socket.SocketBuilder().drive(socket.DriveSize.QUARTER_INCH)
+    assert canonical(metric.metric(10).diameter(11.9).build()) != canonical(metric.metric(10.0).diameter(11.9).build())
+
+
+def test_spec_fingerprint():
+    builder = socket.SocketBuilder().drive(socket.DriveSize.QUARTER_INCH)
+    spec = socket.OrganizerSpec(sockets=[builder.metric(4).diameter(11.9).build()])
+    a = fingerprint(spec)
+
+    assert a == fingerprint(socket.OrganizerSpec(sockets=[builder.metric(4).diameter(11.9).build()]))
+    assert hash(a) == hash(fingerprint(spec))
+    assert a.hexdigest() != fingerprint(socket.OrganizerSpec(sockets=spec.sockets, insert_depth=6)).hexdigest()
+    fields = dict(a.value.fields)  # type: ignore[union-attr]
+    assert isinstance(fields["font"], Font)
+
+    with pytest.raises(TypeError):
+        canonical(object())
+
+
+def test_socket_set_spec_fingerprint():
+    builder = socket.SocketBuilder().drive(socket.DriveSize.QUARTER_INCH)
+    sockets = [builder.metric(size).diameter(11.9).build() for size in (4, 5, 6)]
+
+    listed = fingerprint(socket.OrganizerSpec(sockets=sockets))
+    columnar = fingerprint(socket.OrganizerSpec(sockets=socket.SocketSet(sockets)))
+
+    assert listed == columnar
+    assert listed.hexdigest() == columnar.hexdigest()
+
+
+def test_fonts_resolve_like_occ():
+    from OCP.Font import Font_FA_Regular  # noqa: PLC0415
+    from thingsmith._label import _system_font  # noqa: PLC0415
+
+    path = _system_font("DejaVu Sans").FontPath(Font_FA_Regular).ToCString()
+    if "DejaVuSans" not in path:
+        pytest.skip("DejaVu Sans is not installed")
+    assert font_path("dejavu sans") == font_path("DejaVu Sans")
+    assert str(font_path("DejaVu Sans")) == path
+    assert font_path("No Such Font") is None
+
+
+def test_fingerprint_does_not_load_geometry():
+    script = (
+        "import sys\n"
+        "from thingsmith import drive_socket as socket\n"
+        "from thingsmith.catalog import job_hash\n"
+        "from thingsmith._formats import Quality\n"
+        "builder = socket.SocketBuilder().drive(socket.DriveSize.QUARTER_INCH)\n"
+        "spec = socket.OrganizerSpec(sockets=[builder.metric(4).diameter(11.9).build()])\n"
+        "assert job_hash(spec, ['stl'], Quality.PREVIEW)\n"
+        "assert 'build123d' not in sys.modules and 'OCP' not in sys.modules, sorted(sys.modules)\n"
+    )
+
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=False)  # noqa: S603
+
+    assert result.returncode == 0, result.stderr
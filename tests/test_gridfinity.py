@@ -0,0 +1,135 @@
+import subprocess
+import sys
+from collections import Counter
+
+import pytest
+from build123d import import_stl
+from thingsmith._gridfinity import (
+    Block,
+    BlockGrid,
+    OrganizerFrame,
+    block_cache,
+    frame_mesh,
+    grid_cache,
+    grid_mesh,
+)
+from thingsmith.booleans import BooleanStrategy, configure_booleans
+from thingsmith.cache import BrepCache, configure_brep_cache
+from thingsmith.export import Quality, export_mesh
+
+
+def test_block_prototype_is_built_once():
+    block_cache.clear()
+    first = Block()
+    second = Block()
+
+    info = block_cache.info()
+    assert info.misses == 1
+    assert info.hits == 1
+    assert pytest.approx(first.volume) == second.volume
+
+
+def test_grid_cache_resize():
+    grid_cache.clear()
+    BlockGrid(1, 1)
+    grid_cache.resize(0)
+
+    assert len(grid_cache) == 0
+    grid_cache.resize(32)
+
+
+def test_brep_cache_roundtrip(tmp_path):
+    cache = configure_brep_cache(tmp_path)
+    try:
+        grid_cache.clear()
+        built = BlockGrid(1, 1)
+        grid_cache.clear()
+        loaded = BlockGrid(1, 1)
+    finally:
+        configure_brep_cache(None)
+
+    assert cache is not None
+    assert cache.size() > 0
+    assert pytest.approx(loaded.volume) == built.volume
+
+
+def test_brep_cache_evicts_least_recently_used(tmp_path):
+    cache = BrepCache(tmp_path, max_bytes=0)
+    cache.store(BrepCache.key("Block"), Block())
+
+    assert cache.size() == 0
+
+
+def test_glued_grid_matches_fused():
+    grid_cache.clear()
+    fused = BlockGrid(2, 2)
+    configure_booleans(BooleanStrategy(glue=True, fuzzy=1e-5))
+    try:
+        glued = BlockGrid(2, 2)
+    finally:
+        configure_booleans(None)
+
+    assert grid_cache.info().misses == 2  # noqa: PLR2004
+    assert len(glued.solids()) == 1
+    assert len(glued.faces()) == len(fused.faces())
+    assert pytest.approx(fused.volume) == glued.volume
+
+
+def _is_closed(mesh) -> bool:
+    edges = Counter((a, b) for tri in mesh.triangles.tolist() for a, b in zip(tri, tri[1:] + tri[:1], strict=True))
+    return all(count == 1 and edges[b, a] == 1 for (a, b), count in edges.items())
+
+
+@pytest.mark.parametrize("radius", [3, 7.5, 10])
+def test_mesh_matches_brep(radius):
+    grid = grid_mesh(3, 2)
+    frame = frame_mesh(4, 1, radius, 10, Quality.PREVIEW)
+
+    assert _is_closed(grid)
+    assert _is_closed(frame)
+    assert pytest.approx(BlockGrid(3, 2).volume, rel=1e-3) == grid.volume()
+    brep = OrganizerFrame(4, 1, radius, 10)
+    assert pytest.approx(brep.volume, rel=5e-3) == frame.volume()
+    box = brep.bounding_box()
+    assert [*frame.vertices.min(axis=0), *frame.vertices.max(axis=0)] == pytest.approx([*box.min, *box.max])
+
+
+def test_grid_mesh_does_not_load_occ():
+    script = (
+        "import sys\n"
+        "from thingsmith._formats import Quality\n"
+        "from thingsmith._gridfinity import grid_mesh\n"
+        "assert len(grid_mesh(2, 2, Quality.PREVIEW))\n"
+        "assert 'build123d' not in sys.modules and 'OCP' not in sys.modules, sorted(sys.modules)\n"
+    )
+
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=False)  # noqa: S603
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_export_mesh_does_not_load_occ(tmp_path):
+    script = (
+        "import sys\n"
+        "from thingsmith._formats import Quality\n"
+        "from thingsmith._gridfinity import frame_mesh\n"
+        "from thingsmith._writers import export_mesh\n"
+        "mesh = frame_mesh(2, 1, 3, 10, Quality.PREVIEW)\n"
+        f"for fmt in ('stl', '3mf'): export_mesh(mesh, {str(tmp_path / 'f')!r} + '.' + fmt, fmt)\n"
+        "assert 'build123d' not in sys.modules and 'OCP' not in sys.modules, sorted(sys.modules)\n"
+    )
+
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=False)  # noqa: S603
+
+    assert result.returncode == 0, result.stderr
+    assert (tmp_path / "f.stl").stat().st_size > 0
+    assert (tmp_path / "f.3mf").stat().st_size > 0
+
+
+def test_export_mesh(tmp_path):
+    mesh = grid_mesh(1, 1, Quality.PREVIEW)
+    path = export_mesh(mesh, tmp_path / "grid.stl", "stl")
+
+    assert int.from_bytes(path.read_bytes()[80:84], "little") == len(mesh)
+    size = import_stl(path).bounding_box().size
+    assert pytest.approx(BlockGrid(1, 1).bounding_box().size.to_tuple()) == size.to_tuple()
@@ -0,0 +1,22 @@
+import pytest
+from build123d import Align, Compound
+from thingsmith._label import glyph_cache, label_faces
+
+
+def test_label_matches_text_layout():
+    align = (Align.CENTER, Align.MIN)
+    expected = Compound.make_text("7/16", 6, font="Arial", align=align)
+    label = label_faces("7/16", 6, font="Arial", align=align)
+
+    assert pytest.approx(expected.area) == label.area
+    assert pytest.approx(expected.bounding_box().min.X) == label.bounding_box().min.X
+    assert pytest.approx(expected.bounding_box().max.X) == label.bounding_box().max.X
+
+
+def test_labels_share_glyphs():
+    glyph_cache.clear()
+    label_faces("10", 5)
+    label_faces("12", 5)
+
+    # "1" is rendered once and reused by the second label
+    assert glyph_cache.info()[:2] == (1, 3)
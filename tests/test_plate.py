@@ -0,0 +1,77 @@
+import re
+import zipfile
+from dataclasses import dataclass
+from itertools import combinations
+
+import pytest
+from thingsmith import drive_socket as socket
+from thingsmith.export import Quality
+from thingsmith.plate import PlateOverflowError, fits, footprint, pack
+
+
+@dataclass
+class Box:
+    name: str
+    grid_x: int
+    grid_y: int
+
+
+def _bounds(p):
+    w, d = footprint(p.item)
+    if p.rotated:
+        w, d = d, w
+    return p.x, p.y, p.x + w, p.y + d
+
+
+def test_pack_without_overlaps():
+    bed = (256, 256)
+    items = [Box(f"box-{i}", 1 + i % 3, 1 + i % 2) for i in range(20)]
+    plates = pack(items, bed, spacing=2)
+
+    assert sorted(p.item.name for plate in plates for p in plate.placements) == sorted(b.name for b in items)
+    assert all(plate.utilization > 0.5 for plate in plates[:-1])  # noqa: PLR2004
+    for plate in plates:
+        bounds = [_bounds(p) for p in plate.placements]
+        assert all(x0 >= 0 and y0 >= 0 and x1 <= bed[0] and y1 <= bed[1] for x0, y0, x1, y1 in bounds)
+        for a, b in combinations(bounds, 2):
+            assert a[2] + 2 <= b[0] or b[2] + 2 <= a[0] or a[3] + 2 <= b[1] or b[3] + 2 <= a[1]
+
+    with pytest.raises(PlateOverflowError):
+        pack([Box("huge", 7, 1)], bed)
+
+
+def test_oversized_organizer_is_set_aside_before_packing():
+    builder = socket.SocketBuilder().drive(socket.DriveSize.QUARTER_INCH)
+    small = socket.LazyOrganizer(socket.OrganizerSpec(sockets=[builder.metric(4).diameter(11.9).build()]))
+    large = socket.LazyOrganizer(
+        socket.OrganizerSpec(sockets=[builder.metric(size).diameter(14.6).build() for size in range(4, 22)]),
+    )
+    bed = (256, 256)
+
+    assert fits(small, bed)
+    assert not fits(large, bed)
+    # turned by 90°, it fits a bed as deep as it is wide
+    assert fits(large, large.footprint[::-1])
+    with pytest.raises(PlateOverflowError, match=re.escape(large.name)):
+        pack([small, large], bed)
+
+    (plate,) = pack([o for o in (small, large) if fits(o, bed)], bed)
+    assert [p.item for p in plate.placements] == [small]
+    assert not any(o.built for o in (small, large))
+
+
+def test_export_plate(tmp_path):
+    builder = socket.SocketBuilder().drive(socket.DriveSize.QUARTER_INCH)
+    spec = socket.OrganizerSpec(sockets=[builder.metric(10).diameter(14.6).build()], insert_labels=False)
+    organizers = [socket.LazyOrganizer(spec), socket.LazyOrganizer(spec)]
+    (plate,) = pack(organizers, bed=(100, 50), spacing=4)
+
+    assert not any(o.built for o in organizers)
+    path = plate.export(tmp_path / "plate.3mf", Quality.PREVIEW)
+    corners = sorted((c.bounding_box().min.X, c.bounding_box().min.Y) for c in plate.assembly().children)
+    assert [c for corner in corners for c in corner] == pytest.approx([0, 0, 42 + 4, 0], abs=0.01)
+
+    # both organizers reference the same base mesh through component transforms
+    model = zipfile.ZipFile(path).read("3D/3dmodel.model").decode()
+    assert model.count("<item ") == model.count("<component ") == len(organizers)
+    assert model.count("<mesh>") == 1
@@ -0,0 +1,53 @@
+import json
+import time
+from pathlib import Path
+
+import pytest
+from thingsmith import profiling
+from thingsmith._gridfinity import Block, block_cache
+from thingsmith.profiling import Recorder, span
+
+
+def test_recorder_collects_spans(tmp_path):
+    block_cache.clear()
+    with Recorder() as rec, span("outer", kind="test"):
+        Block()
+
+    assert [(s.name, s.depth) for s in rec.spans] == [("gridfinity.block", 1), ("outer", 0)]
+    assert rec.spans[1].wall >= rec.spans[0].wall > 0
+    assert rec.spans[1].attrs == {"kind": "test"}
+    if Path("/proc/self/statm").exists():
+        # current, not peak, memory: both ends of every span are actual readings
+        assert all(s.rss > 0 and s.rss - s.rss_delta > 0 for s in rec.spans)
+        assert all(s.rss_peak >= max(s.rss, s.rss - s.rss_delta) for s in rec.spans)
+
+    trace = json.loads(rec.write_chrome_trace(tmp_path / "trace.json").read_text())
+    assert [e["name"] for e in trace["traceEvents"]] == ["gridfinity.block", "outer"]
+
+
+@pytest.mark.skipif(not Path("/proc/self/statm").exists(), reason="resident memory cannot be read on this platform")
+def test_peak_includes_memory_freed_within_the_span():
+    size = 64 * 2**20
+    with Recorder(sample_interval=0.001) as rec, span("spike"):
+        # bytes filled with ones touch every page, unlike zeroed memory
+        spike = b"\x01" * size
+        time.sleep(0.05)
+        del spike
+
+    (s,) = rec.spans
+    assert s.rss_peak - s.rss >= size // 2
+
+
+def test_memory_is_none_where_it_cannot_be_read(monkeypatch):
+    monkeypatch.setattr(profiling, "_rss", lambda: None)
+    with Recorder() as rec, span("outer"), span("inner"):
+        pass
+
+    assert [(s.rss, s.rss_delta, s.rss_peak) for s in rec.spans] == [(None, None, None)] * 2
+
+
+def test_spans_are_ignored_without_recorder():
+    rec = Recorder()
+    with span("ignored"):
+        pass
+    assert rec.spans == []
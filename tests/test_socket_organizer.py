@@ -1,6 +1,11 @@
+import dataclasses
+
 import pytest
 from build123d import Axis
 from thingsmith import drive_socket as socket
+from thingsmith._layout import socket_layout
+from thingsmith._parts import part_cache
+from thingsmith.drive_socket._cutter import cutter_cache
 
 
 @pytest.fixture
@@ -50,3 +55,99 @@ def test_align_center(sockets):
     last_insert = wires[-1]
 
     assert pytest.approx(last_insert.center().Y) == first_insert.center().Y
+
+
+def test_insert_cutters_shared_by_diameter(sockets):
+    cutter_cache.clear()
+    part_cache.clear()
+    socket.Organizer(socket.OrganizerSpec(sockets=sockets, insert_labels=False))
+
+    assert cutter_cache.info().misses == len({s.diameter_mm for s in sockets})
+
+
+def test_layout_matches_geometry(sockets):
+    spec = socket.OrganizerSpec(sockets=sockets, insert_labels=False, insert_chamfer=False)
+    o = socket.Organizer(spec)
+    face = o.faces().sort_by(Axis.Z)[-1]
+    centers = [w.bounding_box().center() for w in face.inner_wires().sort_by(Axis.X)]
+
+    layout = socket_layout(spec)
+    assert pytest.approx(face.center().Z) == layout.top
+    for insert, center in zip(layout.inserts, centers, strict=True):
+        assert pytest.approx(tuple(center)) == insert.center
+
+
+def test_validate(sockets):
+    assert socket.OrganizerSpec(sockets=sockets).validate() == []
+
+    spec = socket.OrganizerSpec(
+        sockets=sockets,
+        insert_depth=20,
+        organizer_label="Metric",
+        organizer_label_padding=(5, 10),
+    )
+    fields = {e.field for e in spec.validate()}
+    assert fields == {"insert_depth", "organizer_label"}
+
+    assert [e.field for e in socket.OrganizerSpec(sockets=[]).validate()] == ["sockets"]
+
+
+def test_partition(sockets):
+    half_inch = socket.SocketBuilder().drive(socket.DriveSize.HALF_INCH).metric(10).diameter(17.2).build()
+    specs = socket.partition([half_inch, *reversed(sockets)], max_grid_x=2)
+
+    assert [s.sockets for s in specs] == [[half_inch], sockets[:5], sockets[5:7], sockets[7:]]
+    assert [s.grid_x for s in specs] == [1, 2, 1, 2]
+    assert all(s.validate() == [] for s in specs)
+
+
+def test_lazy_organizer(sockets, tmp_path):
+    spec = socket.OrganizerSpec(sockets=sockets, insert_labels=False)
+    lazy = socket.LazyOrganizer(spec)
+
+    assert not lazy.built
+    assert (lazy.grid_x, lazy.grid_y) == (spec.grid_x, spec.grid_y)
+    assert lazy.files(tmp_path) == [tmp_path / f"{lazy.name}.stl"]
+
+    assert lazy.shape.name == lazy.name
+    assert lazy.built
+    assert pytest.approx(lazy.shape.bounding_box().size.X) == lazy.footprint[0]
+
+
+def test_incremental_rebuild(sockets):
+    part_cache.clear()
+    spec = socket.OrganizerSpec(sockets=sockets, organizer_label="Metric")
+    first = socket.Organizer(spec)
+    built = part_cache.info().misses
+
+    # only the face label is rebuilt, and the reused children keep their names and colors
+    second = socket.Organizer(dataclasses.replace(spec, organizer_label="Metric 1/4"))
+    assert part_cache.info().misses == built + 1
+    assert [c.label for c in second.children] == [c.label for c in first.children]
+    assert [str(c.color) for c in second.children] == [str(c.color) for c in first.children]
+    assert pytest.approx(second.children[0].volume) == first.children[0].volume
+
+
+def test_socket_set(sockets):
+    spec = socket.OrganizerSpec(sockets=sockets)
+    assert spec.socket_set is spec.socket_set
+    assert pytest.approx(spec.socket_set.diameter_total) == sum(s.diameter_mm for s in sockets)
+
+    grid_x = spec.socket_set.run_grid_x(spec, max_grid_x=3)
+    for i, j in [(0, 1), (0, 4), (3, 7), (9, 10)]:
+        run_grid_x = dataclasses.replace(spec, sockets=sockets[i:j]).grid_x
+        assert grid_x[i, j - i - 1] == (run_grid_x if run_grid_x <= 3 else 4)  # noqa: PLR2004
+    # runs past the last socket are marked as not fitting
+    assert grid_x[9, 1:].tolist() == [4] * (grid_x.shape[1] - 1)
+    assert spec.socket_set.has_type(socket.SocketType.METRIC).all()
+
+
+def test_socket_set_follows_modified_sockets(sockets):
+    for spec in (socket.OrganizerSpec(sockets=sockets), socket.OrganizerSpec(sockets=socket.SocketSet(sockets))):
+        grid_x = spec.grid_x
+        spec.sockets[0].diameter_mm += 60
+        try:
+            assert spec.grid_x > grid_x
+            assert pytest.approx(spec.socket_set.diameter_total) == sum(s.diameter_mm for s in sockets)
+        finally:
+            spec.sockets[0].diameter_mm -= 60
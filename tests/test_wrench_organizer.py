@@ -0,0 +1,19 @@
+from thingsmith import wrench
+
+
+def test_validate():
+    spec = wrench.OrganizerSpec()
+    assert spec.validate([wrench.Wrench(s) for s in (8, 13, 14, 15, 17)]) == []
+
+    # the inserts for small wrenches end below the top face
+    errors = spec.validate([wrench.Wrench(8), wrench.Wrench(10)])
+    assert [(e.field, e.index) for e in errors] == [("wrench_set", 0), ("wrench_set", 1)]
+
+
+def test_lazy_organizer():
+    wrenches = [wrench.Wrench(s) for s in (19, 22, 24)]
+    lazy = wrench.LazyOrganizer(wrenches)
+
+    assert not lazy.built
+    assert lazy.name == lazy.shape.name
+    assert lazy.footprint == (84, 84)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache[K: Hashable, V]:
+    """
+    Process-wide least-recently-used cache for built geometry.
+
+    Unlike `functools.lru_cache`, the cache can be resized at runtime and is keyed explicitly, so callers
+    decide which parameters identify a primitive.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self._maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: K, build: Callable[[], V]) -> V:
+        """Return the cached value for `key`, calling `build` to create it on a miss."""
+        with self._lock:
+            if key in self._data:
+                self._hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+            self._misses += 1
+
+        value = build()
+        with self._lock:
+            if self._maxsize > 0:
+                self._data[key] = value
+                self._data.move_to_end(key)
+                self._evict()
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def resize(self, maxsize: int) -> None:
+        """Change the maximum number of entries, evicting the least recently used ones if needed."""
+        if maxsize < 0:
+            msg = f"maxsize must be >= 0, got {maxsize}"
+            raise ValueError(msg)
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._data))
+
+    def _evict(self) -> None:
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
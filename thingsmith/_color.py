@@ -0,0 +1,31 @@
+"""Colors of specs, given without importing build123d."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from build123d import Color
+
+type ColorLike = Color | int | str | tuple[float, ...]
+"""A build123d `Color`, a 0xRRGGBB integer, a color name, or an RGB or RGBA tuple of values from 0 to 1."""
+
+
+def rgba(color: ColorLike) -> tuple[float, float, float, float]:
+    """Return `color` as red, green, blue and alpha from 0 to 1; only color names need build123d."""
+    if isinstance(color, int):
+        return ((color >> 16) & 0xFF) / 255, ((color >> 8) & 0xFF) / 255, (color & 0xFF) / 255, 1.0
+    if isinstance(color, tuple):
+        red, green, blue, *alpha = color
+        return red, green, blue, alpha[0] if alpha else 1.0
+    return to_color(color).to_tuple()
+
+
+def to_color(color: ColorLike) -> Color:
+    from build123d import Color  # noqa: PLC0415
+
+    if isinstance(color, Color):
+        return color
+    if isinstance(color, str):
+        return Color(color)
+    return Color(*rgba(color))
@@ -0,0 +1,104 @@
+"""
+Font names and the files they resolve to, without loading OCC.
+
+Fonts are looked up by the family names stored in the files of the system font directories, so fingerprinting a
+spec can hash its font without importing build123d. A font that is not installed resolves to no file; labels
+then use the fallback font OCC picks.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+DEFAULT_FONT = "Arial"
+
+_SUFFIXES = {".ttf", ".otf", ".ttc", ".otc"}
+_REGULAR = {"regular", "book", "normal", "roman"}
+
+
+def _font_dirs() -> list[Path]:
+    home = Path.home()
+    if sys.platform == "win32":
+        windir = Path(os.environ.get("WINDIR", "C:/Windows"))
+        return [windir / "Fonts", Path(os.environ.get("LOCALAPPDATA", home)) / "Microsoft/Windows/Fonts"]
+    if sys.platform == "darwin":
+        return [Path("/System/Library/Fonts"), Path("/Library/Fonts"), home / "Library/Fonts"]
+    return [Path("/usr/share/fonts"), Path("/usr/local/share/fonts"), home / ".fonts", home / ".local/share/fonts"]
+
+
+def _decode(platform: int, raw: bytes) -> str:
+    # Mac Roman for the Macintosh platform, UTF-16 for Unicode and Windows
+    return raw.decode("mac_roman" if platform == 1 else "utf-16-be", errors="replace")
+
+
+def _face_names(data: bytes, offset: int) -> tuple[set[str], set[str]]:
+    """Return the family and style names of the font whose table directory starts at `offset`."""
+    (num_tables,) = struct.unpack_from(">H", data, offset + 4)
+    for i in range(num_tables):
+        tag, _, table, _ = struct.unpack_from(">4sIII", data, offset + 12 + 16 * i)
+        if tag == b"name":
+            break
+    else:
+        return set(), set()
+
+    _, count, strings = struct.unpack_from(">HHH", data, table)
+    families: set[str] = set()
+    styles: set[str] = set()
+    for i in range(count):
+        platform, _, _, name_id, length, start = struct.unpack_from(">HHHHHH", data, table + 6 + 12 * i)
+        if name_id not in (1, 2, 16, 17):
+            continue
+        value = _decode(platform, data[table + strings + start : table + strings + start + length]).strip().lower()
+        # 1 and 16 are the family and typographic family, 2 and 17 their style
+        (families if name_id in (1, 16) else styles).add(value)
+    return families, styles
+
+
+def _faces(path: Path) -> Iterator[tuple[set[str], set[str]]]:
+    data = path.read_bytes()
+    if data[:4] == b"ttcf":
+        (count,) = struct.unpack_from(">I", data, 8)
+        offsets = struct.unpack_from(f">{count}I", data, 12)
+    else:
+        offsets = (0,)
+    for offset in offsets:
+        yield _face_names(data, offset)
+
+
+@functools.cache
+def _index() -> dict[str, list[tuple[bool, Path]]]:
+    """Map lowercase family names to the font files of that family, and whether each is a regular face."""
+    index: dict[str, list[tuple[bool, Path]]] = {}
+    for directory in _font_dirs():
+        if not directory.is_dir():
+            continue
+        for path in sorted(directory.rglob("*")):
+            if path.suffix.lower() not in _SUFFIXES:
+                continue
+            try:
+                faces = list(_faces(path))
+            except (OSError, struct.error):
+                continue
+            for families, styles in faces:
+                regular = bool(styles & _REGULAR)
+                for family in families:
+                    index.setdefault(family, []).append((regular, path))
+    return index
+
+
+@functools.cache
+def font_path(font: str) -> Path | None:
+    """Return the file of the regular face of `font`, or None if it is not installed."""
+    files = _index().get(font.strip().lower())
+    if not files:
+        return None
+    # a regular face first, otherwise the first file found
+    return next((path for regular, path in files if regular), files[0][1])
@@ -0,0 +1,27 @@
+"""Export formats and tessellation qualities, re-exported by `thingsmith.export`."""
+
+from enum import Enum
+from typing import Literal
+
+type ExportFormat = Literal["stl", "3mf"]
+
+
+class Quality(Enum):
+    """
+    Named tessellation settings as (linear, angular) deflection.
+
+    As in build123d, the linear deflection is relative to the size of each edge and the angular deflection
+    is in radians.
+    """
+
+    PREVIEW = (0.02, 0.5)
+    PRINT = (0.005, 0.2)
+    ARCHIVAL = (0.001, 0.1)
+
+    @property
+    def linear_deflection(self) -> float:
+        return self.value[0]
+
+    @property
+    def angular_deflection(self) -> float:
+        return self.value[1]
@@ -1,11 +1,37 @@
-from thingsmith._gridfinity.block import Block, BlockGrid, num_grid_for_mm
-from thingsmith._gridfinity.organizer import OrganizerFrame
-from thingsmith._gridfinity.spec import GF
+from typing import TYPE_CHECKING
+
+from thingsmith._gridfinity.spec import GF, num_grid_for_mm
+from thingsmith._imports import lazy_attributes
+
+if TYPE_CHECKING:
+    from thingsmith._gridfinity.block import Block, BlockGrid, block_cache, block_prototype, grid_cache
+    from thingsmith._gridfinity.mesh import frame_mesh, grid_mesh
+    from thingsmith._gridfinity.organizer import OrganizerFrame
 
 __all__ = [
     "GF",
     "Block",
     "BlockGrid",
     "OrganizerFrame",
+    "block_cache",
+    "block_prototype",
+    "frame_mesh",
+    "grid_cache",
+    "grid_mesh",
     "num_grid_for_mm",
 ]
+
+# the geometry modules import build123d, so they are loaded on first use
+__getattr__ = lazy_attributes(
+    __name__,
+    {
+        "Block": "thingsmith._gridfinity.block",
+        "BlockGrid": "thingsmith._gridfinity.block",
+        "OrganizerFrame": "thingsmith._gridfinity.organizer",
+        "block_cache": "thingsmith._gridfinity.block",
+        "block_prototype": "thingsmith._gridfinity.block",
+        "frame_mesh": "thingsmith._gridfinity.mesh",
+        "grid_cache": "thingsmith._gridfinity.block",
+        "grid_mesh": "thingsmith._gridfinity.mesh",
+    },
+)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from math import ceil
+import copy
 
 from build123d import (
     Align,
@@ -12,21 +12,62 @@ from build123d import (
     Location,
     Locations,
     Mode,
+    Part,
     Plane,
     Rectangle,
     RectangleRounded,
     RotationLike,
+    add,
     extrude,
     make_face,
     sweep,
 )
 
-from thingsmith._gridfinity.profile import BaseplateSections, Profile
-from thingsmith._gridfinity.spec import GF
+from thingsmith._cache import LRUCache
+from thingsmith._gridfinity.profile import Profile
+from thingsmith._gridfinity.spec import GF, BaseplateSections, ProfileSections
+from thingsmith.booleans import BooleanStrategy, boolean_strategy, fuse
+from thingsmith.cache import cached_part
+from thingsmith.profiling import traced
 
+block_cache: LRUCache[tuple[ProfileSections, tuple[tuple[str, float], ...]], Part | None] = LRUCache(maxsize=8)
+"""Prototype block solids, keyed by profile sections and `GF` constants."""
 
-def num_grid_for_mm(length_mm: float) -> int:
-    return ceil(length_mm / GF.GRID_UNIT)
+
+@traced("gridfinity.block")
+def _build_block(sections: ProfileSections) -> Part | None:
+    with BuildPart() as part:
+        with BuildSketch(Plane.XZ) as profile, Locations((-GF.GRID_UNIT / 2, 0)):
+            Profile(sections)
+
+        with BuildSketch() as grid:
+            RectangleRounded(GF.GRID_UNIT, GF.GRID_UNIT,
+                             GF.BLOCK_OUTER_RADIUS)
+        extrude(amount=sections.total_height)
+
+        path = grid.wires().sort_by(Axis.Z)[-1]
+        sweep(sections=profile.sketch, path=path, mode=Mode.SUBTRACT)
+
+        with BuildSketch(part.faces().sort_by(Axis.Z)[-1]):
+            Rectangle(GF.GRID_UNIT, GF.GRID_UNIT)
+        extrude(amount=GF.HEIGHT_UNIT - sections.total_height)
+    return part.part
+
+
+def block_prototype(sections: ProfileSections | None = None) -> Part | None:
+    """
+    Return a copy of the cached block solid for `sections`.
+
+    The solid is built once per parameter set, which saves the sweep, not memory: callers get an independent
+    deep copy that shares no geometry with the cache, because booleans may attach new data (e.g. p-curves) to
+    the edges of their arguments, and the cached solid must stay untouched. Only the located copies of one
+    returned solid, such as the blocks fused into one grid, share its geometry.
+    """
+    sections = sections or BaseplateSections()
+    prototype = block_cache.get((sections, GF.values()), lambda: _build_block(sections))
+    if prototype is None:
+        return None
+    return copy.deepcopy(prototype)
 
 
 class Block(BasePartObject):
@@ -36,26 +77,51 @@ class Block(BasePartObject):
         align: Align | tuple[Align, Align, Align] | None = None,
         mode: Mode = Mode.ADD,
     ) -> None:
-        sections = BaseplateSections()
-        with BuildPart() as part:
-            with BuildSketch(Plane.XZ) as profile, Locations((-GF.GRID_UNIT / 2, 0)):
-                Profile(sections)
+        part = block_prototype()
+        if part is None:
+            return
+        super().__init__(part, rotation, align, mode)
 
-            with BuildSketch() as grid:
-                RectangleRounded(GF.GRID_UNIT, GF.GRID_UNIT,
-                                 GF.BLOCK_OUTER_RADIUS)
-            extrude(amount=sections.total_height)
 
-            path = grid.wires().sort_by(Axis.Z)[-1]
-            sweep(sections=profile.sketch, path=path, mode=Mode.SUBTRACT)
+grid_cache: LRUCache[
+    tuple[int, int, tuple[tuple[str, float], ...], BooleanStrategy],
+    tuple[Part, Face] | None,
+] = LRUCache(maxsize=32)
+"""Fused block grids and their top build surface, keyed by grid size, `GF` constants and boolean strategy."""
 
-            with BuildSketch(part.faces().sort_by(Axis.Z)[-1]):
-                Rectangle(GF.GRID_UNIT, GF.GRID_UNIT)
-            extrude(amount=GF.HEIGHT_UNIT - sections.total_height)
 
-        if part.part is None:
-            return
-        super().__init__(part.part, rotation, align, mode)
+@traced("gridfinity.grid")
+def _build_grid_part(x: int, y: int) -> Part | None:
+    block = block_prototype()
+    if block is None:
+        return None
+    locations: list[Location] = []
+    for row in range(x):
+        locations.extend(
+            [Location((row * GF.GRID_UNIT, col * GF.GRID_UNIT)) for col in range(y)])
+
+    with BuildPart() as part:
+        # all blocks in one fuse; neighbors only share faces
+        add(fuse([block.moved(loc) for loc in locations], touching=True))
+
+        top_face = part.faces().sort_by(Axis.Z)[-1]
+        with BuildPart(top_face, mode=Mode.SUBTRACT):
+            with BuildSketch():
+                outer = top_face.outer_wire()
+                inner = outer.fillet_2d(
+                    GF.BLOCK_OUTER_RADIUS, outer.vertices())
+                make_face(outer.edges())
+                make_face(inner.edges(), mode=Mode.SUBTRACT)
+            extrude(amount=GF.HEIGHT_UNIT)
+
+    return part.part
+
+
+def _build_grid(x: int, y: int) -> tuple[Part, Face] | None:
+    part = cached_part("BlockGrid", {"x": x, "y": y, "booleans": boolean_strategy()}, lambda: _build_grid_part(x, y))
+    if part is None:
+        return None
+    return part, part.faces().sort_by(Axis.Z)[-1]
 
 
 class BlockGrid(BasePartObject):
@@ -67,29 +133,12 @@ class BlockGrid(BasePartObject):
         align: Align | tuple[Align, Align, Align] | None = None,
         mode: Mode = Mode.ADD,
     ) -> None:
-        locations: list[Location] = []
-        for row in range(x):
-            locations.extend(
-                [Location((row * GF.GRID_UNIT, col * GF.GRID_UNIT)) for col in range(y)])
-
-        with BuildPart() as part:
-            with Locations(locations):
-                Block()
-
-            top_face = part.faces().sort_by(Axis.Z)[-1]
-            with BuildPart(top_face, mode=Mode.SUBTRACT):
-                with BuildSketch():
-                    outer = top_face.outer_wire()
-                    inner = outer.fillet_2d(
-                        GF.BLOCK_OUTER_RADIUS, outer.vertices())
-                    make_face(outer.edges())
-                    make_face(inner.edges(), mode=Mode.SUBTRACT)
-                extrude(amount=GF.HEIGHT_UNIT)
-
-        if part.part is None:
+        cached = grid_cache.get((x, y, GF.values(), boolean_strategy()), lambda: _build_grid(x, y))
+        if cached is None:
             return
-        self._build_surface = part.faces().sort_by(Axis.Z)[-1]
-        super().__init__(part.part, rotation, align, mode)
+        part, build_surface = copy.deepcopy(cached)
+        self._build_surface = build_surface
+        super().__init__(part, rotation, align, mode)
 
     def build_surface(self) -> Face:
         return self._build_surface
@@ -0,0 +1,268 @@
+"""
+Gridfinity bases as triangle meshes, computed with NumPy instead of BREP booleans and tessellation.
+
+The base of a block is a stack of rounded rectangles, inset by the baseplate profile, and the upper part of
+a grid is one rounded rectangle, so every face is a ruled strip between two outlines or a flat cap. Outlines
+share their vertices where faces meet, which keeps the meshes watertight. Corner arcs are split by the
+angular deflection of the quality, as when meshing the solids.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from itertools import pairwise
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from thingsmith._formats import Quality
+from thingsmith._gridfinity.spec import GF, BaseplateSections
+from thingsmith._mesh import Mesh
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from thingsmith._gridfinity.spec import ProfileSections
+
+# breaks closer than this to the end of an edge are dropped, as they coincide with the arc end
+_EPSILON = 1e-9
+
+
+@dataclass(frozen=True)
+class _Outline:
+    """
+    Rounded rectangle with corners from (x0, y0) to (x1, y1), traced counter-clockwise.
+
+    The outline starts with the bottom right arc. Straight edges get extra vertices at `breaks_x` and
+    `breaks_y`, so faces meeting them there share their vertices.
+    """
+
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+    radius: float
+    breaks_x: tuple[float, ...] = ()
+    breaks_y: tuple[float, ...] = ()
+
+    @property
+    def arc_ends_x(self) -> tuple[float, float]:
+        return self.x0 + self.radius, self.x1 - self.radius
+
+    @property
+    def arc_ends_y(self) -> tuple[float, float]:
+        return self.y0 + self.radius, self.y1 - self.radius
+
+    def points(self, segments: int) -> tuple[np.ndarray, np.ndarray, list[slice]]:
+        """
+        Return the (k, 2) points, a key per point and the slice of each corner arc.
+
+        Keys grow along the outline as 2 * corner + fraction of the arc, and 2 * corner + 1 + fraction of the
+        edge after it, so points of outlines with the same corners can be matched up.
+        """
+        r = self.radius
+        (ax0, ax1), (ay0, ay1) = self.arc_ends_x, self.arc_ends_y
+        centers = ((ax1, ay0), (ax1, ay1), (ax0, ay1), (ax0, ay0))
+        # the straight edge after each corner, as the span it runs over and the point at a position on it
+        edges = (
+            (ay0, ay1, self.breaks_y, lambda t: (self.x1, t)),
+            (ax1, ax0, self.breaks_x, lambda t: (t, self.y1)),
+            (ay1, ay0, self.breaks_y, lambda t: (self.x0, t)),
+            (ax0, ax1, self.breaks_x, lambda t: (t, self.y0)),
+        )
+        fractions = np.linspace(0, 1, segments + 1)
+        points: list[tuple[float, float]] = []
+        keys: list[float] = []
+        arcs = []
+        for k, ((cx, cy), (start, end, breaks, at)) in enumerate(zip(centers, edges, strict=True)):
+            angles = (k - 1 + fractions) * math.pi / 2
+            arcs.append(slice(len(keys), len(keys) + segments + 1))
+            points.extend(zip(cx + r * np.cos(angles), cy + r * np.sin(angles), strict=True))
+            keys.extend(2 * k + fractions)
+            inner = sorted(t for t in breaks if min(start, end) + _EPSILON < t < max(start, end) - _EPSILON)
+            for t in inner if start < end else inner[::-1]:
+                points.append(at(t))
+                keys.append(2 * k + 1 + (t - start) / (end - start))
+        return np.array(points), np.array(keys), arcs
+
+
+@dataclass(frozen=True)
+class _Loop:
+    indices: np.ndarray
+    keys: np.ndarray
+    arcs: list[slice]
+
+    def arc(self, corner: int) -> np.ndarray:
+        return self.indices[self.arcs[corner]]
+
+
+class _Builder:
+    def __init__(self, segments: int) -> None:
+        self.segments = segments
+        self.vertices: list[np.ndarray] = []
+        self.triangles: list[tuple[int, int, int]] = []
+        self._count = 0
+
+    def _add(self, points: np.ndarray) -> np.ndarray:
+        self.vertices.append(points)
+        indices = np.arange(self._count, self._count + len(points))
+        self._count += len(points)
+        return indices
+
+    def point(self, x: float, y: float, z: float) -> int:
+        return int(self._add(np.array([[x, y, z]]))[0])
+
+    def loop(self, outline: _Outline, z: float) -> _Loop:
+        points, keys, arcs = outline.points(self.segments)
+        return _Loop(self._add(np.column_stack((points, np.full(len(points), z)))), keys, arcs)
+
+    def wall(self, lower: _Loop, upper: _Loop) -> None:
+        """Join two loops by triangles facing outward, advancing along whichever loop is behind."""
+        lo, hi = [*lower.indices, lower.indices[0]], [*upper.indices, upper.indices[0]]
+        lo_keys, hi_keys = [*lower.keys, 8.0], [*upper.keys, 8.0]
+        i = j = 0
+        while i < len(lower.indices) or j < len(upper.indices):
+            if j == len(upper.indices) or (i < len(lower.indices) and lo_keys[i + 1] <= hi_keys[j + 1]):
+                self.triangles.append((lo[i], lo[i + 1], hi[j]))
+                i += 1
+            else:
+                self.triangles.append((lo[i], hi[j + 1], hi[j]))
+                j += 1
+
+    def cap(self, loop: _Loop, center: tuple[float, float, float], *, up: bool) -> None:
+        apex = self.point(*center)
+        for a, b in pairwise([*loop.indices, loop.indices[0]]):
+            self.triangles.append((apex, a, b) if up else (apex, b, a))
+
+    def fan(self, apex: int, arc: Iterable[int]) -> None:
+        self.triangles.extend((apex, a, b) for a, b in pairwise(arc))
+
+    def strip(self, inner: np.ndarray, outer: np.ndarray) -> None:
+        for (a0, a1), (b0, b1) in zip(pairwise(inner), pairwise(outer), strict=True):
+            self.triangles.extend([(a0, a1, b0), (a1, b1, b0)])
+
+    def mesh(self) -> Mesh:
+        return Mesh(np.concatenate(self.vertices), np.array(self.triangles, dtype=np.int64)).merged()
+
+
+def _segments(quality: Quality) -> int:
+    return max(1, math.ceil(math.pi / 2 / quality.angular_deflection))
+
+
+def _cells(builder: _Builder, x: int, y: int, sections: ProfileSections) -> dict[tuple[int, int], _Loop]:
+    """Add the profiled bottom of every block and return the loop at the top of each."""
+    half = GF.GRID_UNIT / 2
+    # (height, inset) of each outline of the profile, from the bottom up
+    levels = [
+        (0.0, sections.bottom + sections.top),
+        (sections.bottom, sections.top),
+        (sections.bottom + sections.middle, sections.top),
+        (sections.total_height, 0.0),
+    ]
+    tops = {}
+    for i in range(x):
+        for j in range(y):
+            cx, cy = i * GF.GRID_UNIT, j * GF.GRID_UNIT
+            loops = [
+                builder.loop(
+                    _Outline(cx - half + s, cy - half + s, cx + half - s, cy + half - s, GF.BLOCK_OUTER_RADIUS - s),
+                    z,
+                )
+                for z, s in levels
+            ]
+            builder.cap(loops[0], (cx, cy, 0.0), up=False)
+            for lower, upper in pairwise(loops):
+                builder.wall(lower, upper)
+            tops[i, j] = loops[-1]
+    return tops
+
+
+def _gaps(builder: _Builder, tops: dict[tuple[int, int], _Loop], x: int, y: int, z: float) -> None:
+    """Close the gaps between the tops of neighboring blocks, around each point where their corners meet."""
+    half = GF.GRID_UNIT / 2
+    for i in range(-1, x):
+        for j in range(-1, y):
+            # the block on each side of the point, and its corner facing it
+            around = [((i, j), 1), ((i + 1, j), 2), ((i + 1, j + 1), 3), ((i, j + 1), 0)]
+            arcs = [tops[cell].arc(corner) for cell, corner in around if cell in tops]
+            if len(arcs) < 2:  # noqa: PLR2004
+                continue
+            apex = builder.point(i * GF.GRID_UNIT + half, j * GF.GRID_UNIT + half, z)
+            for arc in arcs:
+                builder.fan(apex, arc)
+
+
+def _grid_breaks(count: int) -> tuple[float, ...]:
+    """Positions along one side of the grid where block tops end and meet."""
+    half = GF.GRID_UNIT / 2
+    inset = half - GF.BLOCK_OUTER_RADIUS
+    breaks = [i * GF.GRID_UNIT + offset for i in range(count) for offset in (-inset, inset)]
+    breaks += [i * GF.GRID_UNIT + half for i in range(count - 1)]
+    return tuple(breaks)
+
+
+def _grid_outline(
+    x: int,
+    y: int,
+    radius: float,
+    breaks_x: tuple[float, ...] = (),
+    breaks_y: tuple[float, ...] = (),
+) -> _Outline:
+    half = GF.GRID_UNIT / 2
+    return _Outline(
+        -half,
+        -half,
+        (x - 1) * GF.GRID_UNIT + half,
+        (y - 1) * GF.GRID_UNIT + half,
+        radius,
+        breaks_x,
+        breaks_y,
+    )
+
+
+def _build_grid(builder: _Builder, x: int, y: int, sections: ProfileSections, top_radius: float) -> _Loop:
+    """
+    Add a block grid without its top face and return the loop around its top.
+
+    The loop has breaks where the arcs of a part with corners of `top_radius` on top of the grid end.
+    """
+    tops = _cells(builder, x, y, sections)
+    _gaps(builder, tops, x, y, sections.total_height)
+    lower = builder.loop(
+        _grid_outline(x, y, GF.BLOCK_OUTER_RADIUS, _grid_breaks(x), _grid_breaks(y)),
+        sections.total_height,
+    )
+    above = _grid_outline(x, y, top_radius)
+    upper = builder.loop(
+        _grid_outline(x, y, GF.BLOCK_OUTER_RADIUS, above.arc_ends_x, above.arc_ends_y),
+        GF.HEIGHT_UNIT,
+    )
+    builder.wall(lower, upper)
+    return upper
+
+
+def grid_mesh(x: int, y: int, quality: Quality = Quality.ARCHIVAL, sections: ProfileSections | None = None) -> Mesh:
+    """Return the mesh of `BlockGrid(x, y)`, in the same position."""
+    builder = _Builder(_segments(quality))
+    top = _build_grid(builder, x, y, sections or BaseplateSections(), GF.BLOCK_OUTER_RADIUS)
+    half = GF.GRID_UNIT / 2
+    builder.cap(top, ((x - 1) * half, (y - 1) * half, GF.HEIGHT_UNIT), up=True)
+    return builder.mesh()
+
+
+def frame_mesh(grid_x: int, grid_y: int, radius: float, height: float, quality: Quality = Quality.ARCHIVAL) -> Mesh:
+    """Return the mesh of `OrganizerFrame(grid_x, grid_y, radius, height)`, in the same position."""
+    builder = _Builder(_segments(quality))
+    grid_top = _build_grid(builder, grid_x, grid_y, BaseplateSections(), radius)
+    grid = _grid_outline(grid_x, grid_y, GF.BLOCK_OUTER_RADIUS)
+    lower = builder.loop(_grid_outline(grid_x, grid_y, radius, grid.arc_ends_x, grid.arc_ends_y), GF.HEIGHT_UNIT)
+    upper = builder.loop(_grid_outline(grid_x, grid_y, radius), GF.HEIGHT_UNIT + height)
+    builder.wall(lower, upper)
+    if radius != GF.BLOCK_OUTER_RADIUS:
+        # where the corners of the grid and the frame differ, a strip of the grid top or frame bottom shows
+        for corner in range(4):
+            builder.strip(grid_top.arc(corner), lower.arc(corner))
+    half = GF.GRID_UNIT / 2
+    builder.cap(upper, ((grid_x - 1) * half, (grid_y - 1) * half, GF.HEIGHT_UNIT + height), up=True)
+    return builder.mesh()
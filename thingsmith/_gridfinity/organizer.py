@@ -4,6 +4,7 @@ from build123d import (
     BuildPart,
     BuildSketch,
     Mode,
+    Part,
     RectangleRounded,
     RotationLike,
     extrude,
@@ -11,6 +12,21 @@ from build123d import (
 
 from thingsmith._gridfinity.block import BlockGrid
 from thingsmith._gridfinity.spec import GF
+from thingsmith.booleans import boolean_strategy, fuse
+from thingsmith.cache import cached_part
+from thingsmith.profiling import traced
+
+
+@traced("gridfinity.frame")
+def _build_frame(grid_x: int, grid_y: int, radius: float, height: float) -> Part | None:
+    with BuildPart():
+        base = BlockGrid(grid_x, grid_y, mode=Mode.PRIVATE)
+        with BuildSketch(base.build_surface()):
+            RectangleRounded(grid_x * GF.GRID_UNIT,
+                             grid_y * GF.GRID_UNIT, radius)
+        body = extrude(amount=height, mode=Mode.PRIVATE)
+    # the body stands on the grid's top face
+    return fuse([base, body], touching=True)
 
 
 class OrganizerFrame(BasePartObject):
@@ -29,15 +45,14 @@ class OrganizerFrame(BasePartObject):
     ) -> None:
         self.__frame_x = grid_x * GF.GRID_UNIT
         self.__frame_y = grid_y * GF.GRID_UNIT
-        with BuildPart() as part:
-            base = BlockGrid(grid_x, grid_y)
-            with BuildSketch(base.build_surface()) as base:
-                RectangleRounded(self.frame_length_x,
-                                 self.frame_length_y, radius)
-            extrude(amount=height)
-        if not part.part:
+        part = cached_part(
+            "OrganizerFrame",
+            {"grid_x": grid_x, "grid_y": grid_y, "radius": radius, "height": height, "booleans": boolean_strategy()},
+            lambda: _build_frame(grid_x, grid_y, radius, height),
+        )
+        if part is None:
             return
-        super().__init__(part.part, rotation, align, mode)
+        super().__init__(part, rotation, align, mode)
 
     @property
     def frame_length_y(self) -> float:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 from build123d import (
     Align,
@@ -12,34 +12,8 @@ from build123d import (
     make_face,
 )
 
-from thingsmith._gridfinity.spec import GF
-
-
-@dataclass(frozen=True)
-class ProfileSections:
-    """Base class for profile section measurements in mm."""
-
-    bottom: float
-    middle: float
-    top: float
-
-    @property
-    def total_height(self) -> float:
-        return self.bottom + self.middle + self.top
-
-
-@dataclass(frozen=True)
-class BaseplateSections(ProfileSections):
-    bottom: float = field(default=GF.BASEPLATE_BOTTOM_SECTION, init=False)
-    middle: float = field(default=GF.BASEPLATE_MIDDLE_SECTION, init=False)
-    top: float = field(default=GF.BASEPLATE_TOP_SECTION, init=False)
-
-
-@dataclass(frozen=True)
-class StackingLipSections(ProfileSections):
-    bottom = GF.STACKING_LIP_BOTTOM_SECTION
-    middle = GF.STACKING_LIP_MIDDLE_SECTION
-    top = GF.STACKING_LIP_TOP_SECTION
+if TYPE_CHECKING:
+    from thingsmith._gridfinity.spec import ProfileSections
 
 
 class Profile(BaseSketchObject):
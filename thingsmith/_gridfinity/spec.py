@@ -1,4 +1,8 @@
-from build123d import MM
+from dataclasses import dataclass, field
+from math import ceil
+
+MM = 1
+"""build123d's millimeter, the unit of every length, repeated here so specs can be used without build123d."""
 
 
 class GF:
@@ -26,3 +30,39 @@ class GF:
 
     BLOCK_OUTER_RADIUS = 7.5 * MM
     BLOCK_SIZE = 41.5 * MM
+
+    @classmethod
+    def values(cls) -> tuple[tuple[str, float], ...]:
+        """Return every constant as sorted (name, value) pairs, e.g. to key cached geometry."""
+        return tuple(sorted((k, v) for k, v in vars(cls).items() if k.isupper()))
+
+
+def num_grid_for_mm(length_mm: float) -> int:
+    return ceil(length_mm / GF.GRID_UNIT)
+
+
+@dataclass(frozen=True)
+class ProfileSections:
+    """Base class for profile section measurements in mm."""
+
+    bottom: float
+    middle: float
+    top: float
+
+    @property
+    def total_height(self) -> float:
+        return self.bottom + self.middle + self.top
+
+
+@dataclass(frozen=True)
+class BaseplateSections(ProfileSections):
+    bottom: float = field(default=GF.BASEPLATE_BOTTOM_SECTION, init=False)
+    middle: float = field(default=GF.BASEPLATE_MIDDLE_SECTION, init=False)
+    top: float = field(default=GF.BASEPLATE_TOP_SECTION, init=False)
+
+
+@dataclass(frozen=True)
+class StackingLipSections(ProfileSections):
+    bottom = GF.STACKING_LIP_BOTTOM_SECTION
+    middle = GF.STACKING_LIP_MIDDLE_SECTION
+    top = GF.STACKING_LIP_TOP_SECTION
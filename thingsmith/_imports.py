@@ -0,0 +1,29 @@
+"""Package attributes imported from their modules on first access."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+
+def lazy_attributes(package: str, attributes: Mapping[str, str]) -> Callable[[str], object]:
+    """
+    Return a module `__getattr__` for `package` that imports each name in `attributes` from its module.
+
+    The loaded value is stored on the package, so later accesses do not go through `__getattr__` again.
+    """
+
+    def getattr_(name: str) -> object:
+        module = attributes.get(name)
+        if module is None:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        value = getattr(importlib.import_module(module), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return getattr_
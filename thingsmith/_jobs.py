@@ -0,0 +1,38 @@
+"""Build jobs and their validation, usable without loading the geometry modules."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from thingsmith import drive_socket, wrench
+from thingsmith.drive_socket._spec import organizer_name as socket_organizer_name
+from thingsmith.wrench._spec import organizer_name as wrench_organizer_name
+
+if TYPE_CHECKING:
+    from thingsmith._validation import SpecError
+
+
+@dataclass
+class WrenchSet:
+    """A wrench organizer job: the wrenches to hold and an optional spec."""
+
+    wrenches: list[wrench.Wrench]
+    spec: wrench.OrganizerSpec | None = None
+
+
+type BuildJob = drive_socket.OrganizerSpec | WrenchSet
+
+
+def validate(job: BuildJob) -> list[SpecError]:
+    """Check `job` for problems that would fail the build, without building any geometry."""
+    if isinstance(job, WrenchSet):
+        return (job.spec or wrench.OrganizerSpec()).validate(job.wrenches)
+    return job.validate()
+
+
+def job_name(job: BuildJob) -> str:
+    """Return the name `job` is built and exported under; only defined for jobs that `validate`."""
+    if isinstance(job, WrenchSet):
+        return wrench_organizer_name(job.wrenches)
+    return socket_organizer_name(job)
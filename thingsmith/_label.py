@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import copy
+import functools
+import os
+import sys
+
+from build123d import (
+    Align,
+    BaseSketchObject,
+    BuildSketch,
+    Compound,
+    Face,
+    Location,
+    Mode,
+    Vector,
+)
+from build123d.build_common import validate_inputs
+from OCP.Font import Font_FA_Regular, Font_FontMgr, Font_SystemFont
+from OCP.NCollection import NCollection_Utf8String
+from OCP.StdPrs import StdPrs_BRepFont
+from OCP.TCollection import TCollection_AsciiString
+
+from thingsmith._cache import LRUCache
+from thingsmith._fonts import DEFAULT_FONT
+from thingsmith.profiling import traced
+
+glyph_cache: LRUCache[tuple[str, float, str], list[Face]] = LRUCache(maxsize=1024)
+"""Outline faces of single glyphs, keyed by font, size and character."""
+
+label_cache: LRUCache[tuple[str, float, str, tuple[Align, Align]], Compound] = LRUCache(maxsize=512)
+"""Aligned label faces, keyed by font, size, text and alignment."""
+
+
+@functools.cache
+def _system_font(font: str) -> Font_SystemFont:
+    if sys.platform.startswith("linux"):
+        # same fontconfig setup build123d does before resolving a font for `Text`
+        os.environ["FONTCONFIG_FILE"] = "/etc/fonts/fonts.conf"
+        os.environ["FONTCONFIG_PATH"] = "/etc/fonts/"
+    return Font_FontMgr.GetInstance_s().FindFont(TCollection_AsciiString(font), Font_FA_Regular)
+
+
+@functools.cache
+def _font(font: str, font_size: float) -> StdPrs_BRepFont:
+    # an int size would pick a different constructor overload and leave the font uninitialized
+    name = NCollection_Utf8String(_system_font(font).FontName().ToCString())
+    return StdPrs_BRepFont(name, Font_FA_Regular, float(font_size))
+
+
+def _build_glyph(font: str, font_size: float, char: str) -> list[Face]:
+    shape = _font(font, font_size).RenderGlyph(char)
+    if shape.IsNull():
+        return []
+    return list(Compound(shape).faces())
+
+
+@traced("label.layout")
+def _build_label(txt: str, font_size: float, font: str, align: tuple[Align, Align]) -> Compound:
+    f = _font(font, font_size)
+    faces: list[Face] = []
+    pen = 0.0
+    for i, char in enumerate(txt):
+        glyph = glyph_cache.get((font, font_size, char), functools.partial(_build_glyph, font, font_size, char))
+        faces.extend(g.moved(Location((pen, 0, 0))) for g in glyph)
+        following = txt[i + 1] if i + 1 < len(txt) else "\0"
+        pen += f.AdvanceX(char, following)
+
+    label = Compound(faces)
+    if not faces:
+        return label
+    return label.translate(Vector(*label.bounding_box().to_align_offset(align)))
+
+
+def label_faces(
+    txt: str,
+    font_size: float,
+    font: str = DEFAULT_FONT,
+    align: tuple[Align, Align] = (Align.CENTER, Align.CENTER),
+) -> Compound:
+    """
+    Return the faces of `txt` laid out like build123d's `Text`.
+
+    Glyph outlines are cached per character and shared by every label using them, and finished labels are
+    cached as well, so repeated labels across organizers are only laid out once.
+    """
+    key = (font, font_size, txt, align)
+    label = label_cache.get(key, lambda: _build_label(txt, font_size, font, align))
+    # sketches fuse their faces; hand out a copy so the cached faces are never modified
+    return copy.deepcopy(label)
+
+
+class Label(BaseSketchObject):
+    """Sketch Object: single line text, a cached replacement for `Text`."""
+
+    _applies_to = [BuildSketch._tag]  # noqa: RUF012, SLF001
+
+    def __init__(
+        self,
+        txt: str,
+        font_size: float,
+        font: str = DEFAULT_FONT,
+        align: tuple[Align, Align] = (Align.CENTER, Align.CENTER),
+        rotation: float = 0.0,
+        mode: Mode = Mode.ADD,
+    ) -> None:
+        context: BuildSketch | None = BuildSketch._get_context(self)  # noqa: SLF001
+        validate_inputs(context, self)
+
+        self.txt = txt
+        self.font_size = font_size
+        self.font = font
+        super().__init__(label_faces(txt, font_size, font, align), rotation, None, mode)
@@ -0,0 +1,186 @@
+"""
+Closed-form placement of inserts and labels.
+
+Every position is derived from the organizer spec, the `GF` constants and the insert sizes, so the organizers
+never need to search the built geometry for faces or edges to anchor on.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from thingsmith._gridfinity.spec import GF, num_grid_for_mm
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from thingsmith.drive_socket import OrganizerSpec as SocketOrganizerSpec
+    from thingsmith.wrench import OrganizerSpec as WrenchOrganizerSpec, Wrench
+
+type Point = tuple[float, float, float]
+
+# dimensions of the wrench `InsertProfile`
+PROFILE_ANGLE = 40
+PROFILE_BOTTOM_RATIO = 2 / 5
+PROFILE_LIP_WIDTH = 3
+PROFILE_LIP_HEIGHT = 3
+
+WRENCH_TOP_FILLET = 0.4
+"""Fillet radius of the top edges of wrench inserts."""
+WRENCH_INNER_FILLET = 0.3
+"""Fillet radius of the edges along the inside of wrench inserts."""
+
+
+@dataclass(frozen=True)
+class SocketInsert:
+    center: Point
+    diameter: float
+
+
+@dataclass(frozen=True)
+class SocketLayout:
+    """
+    Placement of a socket organizer.
+
+    Attributes:
+        top: Z of the organizer's top face.
+        inserts: Center of each insert opening on the top face, with the insert diameter.
+        insert_labels: Bottom center anchor of each insert label.
+        face_label: Top left anchor of the organizer label.
+
+    """
+
+    top: float
+    inserts: list[SocketInsert]
+    insert_labels: list[Point]
+    face_label: Point
+
+
+def insert_distances(spec: SocketOrganizerSpec) -> list[float]:
+    """Return the X distance of each insert's left edge from the edge of the top face."""
+    sockets = spec.socket_set
+    step = spec.insert_diameter_offset + spec.insert_offset
+    distances = spec.edge_padding_x + sockets.diameter_prefix[:-1] + np.arange(len(sockets)) * step
+    return [float(d) for d in distances]
+
+
+def socket_layout(spec: SocketOrganizerSpec) -> SocketLayout:
+    # the top face is inset from the frame by the edge fillet
+    left = spec.edge_fillet
+    bottom = spec.edge_fillet
+    top = spec.base_height + GF.HEIGHT_UNIT
+
+    if spec.align == "center":
+        origin_y = spec.length_y / 2
+        y_offset = 0
+    else:
+        origin_y = bottom
+        y_offset = int((spec.length_y - spec.socket_set.diameter_max) / 2)
+    y_offset = int(y_offset + spec.align_offset)
+    if spec.insert_labels:
+        y_offset = int(y_offset + spec.insert_labels_size / 2)
+
+    inserts = []
+    insert_labels = []
+    for s, distance in zip(spec.sockets, insert_distances(spec), strict=True):
+        diameter = s.diameter_mm + spec.insert_diameter_offset
+        x = left + distance + diameter / 2
+        y = origin_y + y_offset if spec.align == "center" else origin_y + y_offset + diameter / 2
+        inserts.append(SocketInsert((x, y, top), diameter))
+        insert_labels.append((x, bottom + spec.edge_padding_y, top))
+
+    if spec.organizer_label_padding is None:
+        padding_x, padding_y = spec.edge_padding_x, spec.edge_padding_y
+    else:
+        padding_x, padding_y = spec.organizer_label_padding
+    face_label = (left + padding_x, spec.length_y - spec.edge_fillet - padding_y, top)
+
+    return SocketLayout(top, inserts, insert_labels, face_label)
+
+
+@dataclass(frozen=True)
+class WrenchLayout:
+    """
+    Placement of a wrench organizer.
+
+    Attributes:
+        grid_x: Width of the organizer in grid units.
+        height: Height of the frame above the grid base.
+        inserts: Bottom left corner of each insert profile in the XZ plane.
+        openings: Depth of each insert profile below the top face; it only opens through the top if positive.
+        strips: Start and end X of the top face strip in front of each insert, between the filleted edges.
+        labels: Center of each strip.
+
+    """
+
+    grid_x: int
+    height: float
+    inserts: list[tuple[float, float]]
+    openings: list[float]
+    strips: list[tuple[float, float]]
+    labels: list[Point]
+
+
+def _profile_walls(width: float, height: float, depth: float) -> tuple[tuple[float, float], tuple[float, float]]:
+    """
+    Return the left and right wall of an `InsertProfile` cross-section `depth` below its top.
+
+    Each wall is its X and the angle in radians between the wall and the surrounding material's top face.
+    """
+    lip_w, lip_h = PROFILE_LIP_WIDTH, PROFILE_LIP_HEIGHT
+    if lip_h / 2 < depth <= lip_h:
+        # the lower half of the lip slopes back under the top face
+        left = (lip_w * (lip_h - depth) / (lip_h / 2), math.atan2(lip_h / 2, lip_w))
+    else:
+        left = (lip_w if depth <= lip_h / 2 else 0, math.pi / 2)
+
+    bottom_width = width * PROFILE_BOTTOM_RATIO
+    angle_height = (width - bottom_width) * math.tan(math.radians(PROFILE_ANGLE))
+    if depth <= angle_height:
+        right = (width, math.pi / 2)
+    else:
+        run = width - bottom_width
+        rise = height - angle_height
+        right = (width - run * (depth - angle_height) / rise, math.pi / 2 + math.atan2(run, rise))
+    return left, right
+
+
+def _fillet_inset(angle: float) -> float:
+    """Return how far filleting a top edge with `angle` between its faces moves the edge of the top face."""
+    return WRENCH_TOP_FILLET / math.tan(angle / 2)
+
+
+def wrench_layout(wrenches: Sequence[Wrench], spec: WrenchOrganizerSpec) -> WrenchLayout:
+    height = max([w.profile_height for w in wrenches]) + 3
+    width_sum = sum([w.profile_width for w in wrenches])
+    grid_x = max(
+        num_grid_for_mm(spec.front_offset + width_sum + (len(wrenches) + 2) * spec.min_insert_offset),
+        spec.min_grid_x,
+    )
+    offset = ((grid_x * GF.GRID_UNIT + spec.front_offset + spec.back_offset) - width_sum) / (len(wrenches) + 2)
+    top = GF.HEIGHT_UNIT + height
+
+    inserts = []
+    openings = []
+    strips = []
+    labels = []
+    distance = offset + spec.front_offset
+    # each label is centered on the top face strip between the previous opening, or the frame edge, and its own
+    strip_start = _fillet_inset(math.pi / 2)
+    for w in wrenches:
+        z = (height - w.profile_height) + (height / 2) - 1
+        depth = z + w.profile_height - top
+        inserts.append((distance, z))
+        openings.append(depth)
+        (left, left_angle), (right, right_angle) = _profile_walls(w.profile_width, w.profile_height, depth)
+        strip_end = distance + left - _fillet_inset(left_angle)
+        strips.append((strip_start, strip_end))
+        labels.append(((strip_start + strip_end) / 2, spec.grid_y * GF.GRID_UNIT / 2, top))
+        strip_start = distance + right + _fillet_inset(right_angle)
+        distance += w.profile_width + offset
+
+    return WrenchLayout(grid_x, height, inserts, openings, strips, labels)
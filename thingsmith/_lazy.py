@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import functools
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from thingsmith._gridfinity.spec import GF
+from thingsmith.export import ExportFormat, Quality, export, export_path
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from pathlib import Path
+
+    from build123d import BasePartObject, Shape
+
+
+class LazyOrganizer(ABC):
+    """
+    Organizer metadata that is known without modeling, with the geometry built on first use.
+
+    Attributes:
+        name: Name of the organizer, also used for its export files.
+        grid_x: Width in grid units.
+        grid_y: Depth in grid units.
+        height: Height of the top face above the bottom of the grid in mm, excluding raised labels.
+
+    """
+
+    name: str
+    grid_x: int
+    grid_y: int
+    height: float
+
+    @property
+    def footprint(self) -> tuple[float, float]:
+        """Width and depth in mm."""
+        return self.grid_x * GF.GRID_UNIT, self.grid_y * GF.GRID_UNIT
+
+    @property
+    def built(self) -> bool:
+        return "shape" in self.__dict__
+
+    @functools.cached_property
+    def shape(self) -> BasePartObject:
+        """The organizer, built on first access."""
+        return self._build()
+
+    @abstractmethod
+    def _build(self) -> BasePartObject: ...
+
+    def adopt(self, shape: Shape) -> None:
+        """Use `shape`, e.g. built in a worker by `batch.iter_build`, as the organizer instead of building it."""
+        self.__dict__["shape"] = shape
+
+    def release(self) -> None:
+        """Drop the built shape so it can be freed, e.g. once it is exported; it is built again on next use."""
+        self.__dict__.pop("shape", None)
+
+    def files(self, directory: str | Path, formats: Iterable[ExportFormat] = ("stl",)) -> list[Path]:
+        """Return the paths `export` writes to, without building anything."""
+        return [export_path(directory, self.name, fmt) for fmt in formats]
+
+    def export(
+        self,
+        directory: str | Path,
+        formats: Iterable[ExportFormat] = ("stl",),
+        quality: Quality = Quality.ARCHIVAL,
+        overrides: Mapping[str, Quality] | None = None,
+    ) -> list[Path]:
+        """Build the organizer if needed and export it into `directory`."""
+        return export(self.shape, directory, self.name, formats, quality, overrides)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, {self.grid_x}x{self.grid_y}, built={self.built})"
@@ -0,0 +1,73 @@
+"""Triangle meshes as numpy arrays, without OCC; see `_triangulate` for meshing shapes."""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+    from OCP.gp import gp_Trsf
+
+VERTEX_DIGITS = 6
+"""Decimals to which vertices are rounded when merging them, as build123d does for 3MF."""
+
+
+def trsf_matrix(trsf: gp_Trsf) -> npt.NDArray[np.float64]:
+    """Return the (3, 4) matrix of `trsf` that maps column vectors, with the translation in the last column."""
+    return np.array([[trsf.Value(r, c) for c in range(1, 5)] for r in range(1, 4)])
+
+
+def normals(corners: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Return the unit normal of each triangle of (m, 3, 3) corners, or zero for degenerate ones."""
+    cross = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = np.linalg.norm(cross, axis=1, keepdims=True)
+    return np.divide(cross, lengths, out=np.zeros_like(cross), where=lengths > 0)
+
+
+@dataclass(frozen=True)
+class Mesh:
+    """
+    Triangles over a shared vertex array.
+
+    Attributes:
+        vertices: (n, 3) vertex coordinates in mm.
+        triangles: (m, 3) vertex indices of each triangle, counter-clockwise seen from outside.
+
+    """
+
+    vertices: npt.NDArray[np.float64]
+    triangles: npt.NDArray[np.int64]
+
+    def __len__(self) -> int:
+        return len(self.triangles)
+
+    def corners(self) -> npt.NDArray[np.float64]:
+        """Return the (m, 3, 3) corner coordinates of every triangle."""
+        return self.vertices[self.triangles]
+
+    def normals(self) -> npt.NDArray[np.float64]:
+        return normals(self.corners())
+
+    def volume(self) -> float:
+        """Return the enclosed volume in mm³, for a closed mesh."""
+        corners = self.corners()
+        return float(np.einsum("ij,ij->i", corners[:, 0], np.cross(corners[:, 1], corners[:, 2])).sum() / 6)
+
+    def digest(self) -> str:
+        """Return a hash of the vertices and triangles, equal for identical meshes."""
+        h = hashlib.sha256(np.ascontiguousarray(self.vertices).tobytes())
+        h.update(np.ascontiguousarray(self.triangles).tobytes())
+        return h.hexdigest()
+
+    def merged(self) -> Mesh:
+        """Return the mesh with coincident vertices merged and the triangles that collapse dropped."""
+        # + 0.0 turns -0.0 into 0.0, so meshes of copies moved back to the origin hash the same
+        unique, inverse = np.unique(self.vertices.round(VERTEX_DIGITS) + 0.0, axis=0, return_inverse=True)
+        triangles = inverse.reshape(-1)[self.triangles]
+        a, b, c = triangles.T
+        keep = (a != b) & (b != c) & (c != a)
+        return Mesh(unique, triangles[keep])
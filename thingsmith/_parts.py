@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING
+
+from thingsmith._cache import LRUCache
+from thingsmith._gridfinity.spec import GF
+from thingsmith.booleans import boolean_strategy
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from build123d import Part
+
+part_cache: LRUCache[tuple[Hashable, ...], Part | None] = LRUCache(maxsize=64)
+"""Built organizer children, keyed by the child and the spec values it is built from."""
+
+
+def cached_child(kind: str, key: tuple[Hashable, ...], build: Callable[[], Part | None]) -> Part | None:
+    """
+    Return a copy of the organizer child `kind` built from the values in `key`.
+
+    `key` must hold every value the child reads, and nothing else, so that changing a spec field only rebuilds
+    the children that depend on it. Copies are handed out because exporting and assembling modify shapes.
+    """
+    part = part_cache.get((kind, *key, GF.values(), boolean_strategy()), build)
+    if part is None:
+        return None
+    return copy.deepcopy(part)
@@ -0,0 +1,70 @@
+"""Mesh OCC shapes into `Mesh` arrays."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from OCP.BRep import BRep_Tool
+from OCP.BRepMesh import BRepMesh_IncrementalMesh
+from OCP.BRepTools import BRepTools
+from OCP.TopAbs import TopAbs_FACE, TopAbs_REVERSED
+from OCP.TopExp import TopExp_Explorer
+from OCP.TopLoc import TopLoc_Location
+from OCP.TopoDS import TopoDS, TopoDS_Face
+
+from thingsmith._mesh import Mesh, trsf_matrix
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+    from build123d import Shape
+
+
+def _face_mesh(face: TopoDS_Face) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.int64]] | None:
+    location = TopLoc_Location()
+    poly = BRep_Tool.Triangulation_s(face, location)
+    if poly is None:
+        return None
+    nodes = np.array([poly.Node(i).Coord() for i in range(1, poly.NbNodes() + 1)], dtype=np.float64)
+    triangles = np.array([poly.Triangle(i).Get() for i in range(1, poly.NbTriangles() + 1)], dtype=np.int64) - 1
+    if not location.IsIdentity():
+        matrix = trsf_matrix(location.Transformation())
+        nodes = nodes @ matrix[:, :3].T + matrix[:, 3]
+    if face.Orientation() == TopAbs_REVERSED:
+        # keep the triangles counter-clockwise seen from outside
+        triangles = triangles[:, ::-1]
+    return nodes, triangles
+
+
+def triangulate(shape: Shape, linear_deflection: float, angular_deflection: float) -> Mesh:
+    """
+    Mesh `shape` and return its triangles in world position.
+
+    The triangulation is removed from `shape` again afterwards, so only the returned arrays stay in memory.
+    Vertices are not shared between faces; see `Mesh.merged`.
+    """
+    # drop any triangulation left by an earlier export, otherwise a finer mesh would be kept
+    BRepTools.Clean_s(shape.wrapped)
+    BRepMesh_IncrementalMesh(
+        shape.wrapped,
+        theLinDeflection=linear_deflection,
+        isRelative=True,
+        theAngDeflection=angular_deflection,
+        isInParallel=True,
+    )
+    vertices = []
+    triangles = []
+    offset = 0
+    explorer = TopExp_Explorer(shape.wrapped, TopAbs_FACE)
+    while explorer.More():
+        mesh = _face_mesh(TopoDS.Face_s(explorer.Current()))
+        if mesh is not None:
+            vertices.append(mesh[0])
+            triangles.append(mesh[1] + offset)
+            offset += len(mesh[0])
+        explorer.Next()
+    BRepTools.Clean_s(shape.wrapped)
+
+    if not triangles:
+        return Mesh(np.empty((0, 3)), np.empty((0, 3), dtype=np.int64))
+    return Mesh(np.concatenate(vertices), np.concatenate(triangles))
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# rough text extents as a fraction of the font size, wide enough for the digits, fractions and units of labels
+CHAR_WIDTH = 0.6
+TEXT_HEIGHT = 0.85
+
+
+@dataclass(frozen=True)
+class SpecError:
+    """
+    A problem that keeps a spec from being built.
+
+    Attributes:
+        field: Name of the spec field to change.
+        message: What is wrong.
+        index: The insert the problem applies to, if any.
+
+    """
+
+    field: str
+    message: str
+    index: int | None = None
+
+    def __str__(self) -> str:
+        where = self.field if self.index is None else f"{self.field} (insert {self.index})"
+        return f"{where}: {self.message}"
+
+
+class InvalidSpecError(ValueError):
+    def __init__(self, errors: Sequence[SpecError]) -> None:
+        super().__init__("invalid spec: " + "; ".join(str(e) for e in errors))
+        self.errors = list(errors)
+
+
+def estimate_text_size(txt: str, font_size: float) -> tuple[float, float]:
+    """Estimate the width and height of a single line label without rendering it."""
+    return len(txt) * font_size * CHAR_WIDTH, font_size * TEXT_HEIGHT
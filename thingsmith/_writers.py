@@ -0,0 +1,211 @@
+"""
+Streaming STL and 3MF writers.
+
+Meshes are written as they are added, so only the mesh being written is held in memory. The binary STL
+triangle count is back-patched on close, and the 3MF model is deflated into the zip archive as it is written.
+Nothing here loads build123d, so `export_mesh`, re-exported by `thingsmith.export`, writes mesh-native bases
+without OCC.
+"""
+
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Self
+from xml.sax.saxutils import quoteattr
+
+import numpy as np
+
+from thingsmith._mesh import normals
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy.typing as npt
+    from build123d import Color
+
+    from thingsmith._formats import ExportFormat
+    from thingsmith._mesh import Mesh
+
+_STL_RECORD = np.dtype([("normal", "<f4", (3,)), ("corners", "<f4", (3, 3)), ("attributes", "<u2")])
+
+_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="model" ContentType="application/vnd.ms-package.3dmanufacturing-3dmodel+xml"/>
+</Types>
+"""
+_RELS = """<?xml version="1.0" encoding="UTF-8"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Target="/3D/3dmodel.model" Id="rel0" Type="http://schemas.microsoft.com/3dmanufacturing/2013/01/3dmodel"/>
+</Relationships>
+"""
+_MODEL_HEADER = """<?xml version="1.0" encoding="UTF-8"?>
+<model unit="millimeter" xml:lang="en-US" xmlns="http://schemas.microsoft.com/3dmanufacturing/core/2015/02">
+<resources>
+"""
+
+# rows of text written at once, bounding the size of the formatted strings
+_CHUNK = 16384
+
+
+class ExportError(Exception):
+    def __init__(self, path: Path, reason: str = "write failed") -> None:
+        super().__init__(f"{path}: {reason}")
+        self.path = path
+
+
+class StlWriter:
+    """Binary STL file that meshes are appended to."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.count = 0
+        self._file: BinaryIO = path.open("wb")
+        # the count at offset 80 is written on close
+        self._file.write(b"thingsmith".ljust(80, b" ") + bytes(4))
+
+    def add(self, mesh: Mesh) -> None:
+        for start in range(0, len(mesh), _CHUNK):
+            corners = mesh.vertices[mesh.triangles[start : start + _CHUNK]]
+            records = np.zeros(len(corners), dtype=_STL_RECORD)
+            records["corners"] = corners
+            records["normal"] = normals(corners)
+            self._file.write(records.tobytes())
+        self.count += len(mesh)
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self._file.seek(80)
+        self._file.write(self.count.to_bytes(4, "little"))
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _transform(matrix: npt.NDArray[np.float64]) -> str:
+    # 3MF transforms row vectors: the rotation is transposed and the translation is the last row
+    values = [*matrix[:, :3].T.reshape(-1), *matrix[:, 3]]
+    return " ".join(f"{v:.9g}" for v in values)
+
+
+def _hex_color(color: Color) -> str:
+    return "#" + "".join(f"{round(c * 255):02X}" for c in color.to_tuple())
+
+
+class ThreeMFWriter:
+    """
+    3MF package whose model is streamed into the archive one object at a time.
+
+    Meshes are written once with `add_mesh` and can be placed any number of times by the components of
+    `add_components`; `add_item` puts an object on the build plate.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._zip = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED)
+        self._zip.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        self._zip.writestr("_rels/.rels", _RELS)
+        self._model = self._zip.open("3D/3dmodel.model", "w", force_zip64=True)
+        self._write(_MODEL_HEADER)
+        self._next_id = 1
+        self._items: list[int] = []
+
+    def _write(self, text: str) -> None:
+        self._model.write(text.encode())
+
+    def _resource_id(self) -> int:
+        resource_id = self._next_id
+        self._next_id += 1
+        return resource_id
+
+    def add_mesh(self, mesh: Mesh, name: str = "", color: Color | None = None, part_number: str = "") -> int:
+        """Write `mesh` as an object resource and return its id, without placing it on the build plate."""
+        properties = ""
+        if color is not None:
+            material = self._resource_id()
+            self._write(
+                f'<basematerials id="{material}"><base name={quoteattr(str(color))} '
+                f'displaycolor="{_hex_color(color)}"/></basematerials>\n',
+            )
+            properties = f' pid="{material}" pindex="0"'
+        object_id = self._resource_id()
+        self._write(
+            f'<object id="{object_id}" type="model" name={quoteattr(name)} partnumber={quoteattr(part_number)}'
+            f"{properties}>\n<mesh>\n<vertices>\n",
+        )
+        for start in range(0, len(mesh.vertices), _CHUNK):
+            rows = mesh.vertices[start : start + _CHUNK]
+            self._write("".join(f'<vertex x="{x:.6f}" y="{y:.6f}" z="{z:.6f}"/>\n' for x, y, z in rows.tolist()))
+        self._write("</vertices>\n<triangles>\n")
+        for start in range(0, len(mesh.triangles), _CHUNK):
+            triangles = mesh.triangles[start : start + _CHUNK]
+            self._write("".join(f'<triangle v1="{a}" v2="{b}" v3="{c}"/>\n' for a, b, c in triangles.tolist()))
+        self._write("</triangles>\n</mesh>\n</object>\n")
+        return object_id
+
+    def add_components(
+        self,
+        components: Iterable[tuple[int, npt.NDArray[np.float64]]],
+        name: str = "",
+        part_number: str = "",
+    ) -> int:
+        """
+        Write an object made of earlier objects, each placed by a (3, 4) transform, and return its id.
+
+        An object referenced by several components is stored once.
+        """
+        object_id = self._resource_id()
+        rows = "".join(f'<component objectid="{c}" transform="{_transform(matrix)}"/>\n' for c, matrix in components)
+        self._write(
+            f'<object id="{object_id}" type="model" name={quoteattr(name)} partnumber={quoteattr(part_number)}>\n'
+            f"<components>\n{rows}</components>\n</object>\n",
+        )
+        return object_id
+
+    def add_item(self, object_id: int) -> None:
+        """Place the object `object_id` on the build plate."""
+        self._items.append(object_id)
+
+    def close(self) -> None:
+        if self._model.closed:
+            return
+        items = "".join(f'<item objectid="{i}"/>\n' for i in self._items)
+        self._write(f"</resources>\n<build>\n{items}</build>\n</model>\n")
+        self._model.close()
+        self._zip.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def export_mesh(mesh: Mesh, path: str | Path, fmt: ExportFormat, name: str = "") -> Path:
+    """
+    Write a mesh built without BREP, such as `grid_mesh` or `frame_mesh` of `thingsmith._gridfinity`.
+
+    Raises:
+        ExportError: If the file could not be written.
+
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        if fmt == "stl":
+            with StlWriter(path) as writer:
+                writer.add(mesh)
+        elif fmt == "3mf":
+            with ThreeMFWriter(path) as writer:
+                writer.add_item(writer.add_mesh(mesh, name or path.stem, part_number=name or path.stem))
+        else:
+            raise ExportError(path, f"unsupported format {fmt!r}")
+    except OSError as ex:
+        raise ExportError(path, str(ex)) from ex
+    return path
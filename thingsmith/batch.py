@@ -0,0 +1,353 @@
+"""
+Build many organizers in parallel worker processes.
+
+`iter_build` streams results: each organizer is built in a worker, handed back as BREP or written to export
+files, and released before the next one, so memory does not grow with the catalog. With a memory budget, a
+worker whose resident memory outgrows its share after a job is replaced by a fresh process, which drops
+everything OCC and the geometry caches still hold.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gc
+import multiprocessing
+import os
+import sys
+import traceback
+from dataclasses import dataclass, field
+from multiprocessing.connection import wait
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+from thingsmith import drive_socket, wrench
+from thingsmith._jobs import BuildJob, WrenchSet, validate
+from thingsmith._transfer import SharedPack, block_name, pack, share, unlink_block, unpack
+from thingsmith._validation import InvalidSpecError
+from thingsmith.export import ExportFormat, Quality, export
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
+    from multiprocessing.connection import Connection
+    from multiprocessing.context import SpawnContext
+
+    from build123d import BasePartObject, Shape
+
+
+@dataclass
+class BuildResult:
+    """
+    Outcome of building one job.
+
+    Attributes:
+        index: Position of the job in the input sequence.
+        job: The spec that was built.
+        name: Name of the built organizer, if it was built.
+        shape: The organizer assembly, unless the result was exported to files without `with_shapes`.
+        files: Paths written when exporting.
+        error: Formatted traceback if building or exporting failed.
+
+    """
+
+    index: int
+    job: BuildJob
+    name: str | None = None
+    shape: Shape | None = None
+    files: list[Path] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def build(job: BuildJob) -> BasePartObject:
+    """Build the organizer described by `job` in the current process."""
+    if isinstance(job, WrenchSet):
+        return wrench.Organizer(job.wrenches, job.spec)
+    return drive_socket.Organizer(job)
+
+
+@dataclass
+class _Outcome:
+    name: str | None = None
+    packed: bytes | SharedPack | None = None
+    files: list[Path] = field(default_factory=list)
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class _ExportOptions:
+    directories: Mapping[ExportFormat, Path]
+    quality: Quality
+    overrides: Mapping[str, Quality] | None
+    shapes: bool = False
+    """Hand the shape back as well as writing its files."""
+
+
+def _export_options(
+    export_dir: str | Path | Mapping[ExportFormat, str | Path] | None,
+    formats: Iterable[ExportFormat],
+    quality: Quality,
+    overrides: Mapping[str, Quality] | None,
+    *,
+    shapes: bool = False,
+) -> _ExportOptions | None:
+    if export_dir is None:
+        return None
+    if isinstance(export_dir, str | Path):
+        directories = {fmt: Path(export_dir) for fmt in formats}
+    else:
+        directories = {fmt: Path(d) for fmt, d in export_dir.items()}
+    return _ExportOptions(directories, quality, overrides, shapes)
+
+
+def _check(job: BuildJob) -> _Outcome | None:
+    errors = validate(job)
+    if errors:
+        return _Outcome(error=str(InvalidSpecError(errors)))
+    return None
+
+
+def _run(job: BuildJob, options: _ExportOptions | None, block: str | None = None) -> _Outcome:
+    """Build `job`, handing the shape back in the shared memory block `block` if given, else as bytes."""
+    try:
+        obj = build(job)
+        name = obj.name
+        files: list[Path] = []
+        if options is not None:
+            for fmt, directory in options.directories.items():
+                files.extend(export(obj, directory, name, [fmt], options.quality, options.overrides))
+            if not options.shapes:
+                return _Outcome(name=name, files=files)
+        packed = pack(obj)
+        return _Outcome(name=name, packed=share(packed, block) if block is not None else packed, files=files)
+    except Exception:  # noqa: BLE001
+        return _Outcome(error=traceback.format_exc())
+
+
+def _result(index: int, job: BuildJob, outcome: _Outcome) -> BuildResult:
+    shape = unpack(outcome.packed) if outcome.packed is not None else None
+    return BuildResult(index, job, outcome.name, shape, outcome.files, outcome.error)
+
+
+def _resident_bytes() -> int:
+    """Return the resident memory of this process, or its peak where the current size is not available."""
+    try:
+        pages = int(Path("/proc/self/statm").read_text().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource  # noqa: PLC0415
+    except ImportError:
+        # nothing to measure on Windows, so workers are never recycled there
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _serve(conn: Connection, options: _ExportOptions | None, memory_limit: int | None) -> None:
+    """Run the jobs sent over `conn` until told to stop or until the process outgrows `memory_limit`."""
+    while (message := conn.recv()) is not None:
+        index, job, block = message
+        outcome = _check(job) or _run(job, options, block)
+        # parts and their children reference each other, so the built organizer is only freed by a collection
+        gc.collect()
+        retire = memory_limit is not None and _resident_bytes() > memory_limit
+        conn.send((index, outcome, retire))
+        if retire:
+            break
+    conn.close()
+
+
+class _Worker:
+    """A worker process running one job at a time."""
+
+    def __init__(self, ctx: SpawnContext, options: _ExportOptions | None, memory_limit: int | None) -> None:
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(target=_serve, args=(child, options, memory_limit), daemon=True)
+        self.process.start()
+        child.close()
+        self.index = -1
+        self.block = ""
+
+    def submit(self, index: int, job: BuildJob) -> None:
+        # the block is named here, so it can be freed even if the worker is killed before sending it
+        self.index = index
+        self.block = block_name()
+        self.conn.send((index, job, self.block))
+
+    def receive(self) -> tuple[_Outcome, bool]:
+        """Return the outcome of the current job and whether the worker retired after it."""
+        try:
+            _, outcome, retire = self.conn.recv()
+        except (EOFError, OSError):
+            # the process died, e.g. a crash inside OCC
+            self.process.join()
+            unlink_block(self.block)
+            return _Outcome(error=f"worker process exited with code {self.process.exitcode}"), True
+        return outcome, retire
+
+    def kill(self) -> None:
+        """Terminate the worker without waiting for its job, and free the result it may have shared."""
+        self.process.terminate()
+        self.process.join()
+        self.conn.close()
+        if self.block:
+            unlink_block(self.block)
+
+    def stop(self) -> None:
+        with contextlib.suppress(OSError):
+            self.conn.send(None)
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.conn.close()
+
+
+def _next_valid(jobs: Iterator[tuple[int, BuildJob]], done: dict[int, BuildResult]) -> tuple[int, BuildJob] | None:
+    """Return the next job that passes validation, recording the results of those that do not."""
+    for index, job in jobs:
+        invalid = _check(job)
+        if invalid is None:
+            return index, job
+        done[index] = _result(index, job, invalid)
+    return None
+
+
+def _stop_all(idle: list[_Worker], busy: list[_Worker]) -> None:
+    # nobody will read the results of busy workers any more, so they are not waited for
+    for worker in busy:
+        worker.kill()
+    for worker in idle:
+        worker.stop()
+
+
+def _stream(
+    jobs: Iterator[tuple[int, BuildJob]],
+    workers: int,
+    options: _ExportOptions | None,
+    memory_limit: int | None,
+) -> Iterator[BuildResult]:
+    ctx = multiprocessing.get_context("spawn")
+    idle: list[_Worker] = []
+    busy: dict[Connection, _Worker] = {}
+    running: dict[int, BuildJob] = {}
+    done: dict[int, BuildResult] = {}
+    # results are yielded in order, so at most `window` finished results wait for a slow job
+    window = workers * 2
+    position = 0
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(busy) < workers and len(running) + len(done) < window:
+                item = _next_valid(jobs, done)
+                if item is None:
+                    exhausted = True
+                    break
+                index, job = item
+                worker = idle.pop() if idle else _Worker(ctx, options, memory_limit)
+                worker.submit(index, job)
+                busy[worker.conn] = worker
+                running[index] = job
+
+            while position in done:
+                yield done.pop(position)
+                position += 1
+            if not busy:
+                if exhausted:
+                    return
+                continue
+
+            for conn in wait(list(busy)):
+                worker = busy.pop(cast("Connection", conn))
+                outcome, retire = worker.receive()
+                done[worker.index] = _result(worker.index, running.pop(worker.index), outcome)
+                if retire:
+                    worker.stop()
+                else:
+                    idle.append(worker)
+    finally:
+        _stop_all(idle, list(busy.values()))
+
+
+def iter_build(
+    jobs: Iterable[BuildJob],
+    workers: int | None = None,
+    export_dir: str | Path | Mapping[ExportFormat, str | Path] | None = None,
+    formats: Iterable[ExportFormat] = ("stl",),
+    quality: Quality = Quality.ARCHIVAL,
+    overrides: Mapping[str, Quality] | None = None,
+    memory_budget: int | None = None,
+    *,
+    with_shapes: bool = False,
+) -> Iterator[BuildResult]:
+    """
+    Build `jobs` in worker processes and yield one result per job, in input order, as soon as it is ready.
+
+    Jobs are read from `jobs` only as workers free up, and a result is not kept once it has been yielded,
+    so a catalog of any length is built in bounded memory. Failures and validation errors are reported in
+    the results as with `build_many`.
+
+    Example:
+        for result in iter_build(specs, workers=8, export_dir="./stl", memory_budget=8 * 2**30):
+            print(result.files if result.ok else result.error)
+
+    Args:
+        jobs: Socket organizer specs or wrench sets to build, e.g. a generator.
+        workers: Number of worker processes. Defaults to the CPU count; 1 without a memory budget builds in
+            the current process.
+        export_dir: Directory to export into instead of yielding shapes, or a directory per format, which then
+            replaces `formats`.
+        formats: Export formats used with `export_dir`.
+        quality: Tessellation quality used with `export_dir`.
+        overrides: Tessellation quality per child label, see `export_shape`.
+        memory_budget: Peak resident memory of all workers in bytes. It is split evenly, and a worker above
+            its share after a job is replaced by a new process.
+        with_shapes: Yield the shapes along with the files written to `export_dir`, e.g. to also place them on
+            plates without building them again.
+
+    """
+    options = _export_options(export_dir, formats, quality, overrides, shapes=with_shapes)
+    workers = workers or os.cpu_count() or 1
+
+    if workers > 1 or memory_budget is not None:
+        yield from _stream(enumerate(jobs), workers, options, memory_budget // workers if memory_budget else None)
+        return
+    for i, job in enumerate(jobs):
+        outcome = _check(job) or _run(job, options)
+        gc.collect()
+        yield _result(i, job, outcome)
+
+
+def build_many(
+    jobs: Sequence[BuildJob],
+    workers: int | None = None,
+    export_dir: str | Path | Mapping[ExportFormat, str | Path] | None = None,
+    formats: Iterable[ExportFormat] = ("stl",),
+    quality: Quality = Quality.ARCHIVAL,
+    overrides: Mapping[str, Quality] | None = None,
+) -> list[BuildResult]:
+    """
+    Build `jobs` in a process pool and return one result per job, in input order.
+
+    A job that fails does not stop the batch; its result carries the error instead. Every job is validated
+    first, so a spec that can never be built fails without taking up a worker. When `export_dir` is
+    given, each worker writes its files and only the paths are sent back, otherwise the built assembly is
+    serialized as compressed BREP with its labels and colors and handed back through shared memory. See
+    `iter_build` to process results as they finish.
+
+    Args:
+        jobs: Socket organizer specs or wrench sets to build.
+        workers: Number of worker processes. Defaults to the CPU count; 1 builds in the current process.
+        export_dir: Directory to export into instead of returning shapes, or a directory per format, which then
+            replaces `formats`.
+        formats: Export formats used with `export_dir`.
+        quality: Tessellation quality used with `export_dir`.
+        overrides: Tessellation quality per child label, see `export_shape`.
+
+    """
+    workers = min(workers or os.cpu_count() or 1, max(len(jobs), 1))
+    return list(iter_build(jobs, workers, export_dir, formats, quality, overrides))
@@ -0,0 +1,128 @@
+"""
+Settings of the boolean operations of the Gridfinity and organizer builders.
+
+Block grids, frames and organizer bodies are each fused or cut in one general boolean over all operands,
+run with the configured `BooleanStrategy`: OCC's parallel mode, an optional fuzzy tolerance, and gluing for
+fuses of solids that only touch. The strategy is set with `configure_booleans` or, e.g. for worker
+processes, the `THINGSMITH_BOOLEAN_PARALLEL`, `THINGSMITH_BOOLEAN_FUZZY` and `THINGSMITH_BOOLEAN_GLUE`
+environment variables. It is part of the keys of cached geometry.
+
+Example:
+    configure_booleans(BooleanStrategy(glue=True, fuzzy=1e-5))
+
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from build123d import Compound, Part
+from build123d.topology import downcast
+from OCP.BOPAlgo import BOPAlgo_GlueOff, BOPAlgo_GlueShift
+from OCP.BRepAlgoAPI import BRepAlgoAPI_BooleanOperation, BRepAlgoAPI_Cut, BRepAlgoAPI_Fuse
+from OCP.ShapeUpgrade import ShapeUpgrade_UnifySameDomain
+from OCP.TopTools import TopTools_ListOfShape
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from build123d import Shape
+
+BOOLEAN_PARALLEL_ENV = "THINGSMITH_BOOLEAN_PARALLEL"
+BOOLEAN_FUZZY_ENV = "THINGSMITH_BOOLEAN_FUZZY"
+BOOLEAN_GLUE_ENV = "THINGSMITH_BOOLEAN_GLUE"
+
+
+class BooleanError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class BooleanStrategy:
+    """
+    How the builders run their booleans.
+
+    Attributes:
+        parallel: Use OCC's parallel mode, which intersects the operands on all cores.
+        fuzzy: Distance in mm below which faces and edges are treated as coincident, or 0 for exact booleans.
+            Helps with near-coincident faces of rounded sizes, at the cost of slightly moved geometry.
+        glue: Fuse the blocks of a grid and the frame on top of it without intersecting their faces, which
+            is faster and valid because these solids only touch.
+
+    """
+
+    parallel: bool = True
+    fuzzy: float = 0.0
+    glue: bool = False
+
+
+_strategy: BooleanStrategy | None = None
+
+
+def configure_booleans(strategy: BooleanStrategy | None = None) -> BooleanStrategy:
+    """Use `strategy` for the booleans of later builds, or the default one with `None`."""
+    global _strategy  # noqa: PLW0603
+    _strategy = strategy or BooleanStrategy()
+    return _strategy
+
+
+def boolean_strategy() -> BooleanStrategy:
+    """Return the active strategy, configuring it from the environment on first use."""
+    if _strategy is None:
+        return configure_booleans(
+            BooleanStrategy(
+                parallel=os.environ.get(BOOLEAN_PARALLEL_ENV, "1") != "0",
+                fuzzy=float(os.environ.get(BOOLEAN_FUZZY_ENV, "0")),
+                glue=os.environ.get(BOOLEAN_GLUE_ENV, "0") != "0",
+            ),
+        )
+    return _strategy
+
+
+def _shapes(shapes: Iterable[Shape]) -> TopTools_ListOfShape:
+    result = TopTools_ListOfShape()
+    for shape in shapes:
+        if shape.wrapped is not None:
+            result.Append(shape.wrapped)
+    return result
+
+
+def _run(operation: BRepAlgoAPI_BooleanOperation, arguments: list[Shape], tools: list[Shape]) -> Part:
+    if not tools:
+        # OCC fails a boolean without tools
+        return Part([solid for shape in arguments for solid in shape.solids()])
+    strategy = boolean_strategy()
+    operation.SetArguments(_shapes(arguments))
+    operation.SetTools(_shapes(tools))
+    operation.SetRunParallel(strategy.parallel)
+    if strategy.fuzzy:
+        operation.SetFuzzyValue(strategy.fuzzy)
+    operation.Build()
+    if not operation.IsDone():
+        msg = f"{type(operation).__name__} failed"
+        raise BooleanError(msg)
+
+    # merge the faces and edges split by the operation, as build123d does after each boolean
+    unify = ShapeUpgrade_UnifySameDomain(operation.Shape(), UnifyEdges=True, UnifyFaces=True, ConcatBSplines=True)
+    unify.AllowInternalEdges(theValue=False)
+    unify.Build()
+    return Part(Compound(downcast(unify.Shape())).solids())
+
+
+def fuse(shapes: Iterable[Shape], *, touching: bool = False) -> Part:
+    """
+    Fuse `shapes` in one boolean.
+
+    With `touching`, the shapes only share faces and do not overlap, so the strategy may glue them.
+    """
+    shapes = list(shapes)
+    operation = BRepAlgoAPI_Fuse()
+    operation.SetGlue(BOPAlgo_GlueShift if touching and boolean_strategy().glue else BOPAlgo_GlueOff)
+    return _run(operation, shapes[:1], shapes[1:])
+
+
+def cut(shape: Shape, tools: Iterable[Shape]) -> Part:
+    """Cut every tool out of `shape` in one boolean."""
+    return _run(BRepAlgoAPI_Cut(), [shape], list(tools))
@@ -0,0 +1,140 @@
+"""
+Persistent, content-addressed cache of built geometry.
+
+Shapes are stored as BREP files named by the `fingerprint` of the build parameters, which covers the `GF`
+constants and the library versions, so a cached file is never reused for a different input. The cache is disabled unless
+a directory is configured with `configure_brep_cache` or the `THINGSMITH_CACHE_DIR` environment variable.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from build123d import Part
+
+from thingsmith._transfer import deserialize_shape, serialize_shape
+from thingsmith.fingerprint import fingerprint
+from thingsmith.profiling import traced
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+CACHE_DIR_ENV = "THINGSMITH_CACHE_DIR"
+CACHE_MAX_BYTES_ENV = "THINGSMITH_CACHE_MAX_BYTES"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+_SUFFIX = ".brep"
+
+
+class BrepCache:
+    """Directory of BREP files with size-bounded least-recently-used eviction."""
+
+    def __init__(self, directory: str | os.PathLike[str], max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(kind: str, **params: Any) -> str:  # noqa: ANN401
+        """Return the content address for a `kind` of shape built from `params`."""
+        return fingerprint((kind, params)).hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+    @traced("cache.load")
+    def load(self, key: str) -> Part | None:
+        path = self.path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            shape = deserialize_shape(data)
+        except Exception:  # noqa: BLE001
+            # a truncated or foreign file is treated as a miss and replaced on the next store
+            path.unlink(missing_ok=True)
+            return None
+        path.touch()
+        return Part(shape)
+
+    @traced("cache.store")
+    def store(self, key: str, shape: Part) -> None:
+        data = serialize_shape(shape.wrapped)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            Path(tmp).replace(self.path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def get(self, key: str, build: Callable[[], Part | None]) -> Part | None:
+        """Return the cached shape for `key`, calling `build` and storing its result on a miss."""
+        shape = self.load(key)
+        if shape is not None:
+            return shape
+        shape = build()
+        if shape is not None:
+            self.store(key, shape)
+        return shape
+
+    def size(self) -> int:
+        return sum(p.stat().st_size for p in self.directory.glob(f"*{_SUFFIX}"))
+
+    def evict(self) -> None:
+        """Delete the least recently used entries until the cache fits in `max_bytes`."""
+        entries = []
+        for p in self.directory.glob(f"*{_SUFFIX}"):
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+        total = sum(size for _, size, _ in entries)
+        for _, size, p in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            p.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        for p in self.directory.glob(f"*{_SUFFIX}"):
+            p.unlink(missing_ok=True)
+
+
+_brep_cache: BrepCache | None = None
+_configured = False
+
+
+def configure_brep_cache(
+    directory: str | os.PathLike[str] | None,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> BrepCache | None:
+    """Use `directory` for the persistent geometry cache, or disable it with `None`."""
+    global _brep_cache, _configured  # noqa: PLW0603
+    _brep_cache = BrepCache(directory, max_bytes) if directory is not None else None
+    _configured = True
+    return _brep_cache
+
+
+def brep_cache() -> BrepCache | None:
+    """Return the active persistent cache, configuring it from the environment on first use."""
+    if not _configured:
+        directory = os.environ.get(CACHE_DIR_ENV)
+        max_bytes = int(os.environ.get(CACHE_MAX_BYTES_ENV, DEFAULT_MAX_BYTES))
+        configure_brep_cache(directory or None, max_bytes)
+    return _brep_cache
+
+
+def cached_part(kind: str, params: dict[str, Any], build: Callable[[], Part | None]) -> Part | None:
+    """Build a part through the persistent cache when one is configured."""
+    cache = brep_cache()
+    if cache is None:
+        return build()
+    return cache.get(BrepCache.key(kind, **params), build)
@@ -0,0 +1,128 @@
+"""
+Declarative catalogs of organizers.
+
+A catalog is a TOML file listing socket and wrench organizers. Every key of a `[[socket]]` or `[[wrench]]`
+entry other than the ones describing the tools is an `OrganizerSpec` field, and the `[socket_defaults]` and
+`[wrench_defaults]` tables apply to every entry of that kind:
+
+    [socket_defaults]
+    align = "bottom"
+    organizer_split_face_plate = 2
+
+    [[socket]]
+    drive = "1/4"
+    types = ["metric", "six_point"]
+    sizes = [[4, 11.9], [5, 11.9], [6, 11.9]]  # size and diameter in mm; SAE sizes may be fractions like "3/8"
+    organizer_label = '1/4"'
+
+    [[wrench]]
+    sizes = [8, 13, 14, 15, 17]
+    unit = "metric"
+    grid_y = 2
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import tomllib
+from fractions import Fraction
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from thingsmith import drive_socket, wrench
+from thingsmith._jobs import BuildJob, WrenchSet
+from thingsmith.fingerprint import fingerprint
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from thingsmith.export import ExportFormat, Quality
+
+
+class CatalogError(ValueError):
+    def __init__(self, entry: str, message: str) -> None:
+        super().__init__(f"{entry}: {message}")
+
+
+def _size(value: float | str) -> float:
+    return float(Fraction(value)) if isinstance(value, str) else value
+
+
+def _spec_fields[T](cls: type[T], entry: str, values: dict[str, Any]) -> T:
+    names = {f.name for f in dataclasses.fields(cls)}  # type: ignore[arg-type]
+    unknown = sorted(values.keys() - names)
+    if unknown:
+        raise CatalogError(entry, f"unknown spec field(s) {', '.join(unknown)}")
+    values = dict(values)
+    # TOML arrays are lists, the specs take tuples
+    for name in ("face_color", "organizer_label_padding"):
+        if isinstance(values.get(name), list):
+            values[name] = tuple(values[name])
+    return cls(**values)
+
+
+def _socket_job(entry: str, values: dict[str, Any]) -> drive_socket.OrganizerSpec:
+    try:
+        drive = values.pop("drive")
+        types = values.pop("types", [])
+        sizes = values.pop("sizes")
+    except KeyError as ex:
+        raise CatalogError(entry, f"{ex.args[0]} is required") from None
+    try:
+        builder = drive_socket.SocketBuilder().drive(str(drive)).type(drive_socket.SocketType(0))
+        for t in types:
+            builder = builder.add_type(drive_socket.SocketType[t.upper()])
+    except (KeyError, ValueError) as ex:
+        raise CatalogError(entry, f"invalid drive or socket type {ex}") from None
+    try:
+        sockets = [builder.size(_size(size)).diameter(diameter).build() for size, diameter in sizes]
+    except (TypeError, ValueError, ZeroDivisionError) as ex:
+        raise CatalogError(entry, f"sizes must be [size, diameter] pairs: {ex}") from None
+    return _spec_fields(drive_socket.OrganizerSpec, entry, {**values, "sockets": sockets})
+
+
+def _wrench_job(entry: str, values: dict[str, Any]) -> WrenchSet:
+    try:
+        sizes = values.pop("sizes")
+        unit = wrench.WrenchUnit[values.pop("unit", "metric").upper()]
+    except KeyError as ex:
+        raise CatalogError(entry, f"sizes is required or unit {ex} is unknown") from None
+    try:
+        wrenches = [wrench.Wrench(size, unit=unit) for size in sizes]
+    except (TypeError, ValueError, ZeroDivisionError) as ex:
+        raise CatalogError(entry, f"invalid sizes: {ex}") from None
+    return WrenchSet(wrenches, _spec_fields(wrench.OrganizerSpec, entry, values))
+
+
+def parse_catalog(data: dict[str, Any]) -> list[BuildJob]:
+    """Return the build jobs of a parsed catalog, socket organizers first."""
+    jobs: list[BuildJob] = []
+    socket_defaults = data.get("socket_defaults", {})
+    for i, entry in enumerate(data.get("socket", [])):
+        jobs.append(_socket_job(f"socket[{i}]", {**socket_defaults, **entry}))
+    wrench_defaults = data.get("wrench_defaults", {})
+    for i, entry in enumerate(data.get("wrench", [])):
+        jobs.append(_wrench_job(f"wrench[{i}]", {**wrench_defaults, **entry}))
+    return jobs
+
+
+def load_catalog(path: str | Path) -> list[BuildJob]:
+    """
+    Read the catalog at `path` and return its build jobs.
+
+    Raises:
+        CatalogError: If an entry is missing a required key, has malformed sizes or names an unknown spec field.
+
+    """
+    with Path(path).open("rb") as f:
+        return parse_catalog(tomllib.load(f))
+
+
+def job_hash(job: BuildJob, formats: Iterable[ExportFormat], quality: Quality) -> str:
+    """
+    Return a hash of everything the files exported for `job` depend on.
+
+    Besides the spec this covers the export settings and the `fingerprint` environment: library versions,
+    `GF` constants and fonts. The files of an unchanged hash can be reused.
+    """
+    return fingerprint((job, sorted(formats), quality)).hexdigest()
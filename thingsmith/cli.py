@@ -0,0 +1,158 @@
+"""
+Build a catalog of organizers from the command line.
+
+    thingsmith catalog.toml -o build -j 8 --format stl --format 3mf
+    thingsmith catalog.toml --check
+
+A manifest in the output directory maps the hash of each built job to its files. It is saved after every
+finished job, and jobs whose hash is in the manifest and whose files still exist are skipped, so only changed
+organizers are rebuilt, also after an interrupted run. Catalogs in which two organizers export under the same
+name are rejected. With `--check`, the catalog is only parsed and validated, which does not load the geometry
+modules.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+from thingsmith._formats import ExportFormat, Quality
+from thingsmith._jobs import job_name, validate
+from thingsmith._validation import InvalidSpecError
+from thingsmith.catalog import job_hash, load_catalog
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from thingsmith._jobs import BuildJob
+
+MANIFEST_NAME = ".thingsmith-manifest.json"
+
+
+class Manifest:
+    """Files exported per job hash, stored as JSON."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries: dict[str, list[str]] = {}
+        if path.exists():
+            try:
+                self.entries = json.loads(path.read_text())
+            except ValueError:
+                # a broken manifest only costs a rebuild
+                self.entries = {}
+
+    def up_to_date(self, key: str) -> bool:
+        files = self.entries.get(key)
+        if not files:
+            return False
+        return all((self.path.parent / f).exists() for f in files)
+
+    def save(self, keep: set[str]) -> None:
+        """Write the manifest, dropping the entries of jobs that are no longer in the catalog."""
+        entries = {k: v for k, v in sorted(self.entries.items()) if k in keep}
+        # replace the file in one step, so an interrupted run cannot leave it half written
+        partial = self.path.with_name(self.path.name + ".partial")
+        partial.write_text(json.dumps(entries, indent=2))
+        partial.replace(self.path)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="thingsmith", description="Build the organizers in a catalog file")
+    parser.add_argument("catalog", type=Path, help="TOML catalog of socket and wrench organizers")
+    parser.add_argument("-o", "--output", type=Path, default=Path("build"), help="directory to export into")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes, defaults to the CPU count")
+    parser.add_argument("--format", action="append", choices=["stl", "3mf"], dest="formats", help="default stl")
+    parser.add_argument(
+        "--quality",
+        choices=[q.name.lower() for q in Quality],
+        default=Quality.ARCHIVAL.name.lower(),
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=int,
+        metavar="MB",
+        help="resident memory of all workers; a worker above its share is restarted between jobs",
+    )
+    parser.add_argument("--check", action="store_true", help="validate the catalog without building anything")
+    parser.add_argument("--force", action="store_true", help="rebuild everything, ignoring the manifest")
+    return parser
+
+
+def _check(jobs: Sequence[BuildJob]) -> int:
+    failed = 0
+    for i, job in enumerate(jobs):
+        errors = validate(job)
+        if errors:
+            failed += 1
+            print(f"invalid job {i}: {InvalidSpecError(errors)}", file=sys.stderr)
+    print(f"{len(jobs) - failed} of {len(jobs)} valid")
+    return 1 if failed else 0
+
+
+def _name_clashes(jobs: Sequence[BuildJob]) -> list[str]:
+    """Describe the names that more than one valid job would export under, overwriting each other's files."""
+    indices: dict[str, list[int]] = {}
+    for i, job in enumerate(jobs):
+        # invalid jobs are reported on their own and export nothing
+        if not validate(job):
+            indices.setdefault(job_name(job), []).append(i)
+    return [
+        f"jobs {', '.join(map(str, same))} all export as {name!r}" for name, same in indices.items() if len(same) > 1
+    ]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parser().parse_args(argv)
+    formats = cast("list[ExportFormat]", args.formats or ["stl"])
+    quality = Quality[args.quality.upper()]
+
+    try:
+        jobs = load_catalog(args.catalog)
+    except (OSError, ValueError) as ex:  # CatalogError and TOML syntax errors are ValueErrors
+        print(f"thingsmith: {ex}", file=sys.stderr)
+        return 2
+    clashes = _name_clashes(jobs)
+    if clashes:
+        for clash in clashes:
+            print(f"thingsmith: {clash}; give them distinct names", file=sys.stderr)
+        return 2
+    if args.check:
+        return _check(jobs)
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    manifest = Manifest(args.output / MANIFEST_NAME)
+    keys = [job_hash(job, formats, quality) for job in jobs]
+    todo = [i for i, key in enumerate(keys) if args.force or not manifest.up_to_date(key)]
+    print(f"{len(jobs) - len(todo)} up to date, building {len(todo)}")
+    # files of a job being rebuilt are not valid until it succeeds again
+    for i in todo:
+        manifest.entries.pop(keys[i], None)
+    keep = set(keys)
+    manifest.save(keep)
+
+    # building loads build123d, which is slow to import and not needed for the checks above
+    from thingsmith.batch import iter_build  # noqa: PLC0415
+
+    failed = 0
+    budget = args.max_memory * 2**20 if args.max_memory else None
+    workers = min(args.jobs or os.cpu_count() or 1, max(len(todo), 1))
+    for result in iter_build((jobs[i] for i in todo), workers, args.output, formats, quality, memory_budget=budget):
+        i = todo[result.index]
+        if result.ok:
+            manifest.entries[keys[i]] = [f.relative_to(args.output).as_posix() for f in result.files]
+            manifest.save(keep)
+            for f in result.files:
+                print(f"built {f}")
+        else:
+            failed += 1
+            print(f"failed {result.name or f'job {i}'}:\n{result.error}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
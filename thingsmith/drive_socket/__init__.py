@@ -1,12 +1,35 @@
-from thingsmith.drive_socket._organizer import Organizer
+from typing import TYPE_CHECKING
+
+from thingsmith._imports import lazy_attributes
+from thingsmith._validation import InvalidSpecError, SpecError
+from thingsmith.drive_socket._partition import SocketTooLargeError, partition
 from thingsmith.drive_socket._socket import DriveSize, Socket, SocketBuilder, SocketType
+from thingsmith.drive_socket._socket_set import SocketSet
 from thingsmith.drive_socket._spec import OrganizerSpec
 
+if TYPE_CHECKING:
+    from thingsmith.drive_socket._organizer import LazyOrganizer, Organizer
+
 __all__ = [
     "DriveSize",
+    "InvalidSpecError",
+    "LazyOrganizer",
     "Organizer",
     "OrganizerSpec",
     "Socket",
     "SocketBuilder",
+    "SocketSet",
+    "SocketTooLargeError",
     "SocketType",
+    "SpecError",
+    "partition",
 ]
+
+# the organizers import build123d, so they are loaded on first use
+__getattr__ = lazy_attributes(
+    __name__,
+    {
+        "LazyOrganizer": "thingsmith.drive_socket._organizer",
+        "Organizer": "thingsmith.drive_socket._organizer",
+    },
+)
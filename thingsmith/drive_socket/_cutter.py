@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import copy
+
+from build123d import Axis, BuildPart, BuildSketch, Compound, Location, Plane, Polygon, Solid, Vector, revolve
+
+from thingsmith._cache import LRUCache
+
+cutter_cache: LRUCache[tuple[float, float, float, float], Solid] = LRUCache(maxsize=64)
+"""Chamfered insert cutters, keyed by diameter, depth and top/bottom chamfer length."""
+
+
+def _build_cutter(diameter: float, depth: float, chamfer_top: float, chamfer_bottom: float) -> Solid:
+    r = diameter / 2
+    # half profile of the pocket: the top chamfer widens the opening, the bottom chamfer rounds off the floor
+    profile = [
+        (0, 0),
+        (r + chamfer_top, 0),
+        (r, -chamfer_top),
+        (r, -depth + chamfer_bottom),
+        (r - chamfer_bottom, -depth),
+        (0, -depth),
+    ]
+    # drop the extra points of a zero length chamfer
+    points = [p for i, p in enumerate(profile) if p != profile[i - 1]]
+    with BuildPart() as cutter:
+        with BuildSketch(Plane.XZ):
+            Polygon(*points, align=None)
+        revolve(axis=Axis.Z)
+    return cutter.part.solid()
+
+
+def insert_cutter(diameter: float, depth: float, chamfer_top: float = 0, chamfer_bottom: float = 0) -> Solid:
+    """
+    Return a copy of the cached cutter for a socket insert, with the top of the pocket at the origin.
+
+    Cutting the pocket and its chamfers in one tool avoids chamfering the organizer base afterwards.
+    """
+    key = (diameter, depth, chamfer_top, chamfer_bottom)
+    cutter = cutter_cache.get(key, lambda: _build_cutter(*key))
+    return copy.deepcopy(cutter)
+
+
+def insert_cutters(
+    pockets: list[tuple[Vector, float]],
+    depth: float,
+    chamfer_top: float = 0,
+    chamfer_bottom: float = 0,
+) -> Compound:
+    """Place one cutter per `(center, diameter)` pocket, sharing a single copy between equal diameters."""
+    cutters: dict[float, Solid] = {}
+    placed = []
+    for center, diameter in pockets:
+        if diameter not in cutters:
+            cutters[diameter] = insert_cutter(diameter, depth, chamfer_top, chamfer_bottom)
+        placed.append(cutters[diameter].moved(Location(center)))
+    return Compound(placed)
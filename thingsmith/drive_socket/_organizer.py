@@ -1,6 +1,4 @@
-import operator
-from collections.abc import Generator
-from functools import reduce
+from collections.abc import Hashable
 
 from build123d import (
     Align,
@@ -8,7 +6,6 @@ from build123d import (
     BasePartObject,
     BuildPart,
     BuildSketch,
-    Circle,
     Color,
     Keep,
     Locations,
@@ -16,36 +13,33 @@ from build123d import (
     Part,
     Plane,
     RotationLike,
-    Select,
-    Text,
     Vector,
-    chamfer,
+    add,
     extrude,
     fillet,
     split,
 )
 
-from thingsmith._gridfinity import (
-    GF,
-    OrganizerFrame,
-)
-from thingsmith.drive_socket._socket import Socket
-from thingsmith.drive_socket._spec import OrganizerSpec
+from thingsmith import _lazy
+from thingsmith._color import rgba, to_color
+from thingsmith._gridfinity import GF, OrganizerFrame
+from thingsmith._label import Label
+from thingsmith._layout import SocketLayout, socket_layout
+from thingsmith._parts import cached_child
+from thingsmith.booleans import cut
+from thingsmith.drive_socket._cutter import insert_cutters
+from thingsmith.drive_socket._spec import OrganizerSpec, insert_chamfers, organizer_name
+from thingsmith.profiling import span
 
 default_base_color = Color(0x000000)
 default_label_color = Color(0xFFFFFF)
 
 
-def _next_insert(spec: OrganizerSpec) -> Generator[tuple[Socket, float]]:
-    distance = spec.edge_padding_x
-    for s in spec.sockets:
-        yield s, distance
-        distance += s.diameter_mm + spec.insert_diameter_offset + spec.insert_offset
-
-
 class Organizer(BasePartObject):
     spec: OrganizerSpec
     name: str
+    grid_x: int
+    grid_y: int
 
     def __init__(
         self,
@@ -55,85 +49,100 @@ class Organizer(BasePartObject):
         mode: Mode = Mode.ADD,
     ) -> None:
         self.spec = spec
+        self.grid_x = spec.grid_x
+        self.grid_y = spec.grid_y
         parts = []
+        layout = socket_layout(spec)
 
-        base = self._build_base(spec)
+        # each child is cached by the values it reads, so e.g. a new organizer label only rebuilds the face label
+        with span("socket.base"):
+            base = cached_child("socket.base", self._base_key(spec, layout), lambda: self._build_base(spec, layout))
         if not base:
             return
         parts.append(base)
 
         if spec.insert_labels:
-            labels = self._build_insert_labels(spec, base)
-            if labels and labels.part:
-                self.labels = labels.part
-                parts.append(labels.part)
+            with span("socket.insert_labels", count=len(spec.sockets)):
+                labels = cached_child(
+                    "socket.insert_labels",
+                    self._insert_labels_key(spec, layout),
+                    lambda: self._build_insert_labels(spec, layout),
+                )
+            if labels:
+                self.labels = labels
+                parts.append(labels)
 
         if spec.organizer_label:
-            label = self._build_face_label(spec, base)
-            if label and label.part:
-                self.label = label.part
-                parts.append(label.part)
+            with span("socket.face_label"):
+                label = cached_child(
+                    "socket.face_label",
+                    self._face_label_key(spec, layout),
+                    lambda: self._build_face_label(spec, layout),
+                )
+            if label:
+                self.label = label
+                parts.append(label)
 
-        self.name = spec.name or self._generate_name()
+        self.name = organizer_name(spec)
         super().__init__(Part(label=self.name, children=parts), rotation, align, mode)
 
-    def _generate_name(self) -> str:
-        spec = self.spec
-        sizes = [s.size for s in spec.sockets]
-        drives = list({str(s.drive.value) for s in spec.sockets})
-        units = reduce(operator.or_, [reduce(operator.or_, s.unit) for s in spec.sockets if s.unit])
-        types = reduce(operator.or_, [reduce(operator.or_, s.socket_type) for s in spec.sockets]) & ~units
-        name = "socket-organizer"
-        name += f"-{'|'.join([u.name for u in units if u.name])}[{min(sizes)}-{max(sizes)}]"
-        name += f"-drive[{','.join(drives)}]"
-        name += f"-type[{','.join([t.name for t in types if t.name])}]"
-        return name
+    @staticmethod
+    def _base_key(spec: OrganizerSpec, layout: SocketLayout) -> tuple[Hashable, ...]:
+        return (
+            spec.grid_x,
+            spec.grid_y,
+            spec.corner_radius,
+            spec.base_height,
+            spec.edge_fillet,
+            tuple((i.center, i.diameter) for i in layout.inserts),
+            spec.insert_depth,
+            insert_chamfers(spec),
+            layout.top,
+            spec.organizer_split_face_plate,
+            rgba(spec.face_color) if spec.organizer_split_face_plate else None,
+        )
 
     @staticmethod
-    def _build_base(spec: OrganizerSpec, color: Color = default_base_color) -> Part | None:
+    def _insert_labels_key(spec: OrganizerSpec, layout: SocketLayout) -> tuple[Hashable, ...]:
+        return (
+            tuple(s.get_print_label() for s in spec.sockets),
+            tuple(layout.insert_labels),
+            spec.insert_labels_size,
+            spec.font,
+        )
+
+    @staticmethod
+    def _face_label_key(spec: OrganizerSpec, layout: SocketLayout) -> tuple[Hashable, ...]:
+        return spec.organizer_label, layout.face_label, spec.font
+
+    @staticmethod
+    def _build_base(spec: OrganizerSpec, layout: SocketLayout, color: Color = default_base_color) -> Part | None:
         with BuildPart() as base:
-            OrganizerFrame(
-                height=spec.base_height,
-                grid_x=spec.grid_x,
-                grid_y=spec.grid_y,
-                radius=spec.corner_radius,
-                align=Align.MIN,
-            )
-
-            top_face = base.faces().sort_by(Axis.Z)[-1]
-            fillet(top_face.edges(), radius=spec.edge_fillet)
-
-            if spec.align == "center":
-                origin_y = top_face.center().Y
-                align = (Align.MIN, Align.CENTER)
-                y_offset = 0
-            elif spec.align == "bottom":
-                origin_y = top_face.edges().sort_by(Axis.Y)[0].edges()[0].vertices()[0].Y
-                align = (Align.MIN, Align.MIN)
-                y_offset = int((spec.length_y - max([s.diameter_mm for s in spec.sockets])) / 2)
-            origin_x = top_face.edges().sort_by(Axis.X)[0].edges()[0].vertices()[0].X
-            origin_z = spec.base_height + GF.HEIGHT_UNIT
-            origin = Vector(X=origin_x, Y=origin_y, Z=origin_z)
-
-            y_offset = int(y_offset + spec.align_offset)
-            if spec.insert_labels:
-                y_offset = int(y_offset + spec.insert_labels_size / 2)
-
-            with BuildSketch(Plane(origin=origin)):
-                for s, distance in _next_insert(spec):
-                    with Locations((distance, y_offset)):
-                        Circle(radius=(s.diameter_mm + spec.insert_diameter_offset) / 2, align=align)
-            extrude(amount=-spec.insert_depth, mode=Mode.SUBTRACT, target=base.part)
-            if spec.insert_chamfer:
-                edges = base.edges(Select.LAST).group_by(Axis.Z)
-                chamfer(edges[0], length=spec.insert_chamfer_bottom)
-                chamfer(edges[-1], length=spec.insert_chamfer_top)
+            with span("socket.frame", grid_x=spec.grid_x, grid_y=spec.grid_y):
+                OrganizerFrame(
+                    height=spec.base_height,
+                    grid_x=spec.grid_x,
+                    grid_y=spec.grid_y,
+                    radius=spec.corner_radius,
+                    align=Align.MIN,
+                )
+
+            with span("socket.fillet"):
+                top_face = base.faces().sort_by(Axis.Z)[-1]
+                fillet(top_face.edges(), radius=spec.edge_fillet)
+
+            with span("socket.pockets", count=len(layout.inserts)):
+                pockets = [(Vector(*i.center), i.diameter) for i in layout.inserts]
+                # every pocket, chamfers included, is cut in a single boolean
+                cutters = insert_cutters(pockets, spec.insert_depth, *insert_chamfers(spec))
+                add(cut(base.part, cutters.solids()), mode=Mode.REPLACE)
 
             if spec.organizer_split_face_plate:
-                split(
-                    bisect_by=Plane(base.faces().sort_by(Axis.Z)[-1]).offset(-spec.organizer_split_face_plate),
-                    keep=Keep.BOTH,
-                )
+                with span("socket.split"):
+                    split(
+                        bisect_by=Plane.XY.offset(layout.top - spec.organizer_split_face_plate),
+                        keep=Keep.BOTH,
+                    )
 
         solids = base.solids().sort_by(Axis.Z)
         if len(solids) == 0:
@@ -144,27 +153,20 @@ class Organizer(BasePartObject):
 
         if spec.organizer_split_face_plate:
             solids[1].label = "Face Plate"
-            solids[1].color = spec.face_color
+            solids[1].color = to_color(spec.face_color)
         return Part(children=solids, label="Base")
 
     @staticmethod
     def _build_insert_labels(
         spec: OrganizerSpec,
-        base: Part,
+        layout: SocketLayout,
         color: Color = default_label_color,
-    ) -> BuildPart | None:
-        top_face = base.faces().sort_by(Axis.Z)[-1]
-        origin_x = top_face.edges().sort_by(Axis.X)[0].edges()[0].vertices()[0].X
-        origin_y = top_face.edges().sort_by(Axis.Y)[0].edges()[0].vertices()[0].Y
-        origin_z = spec.base_height + GF.HEIGHT_UNIT
-        origin = Vector(X=origin_x, Y=origin_y, Z=origin_z)
-
+    ) -> Part | None:
         with BuildPart() as labels:
-            with BuildSketch(Plane(origin=origin)):
-                for s, distance in _next_insert(spec):
-                    x = distance + (s.diameter_mm + spec.insert_diameter_offset) / 2
-                    with Locations((x, spec.edge_padding_y)):
-                        Text(
+            with BuildSketch(Plane.XY.offset(layout.top)):
+                for s, (x, y, _) in zip(spec.sockets, layout.insert_labels, strict=True):
+                    with Locations((x, y)):
+                        Label(
                             f"{s.get_print_label()}",
                             spec.insert_labels_size,
                             align=(Align.CENTER, Align.MIN),
@@ -177,28 +179,17 @@ class Organizer(BasePartObject):
 
         labels.part.color = color
         labels.part.label = "Labels"
-        return labels
+        return labels.part
 
     @staticmethod
     def _build_face_label(
         spec: OrganizerSpec,
-        base: Part,
+        layout: SocketLayout,
         color: Color = default_label_color,
-    ) -> BuildPart | None:
-        if spec.organizer_label_padding is None:
-            padding_x, padding_y = spec.edge_padding_x, spec.edge_padding_y
-        else:
-            padding_x, padding_y = spec.organizer_label_padding
-
-        top_face = base.faces().sort_by(Axis.Z)[-1]
-        origin_x = top_face.edges().sort_by(Axis.X)[0].edges()[0].vertices()[0].X
-        origin_y = top_face.edges().sort_by(Axis.Y)[-1].edges()[0].vertices()[0].Y
-        origin_z = spec.base_height + GF.HEIGHT_UNIT
-        origin = Vector(X=origin_x + padding_x, Y=origin_y - padding_y, Z=origin_z)
-
+    ) -> Part | None:
         with BuildPart() as label:
-            with BuildSketch(Plane(origin=origin)):
-                Text(spec.organizer_label, 6, align=(Align.MIN, Align.MAX), font=spec.font)
+            with BuildSketch(Plane(origin=layout.face_label)):
+                Label(spec.organizer_label, 6, align=(Align.MIN, Align.MAX), font=spec.font)
             extrude(amount=0.75)
 
         if not label.part:
@@ -206,4 +197,22 @@ class Organizer(BasePartObject):
 
         label.part.color = color
         label.part.label = "Face Label"
-        return label
+        return label.part
+
+
+class LazyOrganizer(_lazy.LazyOrganizer):
+    """
+    A socket organizer whose name, size and export paths are available without building it.
+
+    The geometry is built on first access of `shape` or on `export`.
+    """
+
+    def __init__(self, spec: OrganizerSpec) -> None:
+        self.spec = spec
+        self.name = organizer_name(spec)
+        self.grid_x = spec.grid_x
+        self.grid_y = spec.grid_y
+        self.height = spec.base_height + GF.HEIGHT_UNIT
+
+    def _build(self) -> Organizer:
+        return Organizer(self.spec)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import dataclasses
+import math
+from typing import TYPE_CHECKING
+
+from thingsmith.drive_socket._socket import SocketType
+from thingsmith.drive_socket._socket_set import SocketSet
+from thingsmith.drive_socket._spec import OrganizerSpec
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable, Sequence
+
+    from thingsmith.drive_socket._socket import Socket
+
+
+class SocketTooLargeError(ValueError):
+    def __init__(self, s: Socket, max_grid_x: int, max_grid_y: int) -> None:
+        super().__init__(f"{s.get_description()} does not fit an organizer of {max_grid_x}x{max_grid_y} grid units")
+
+
+def _group_key(same_drive: bool, same_depth: bool, same_unit: bool) -> Callable[[Socket], Hashable]:  # noqa: FBT001
+    def key(s: Socket) -> Hashable:
+        return (
+            s.drive if same_drive else None,
+            s.has_type(SocketType.DEEP) if same_depth else None,
+            s.unit if same_unit else None,
+        )
+
+    return key
+
+
+def _min_grid_y(template: OrganizerSpec, s: Socket, max_grid_y: int) -> int | None:
+    """Return the fewest grid units in Y that fit `s` on its own, or None if even `max_grid_y` is too small."""
+    for grid_y in range(1, max_grid_y + 1):
+        spec = dataclasses.replace(template, sockets=[s], grid_y=grid_y, grid_x_min=1)
+        if not any(e.field == "grid_y" for e in spec.validate()):
+            return grid_y
+    return None
+
+
+def _partition_group(
+    grid_x: Sequence[Sequence[int]],
+    grid_y: Sequence[int],
+    max_grid_x: int,
+) -> list[tuple[int, int, int]]:
+    """
+    Split sockets into runs that keep their order and use the fewest grid units in total.
+
+    `grid_x[i][k]` is the width of an organizer holding sockets `i` to `i + k`, or more than `max_grid_x` once
+    the run no longer fits, and every socket must fit an organizer on its own. Returns `(start, end, grid_y)`
+    per organizer. The optimal split is a shortest path over the gaps between sockets; a run only extends until
+    it no longer fits `max_grid_x`, so this stays linear in the number of sockets for a fixed organizer size.
+    """
+    n = len(grid_y)
+    # fewest (grid units, organizers) to hold the first j sockets, and where the last organizer of that starts
+    best: list[tuple[float, int]] = [(0, 0)] + [(math.inf, 0)] * n
+    start = [0] * (n + 1)
+    for i in range(n):
+        run_grid_y = 0
+        for j, run_grid_x in enumerate(grid_x[i], i + 1):
+            if run_grid_x > max_grid_x:
+                break
+            run_grid_y = max(run_grid_y, grid_y[j - 1])
+            cost = (best[i][0] + run_grid_x * run_grid_y, best[i][1] + 1)
+            if cost < best[j]:
+                best[j] = cost
+                start[j] = i
+
+    runs = []
+    end = n
+    while end > 0:
+        begin = start[end]
+        runs.append((begin, end, max(grid_y[begin:end])))
+        end = begin
+    return runs[::-1]
+
+
+def partition(
+    sockets: Iterable[Socket],
+    template: OrganizerSpec | None = None,
+    max_grid_x: int = 5,
+    max_grid_y: int = 1,
+    *,
+    same_drive: bool = True,
+    same_depth: bool = True,
+    same_unit: bool = True,
+    sort: bool = True,
+) -> list[OrganizerSpec]:
+    """
+    Split a socket catalog into organizers using the fewest grid units.
+
+    Sockets are grouped by drive, depth (deep or standard) and unit, groups keep the order in which they first
+    appear, and each group is split into organizers holding consecutive sockets. Every organizer is a copy of
+    `template` with its sockets and the smallest `grid_y` that fits them.
+
+    Args:
+        sockets: Sockets to organize.
+        template: Settings for every organizer; its `sockets` and `grid_y` are replaced.
+        max_grid_x: Largest organizer width in grid units.
+        max_grid_y: Largest organizer depth in grid units.
+        same_drive: Keep sockets of different drive sizes apart.
+        same_depth: Keep deep and standard sockets apart.
+        same_unit: Keep metric and SAE sockets apart.
+        sort: Order sockets by size within each organizer, otherwise keep their input order.
+
+    Raises:
+        SocketTooLargeError: If a socket does not fit an organizer of the maximum size.
+
+    """
+    template = template or OrganizerSpec(sockets=[])
+    key = _group_key(same_drive, same_depth, same_unit)
+    groups: dict[Hashable, list[Socket]] = {}
+    for s in sockets:
+        groups.setdefault(key(s), []).append(s)
+
+    min_grid_y: dict[float, int | None] = {}
+    specs = []
+    for group in groups.values():
+        if sort:
+            group.sort(key=lambda s: (s.size, s.diameter_mm))
+        # the widths of every run that fits are computed at once
+        grid_x = SocketSet(group).run_grid_x(template, max_grid_x).tolist()
+        grid_y = []
+        for i, s in enumerate(group):
+            if s.diameter_mm not in min_grid_y:
+                min_grid_y[s.diameter_mm] = _min_grid_y(template, s, max_grid_y)
+            fit = min_grid_y[s.diameter_mm]
+            if fit is None or grid_x[i][0] > max_grid_x:
+                raise SocketTooLargeError(s, max_grid_x, max_grid_y)
+            grid_y.append(fit)
+
+        for begin, end, run_grid_y in _partition_group(grid_x, grid_y, max_grid_x):
+            specs.append(dataclasses.replace(template, sockets=group[begin:end], grid_y=run_grid_y))
+    return specs
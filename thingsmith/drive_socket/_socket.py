@@ -1,11 +1,13 @@
 import operator
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, Flag, auto
 from fractions import Fraction
 from functools import reduce
 from typing import Any, Literal, Self, cast
 
+from thingsmith.fingerprint import LABEL_FIELD
+
 
 class DriveSize(Enum):
     QUARTER_INCH = 0.25
@@ -84,7 +86,7 @@ class SocketTypeCombinationError(Exception):
 class Socket:
     socket_type: SocketType
     drive: DriveSize
-    size: SocketSize
+    size: SocketSize = field(metadata=LABEL_FIELD)
     name: str | None = None
     diameter_mm: float = 0
     height_mm: float = 0
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import functools
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, overload
+
+import numpy as np
+
+from thingsmith._gridfinity.spec import GF
+from thingsmith.drive_socket._socket import Socket, SocketType
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    import numpy.typing as npt
+
+    from thingsmith.drive_socket._spec import OrganizerSpec
+
+
+class SocketSet(Sequence[Socket]):
+    """
+    Immutable, column-oriented collection of sockets for layout math.
+
+    Sizes, diameters, drive sizes and type flags are stored as arrays, and aggregates over them are computed
+    once. The arrays are not updated when a socket is modified after it was added to a set; `matches` tells
+    whether they still hold.
+
+    Attributes:
+        sizes: Size of each socket.
+        diameters: Outer diameter of each socket in mm.
+        drives: Drive size of each socket in inches.
+        types: `SocketType` flag value of each socket.
+
+    """
+
+    def __init__(self, sockets: Iterable[Socket]) -> None:
+        self._sockets = tuple(sockets)
+        self._values = tuple(_values(s) for s in self._sockets)
+        self.sizes = _column([float(s.size) for s in self._sockets], np.float64)
+        self.diameters = _column([s.diameter_mm for s in self._sockets], np.float64)
+        self.drives = _column([s.drive.value for s in self._sockets], np.float64)
+        self.types = _column([s.socket_type.value for s in self._sockets], np.int64)
+
+    def __len__(self) -> int:
+        return len(self._sockets)
+
+    @overload
+    def __getitem__(self, index: int) -> Socket: ...
+    @overload
+    def __getitem__(self, index: slice) -> SocketSet: ...
+    def __getitem__(self, index: int | slice) -> Socket | SocketSet:
+        if isinstance(index, slice):
+            return SocketSet(self._sockets[index])
+        return self._sockets[index]
+
+    def __iter__(self) -> Iterator[Socket]:
+        return iter(self._sockets)
+
+    def __repr__(self) -> str:
+        return f"SocketSet([{', '.join(str(s) for s in self._sockets)}])"
+
+    def matches(self, sockets: Sequence[Socket]) -> bool:
+        """Return True if the columns of this set are those of `sockets`, whose values may have changed since."""
+        return len(sockets) == len(self._values) and all(
+            _values(s) == v for s, v in zip(sockets, self._values, strict=True)
+        )
+
+    def has_type(self, socket_type: SocketType) -> npt.NDArray[np.bool_]:
+        """Return which sockets have any of the flags of `socket_type`."""
+        return (self.types & socket_type.value) != 0
+
+    @functools.cached_property
+    def diameter_total(self) -> float:
+        return float(self.diameters.sum())
+
+    @functools.cached_property
+    def diameter_max(self) -> float:
+        return float(self.diameters.max())
+
+    @functools.cached_property
+    def diameter_prefix(self) -> npt.NDArray[np.float64]:
+        """Sum of the diameters of the first i sockets at index i, from 0 up to `diameter_total`."""
+        return _column(np.concatenate(([0.0], np.cumsum(self.diameters))), np.float64)
+
+    def insert_width_total(self, diameter_offset: float) -> float:
+        return self.diameter_total + len(self) * diameter_offset
+
+    def run_grid_x(self, spec: OrganizerSpec, max_grid_x: int) -> npt.NDArray[np.int64]:
+        """
+        Return the grid units in X of organizers holding runs of consecutive sockets, up to `max_grid_x`.
+
+        Element `[i, k]` is `spec.grid_x` for the sockets `i` to `i + k` with the other settings of `spec`. Runs
+        only grow wider, so each row stops where a run no longer fits `max_grid_x`; the rest of the row, like
+        runs past the last socket, is `max_grid_x + 1`. The band is found by binary search, so the result has
+        one short row per socket instead of one entry per pair.
+        """
+        n = len(self)
+        pitch = spec.insert_diameter_offset + spec.insert_offset_min
+        # a run of the sockets i to j - 1 is reach[j] - reach[i] - insert_offset_min + 2 * edge_padding_x long
+        reach = self.diameter_prefix + np.arange(n + 1) * pitch
+        limit = reach[:-1] + max_grid_x * GF.GRID_UNIT + spec.insert_offset_min - spec.edge_padding_x * 2
+        # one more run than the search finds, so rounding cannot cut the band short
+        band = max(int((np.searchsorted(reach, limit, side="right") - np.arange(n)).max(initial=0)), 1)
+
+        start = np.arange(n)[:, None]
+        end = start + 1 + np.arange(band)
+        clipped = np.minimum(end, n)
+        count = clipped - start
+        widths = self.diameter_prefix[clipped] - self.diameter_prefix[start] + count * spec.insert_diameter_offset
+        length = widths + (count - 1) * spec.insert_offset_min + spec.edge_padding_x * 2
+        grid_x = np.maximum(np.ceil(length / GF.GRID_UNIT), spec.grid_x_min).astype(np.int64)
+        grid_x[(end > n) | (grid_x > max_grid_x)] = max_grid_x + 1
+        return grid_x
+
+
+def _values(s: Socket) -> tuple[object, ...]:
+    """Return the fields of `s` that the columns are computed from."""
+    return s.size, s.diameter_mm, s.drive, s.socket_type
+
+
+def _column[T: np.generic](values: npt.ArrayLike, dtype: type[T]) -> npt.NDArray[T]:
+    column = np.array(values, dtype=dtype)
+    column.flags.writeable = False
+    return column
@@ -1,18 +1,17 @@
-from dataclasses import dataclass
+import operator
+from dataclasses import dataclass, field
+from functools import reduce
 from typing import Literal
 
-from build123d import (
-    MM,
-    Color,
-)
+from thingsmith._color import ColorLike
+from thingsmith._gridfinity.spec import GF, MM, num_grid_for_mm
+from thingsmith._layout import SocketLayout, socket_layout
+from thingsmith._validation import SpecError, estimate_text_size
+from thingsmith.drive_socket._socket import Socket, SocketType
+from thingsmith.drive_socket._socket_set import SocketSet
+from thingsmith.fingerprint import COLOR_FIELD, FONT_FIELD
 
-from thingsmith._gridfinity import (
-    GF,
-)
-from thingsmith._gridfinity.block import num_grid_for_mm
-from thingsmith.drive_socket._socket import Socket
-
-default_face_plate_color = Color(0x1F79E5)
+default_face_plate_color = 0x1F79E5
 
 
 @dataclass
@@ -56,7 +55,7 @@ class OrganizerSpec:
 
     sockets: list[Socket]
     name: str | None = None
-    font: str = "Arial Rounded MT Bold"
+    font: str = field(default="Arial Rounded MT Bold", metadata=FONT_FIELD)
 
     align: Literal["center", "bottom"] = "bottom"
     align_offset: float = 0
@@ -83,7 +82,17 @@ class OrganizerSpec:
     organizer_label_padding: tuple[float, float] | None = None
     organizer_split_face_plate: float = 0
     organizer_name_suffix: str = ""
-    face_color: Color = default_face_plate_color
+    face_color: ColorLike = field(default=default_face_plate_color, metadata=COLOR_FIELD)
+
+    @property
+    def socket_set(self) -> SocketSet:
+        """Columnar view of `sockets`, kept until the list is replaced or a socket is modified."""
+        if isinstance(self.sockets, SocketSet) and self.sockets.matches(self.sockets):
+            return self.sockets
+        cached: SocketSet | None = self.__dict__.get("_socket_set")
+        if cached is None or not cached.matches(self.sockets):
+            cached = self.__dict__["_socket_set"] = SocketSet(self.sockets)
+        return cached
 
     @property
     def grid_x(self) -> int:
@@ -101,11 +110,134 @@ class OrganizerSpec:
 
     @property
     def insert_width_total(self) -> float:
-        return sum([s.diameter_mm + self.insert_diameter_offset for s in self.sockets])
+        return self.socket_set.insert_width_total(self.insert_diameter_offset)
 
     @property
     def insert_offset(self) -> float:
-        total_free = self.length_x - self.edge_padding_x * 2 - self.insert_width_total
-        if len(self.sockets) == 1:
+        if len(self.sockets) <= 1:
             return 0
+        total_free = self.length_x - self.edge_padding_x * 2 - self.insert_width_total
         return total_free / (len(self.sockets) - 1)
+
+    def validate(self) -> list[SpecError]:
+        """
+        Find problems that would make the organizer fail to build or come out broken.
+
+        Only arithmetic on the spec and estimated label sizes is used, so this is cheap enough to run before every
+        build. Returns an empty list if no problem was found.
+        """
+        errors = _check_sockets(self)
+        if errors:
+            return errors
+        layout = socket_layout(self)
+        return [
+            *_check_depths(self),
+            *_check_inserts(self, layout),
+            *_check_insert_labels(self, layout),
+            *_check_face_label(self, layout),
+        ]
+
+
+def organizer_name(spec: OrganizerSpec) -> str:
+    """Return the name of the organizer for `spec`, which also names its export files."""
+    if spec.name:
+        return spec.name
+    sizes = [s.size for s in spec.sockets]
+    drives = list({str(s.drive.value) for s in spec.sockets})
+    # sockets may have no unit or no type at all, e.g. from a catalog entry without `types`
+    units = reduce(operator.or_, [s.unit for s in spec.sockets if s.unit], SocketType(0))
+    types = reduce(operator.or_, [s.socket_type for s in spec.sockets], SocketType(0)) & ~units
+    name = "socket-organizer"
+    name += f"-{'|'.join([u.name for u in units if u.name])}[{min(sizes)}-{max(sizes)}]"
+    name += f"-drive[{','.join(drives)}]"
+    name += f"-type[{','.join([t.name for t in types if t.name])}]"
+    return name
+
+
+def _check_sockets(spec: OrganizerSpec) -> list[SpecError]:
+    if not spec.sockets:
+        return [SpecError("sockets", "at least one socket is required")]
+    return [
+        SpecError("sockets", f"diameter of {s} must be positive", i)
+        for i, s in enumerate(spec.sockets)
+        if s.diameter_mm + spec.insert_diameter_offset <= 0
+    ]
+
+
+def insert_chamfers(spec: OrganizerSpec) -> tuple[float, float]:
+    """Return the top and bottom chamfer lengths of the inserts, zero unless `insert_chamfer` is set."""
+    return (spec.insert_chamfer_top, spec.insert_chamfer_bottom) if spec.insert_chamfer else (0, 0)
+
+
+def _check_depths(spec: OrganizerSpec) -> list[SpecError]:
+    errors = []
+    height = spec.base_height + GF.HEIGHT_UNIT
+    if spec.insert_depth <= 0:
+        errors.append(SpecError("insert_depth", "must be positive"))
+    elif spec.insert_depth >= height:
+        errors.append(SpecError("insert_depth", f"{spec.insert_depth:g} cuts through the {height:g}mm base"))
+    chamfer_top, chamfer_bottom = insert_chamfers(spec)
+    if chamfer_top + chamfer_bottom > spec.insert_depth:
+        errors.append(SpecError("insert_chamfer_top", "top and bottom chamfers are deeper than the insert"))
+    if spec.organizer_split_face_plate >= height:
+        errors.append(SpecError("organizer_split_face_plate", f"must be less than the {height:g}mm base"))
+    return errors
+
+
+def _check_inserts(spec: OrganizerSpec, layout: SocketLayout) -> list[SpecError]:
+    errors = []
+    chamfer_top, chamfer_bottom = insert_chamfers(spec)
+    for i, insert in enumerate(layout.inserts):
+        x, y, _ = insert.center
+        r = insert.diameter / 2
+        if chamfer_bottom >= r:
+            errors.append(SpecError("insert_chamfer_bottom", "chamfer is wider than the insert", i))
+        # the top chamfer widens the opening
+        opening = r + chamfer_top
+        if y - opening < spec.edge_fillet or y + opening > spec.length_y - spec.edge_fillet:
+            errors.append(SpecError("grid_y", "insert does not fit the organizer depth", i))
+        if x - opening < spec.edge_fillet or x + opening > spec.length_x - spec.edge_fillet:
+            errors.append(SpecError("edge_padding_x", "insert does not fit the organizer width", i))
+
+    for i, (a, b) in enumerate(zip(layout.inserts, layout.inserts[1:], strict=False)):
+        gap = (b.center[0] - a.center[0]) - (a.diameter + b.diameter) / 2
+        if gap < 0:
+            errors.append(SpecError("insert_offset_min", "insert overlaps the next one", i))
+        elif gap <= chamfer_top * 2:
+            errors.append(SpecError("insert_chamfer_top", "chamfer leaves no gap to the next insert", i))
+    return errors
+
+
+def _check_insert_labels(spec: OrganizerSpec, layout: SocketLayout) -> list[SpecError]:
+    if not spec.insert_labels:
+        return []
+    errors = []
+    chamfer_top, _ = insert_chamfers(spec)
+    for i, (s, insert, anchor) in enumerate(zip(spec.sockets, layout.inserts, layout.insert_labels, strict=True)):
+        width, height = estimate_text_size(s.get_print_label(), spec.insert_labels_size)
+        if width > insert.diameter + spec.insert_offset:
+            errors.append(SpecError("insert_labels_size", "label is wider than its insert slot", i))
+        if anchor[1] + height > insert.center[1] - insert.diameter / 2 - chamfer_top:
+            errors.append(SpecError("insert_labels_size", "label runs into its insert", i))
+    return errors
+
+
+def _check_face_label(spec: OrganizerSpec, layout: SocketLayout) -> list[SpecError]:
+    if not spec.organizer_label:
+        return []
+    errors = []
+    width, height = estimate_text_size(spec.organizer_label, 6)
+    left, top, _ = layout.face_label
+    right, bottom = left + width, top - height
+    if right > spec.length_x - spec.edge_fillet or bottom < spec.edge_fillet:
+        errors.append(SpecError("organizer_label", "label does not fit on the organizer"))
+
+    chamfer_top, _ = insert_chamfers(spec)
+    for i, insert in enumerate(layout.inserts):
+        x, y, _ = insert.center
+        # distance from the insert center to the nearest point of the label's bounding box
+        dx = max(left - x, 0, x - right)
+        dy = max(bottom - y, 0, y - top)
+        if dx**2 + dy**2 < (insert.diameter / 2 + chamfer_top) ** 2:
+            errors.append(SpecError("organizer_label", "label runs into an insert", i))
+    return errors
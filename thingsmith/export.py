@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Self
+
+from build123d import Location
+
+from thingsmith._formats import ExportFormat, Quality
+from thingsmith._mesh import trsf_matrix
+from thingsmith._transfer import SharedPack, discard, pack, share, unpack
+from thingsmith._triangulate import triangulate
+from thingsmith._writers import ExportError, StlWriter, ThreeMFWriter, export_mesh  # noqa: F401
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+    import numpy as np
+    import numpy.typing as npt
+    from build123d import Shape
+
+
+_SUFFIXES: dict[ExportFormat, str] = {
+    "stl": ".stl",
+    "3mf": ".model.3mf",
+}
+
+
+def export_path(directory: str | Path, name: str, fmt: ExportFormat) -> Path:
+    return Path(directory) / f"{name}{_SUFFIXES[fmt]}"
+
+
+def _leaves(
+    shape: Shape,
+    quality: Quality,
+    overrides: Mapping[str, Quality],
+    location: Location | None = None,
+) -> Iterator[tuple[Shape, Quality]]:
+    """Yield every leaf of an assembly in world position, with the quality of its nearest labeled override."""
+    quality = overrides.get(shape.label, quality)
+    if not shape.children:
+        yield (shape.moved(location) if location is not None else shape), quality
+        return
+    if shape.location is not None:
+        location = location * shape.location if location is not None else shape.location
+    for child in shape.children:
+        yield from _leaves(child, quality, overrides, location)
+
+
+def _solids(leaf: Shape) -> Iterator[Shape]:
+    """Yield the solids of `leaf`, or `leaf` itself if it has none, to mesh one solid at a time."""
+    solids = leaf.solids()
+    yield from solids or [leaf]
+
+
+def _write_stl(path: Path, leaves: list[tuple[Shape, Quality]]) -> None:
+    with StlWriter(path) as writer:
+        for leaf, quality in leaves:
+            for solid in _solids(leaf):
+                writer.add(triangulate(solid, quality.linear_deflection, quality.angular_deflection))
+
+
+def _groups(
+    shape: Shape,
+    quality: Quality,
+    overrides: Mapping[str, Quality],
+) -> Iterator[tuple[Shape, list[tuple[Shape, Quality]]]]:
+    """Yield each top-level child of `shape`, or `shape` itself, with its leaves."""
+    quality = overrides.get(shape.label, quality)
+    if not shape.children:
+        yield shape, [(shape, quality)]
+        return
+    for child in shape.children:
+        yield child, list(_leaves(child, quality, overrides, shape.location))
+
+
+class _Instances:
+    """Mesh objects of a 3MF file, written once per distinct solid, quality and color."""
+
+    def __init__(self, writer: ThreeMFWriter, part_number: str) -> None:
+        self.writer = writer
+        self.part_number = part_number
+        self._by_shape: dict[tuple[Shape, Quality, tuple[float, ...] | None], int] = {}
+        self._by_digest: dict[tuple[str, tuple[float, ...] | None], int] = {}
+
+    def component(self, solid: Shape, leaf: Shape, quality: Quality) -> tuple[int, npt.NDArray[np.float64]]:
+        """Return the object id of `solid` at the origin and the transform that moves it into place."""
+        local = solid.located(Location())
+        color = leaf.color.to_tuple() if leaf.color is not None else None
+        key = (local, quality, color)
+        if key not in self._by_shape:
+            # copies of a solid do not share it, but mesh to the same triangles
+            mesh = triangulate(local, quality.linear_deflection, quality.angular_deflection).merged()
+            digest = (mesh.digest(), color)
+            if digest not in self._by_digest:
+                self._by_digest[digest] = self.writer.add_mesh(
+                    mesh,
+                    leaf.label or self.part_number,
+                    leaf.color,
+                    self.part_number,
+                )
+            self._by_shape[key] = self._by_digest[digest]
+        return self._by_shape[key], trsf_matrix((solid.location or Location()).wrapped.Transformation())
+
+
+def _write_3mf(shape: Shape, path: Path, quality: Quality, overrides: Mapping[str, Quality]) -> None:
+    part_number = shape.label or path.stem
+    with ThreeMFWriter(path) as writer:
+        instances = _Instances(writer, part_number)
+        for group, leaves in _groups(shape, quality, overrides):
+            components = [
+                instances.component(solid, leaf, leaf_quality)
+                for leaf, leaf_quality in leaves
+                for solid in _solids(leaf)
+            ]
+            writer.add_item(writer.add_components(components, group.label or part_number, part_number))
+
+
+def export_shape(
+    shape: Shape,
+    path: str | Path,
+    fmt: ExportFormat,
+    quality: Quality = Quality.ARCHIVAL,
+    overrides: Mapping[str, Quality] | None = None,
+) -> Path:
+    """
+    Write `shape` to `path` as STL or 3MF.
+
+    Each leaf of the assembly is meshed and written in turn, so memory use is bounded by the largest leaf
+    rather than the whole assembly. In 3MF, each top-level child becomes one build item whose solids are
+    components referencing shared meshes: a solid repeated in the assembly, such as identical organizers on
+    a plate, is meshed and stored once.
+
+    Args:
+        shape: Shape or assembly to export.
+        path: Output file.
+        fmt: Output format.
+        quality: Tessellation quality for the whole assembly.
+        overrides: Quality per child label, e.g. `{"Labels": Quality.ARCHIVAL}` to mesh label text finer
+            than the base. A child inherits the override of its nearest labeled ancestor.
+
+    Raises:
+        ExportError: If the file could not be written.
+
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        if fmt == "stl":
+            _write_stl(path, list(_leaves(shape, quality, overrides or {})))
+        elif fmt == "3mf":
+            _write_3mf(shape, path, quality, overrides or {})
+        else:
+            raise ExportError(path, f"unsupported format {fmt!r}")
+    except OSError as ex:
+        raise ExportError(path, str(ex)) from ex
+    return path
+
+
+def export(
+    shape: Shape,
+    directory: str | Path,
+    name: str,
+    formats: Iterable[ExportFormat] = ("stl",),
+    quality: Quality = Quality.ARCHIVAL,
+    overrides: Mapping[str, Quality] | None = None,
+) -> list[Path]:
+    """Export `shape` once per format into `directory`, returning the written paths."""
+    return [export_shape(shape, export_path(directory, name, fmt), fmt, quality, overrides) for fmt in formats]
+
+
+def _export_packed(
+    data: bytes | SharedPack,
+    directory: Path,
+    name: str,
+    formats: tuple[ExportFormat, ...],
+    quality: Quality,
+    overrides: Mapping[str, Quality] | None,
+) -> list[Path]:
+    return export(unpack(data), directory, name, formats, quality, overrides)
+
+
+class ExportPipeline:
+    """
+    Tessellate and write exports in worker processes while the caller keeps building.
+
+    Shapes are handed to the workers as BREP with their labels and colors, through shared memory. At most `max_pending`
+    exports are queued or running at a time; `submit` blocks until a slot frees up, so memory stays flat no
+    matter how many organizers are produced.
+
+    Leaving a `with` block waits for every export, like `close`, and raises the first export error.
+
+    Example:
+        with ExportPipeline("./stl", formats=["stl", "3mf"], workers=4) as pipeline:
+            for spec in specs:
+                pipeline.submit(Organizer(spec))
+
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        formats: Iterable[ExportFormat] = ("stl",),
+        workers: int | None = None,
+        max_pending: int | None = None,
+        quality: Quality = Quality.ARCHIVAL,
+        overrides: Mapping[str, Quality] | None = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.formats = tuple(formats)
+        self.quality = quality
+        self.overrides = dict(overrides or {})
+        workers = workers or os.cpu_count() or 1
+        self._slots = threading.BoundedSemaphore(max_pending or workers * 2)
+        self._pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        self._futures: list[Future[list[Path]]] = []
+
+    def submit(self, shape: Shape, name: str | None = None) -> Future[list[Path]]:
+        """Queue `shape` for export, named `name` or its label, blocking while the queue is full."""
+        name = name or getattr(shape, "name", None) or shape.label
+        if not name:
+            msg = "an export name is required for unlabeled shapes"
+            raise ValueError(msg)
+        data = share(pack(shape))
+        try:
+            self._slots.acquire()
+            try:
+                future = self._pool.submit(
+                    _export_packed,
+                    data,
+                    self.directory,
+                    name,
+                    self.formats,
+                    self.quality,
+                    self.overrides,
+                )
+            except BaseException:
+                self._slots.release()
+                raise
+        except BaseException:
+            discard(data)
+            raise
+        future.add_done_callback(lambda f: self._done(f, data))
+        self._futures.append(future)
+        return future
+
+    def _done(self, future: Future[list[Path]], data: bytes | SharedPack) -> None:
+        if future.cancelled():
+            # a cancelled export never reads its shape
+            discard(data)
+        self._slots.release()
+
+    def close(self) -> list[Path]:
+        """Wait for every queued export and return all written paths, raising the first export error."""
+        self._pool.shutdown(wait=True)
+        paths: list[Path] = []
+        for future in self._futures:
+            paths.extend(future.result())
+        return paths
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc: object) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        # the error of the block is propagated, so exports that have not started are dropped
+        self._pool.shutdown(wait=True, cancel_futures=True)
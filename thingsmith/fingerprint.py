@@ -0,0 +1,196 @@
+"""
+Canonical fingerprints of specs and other build inputs.
+
+The spec and tool dataclasses are mutable and unhashable, and values that build the same geometry can be
+written in different ways: `0.375` and `0.375000000001` are the same depth. `canonical` reduces a value to
+hashable, frozen data with numbers rounded to `FLOAT_DIGITS` decimals, flags as sorted member names and fonts
+as the contents of the file they resolve to. Tool sizes are also printed on labels, where `Fraction(3, 8)`
+reads `3/8` but `0.375` reads `0.375`, so fields marked with `LABEL_FIELD` keep their text as well.
+`fingerprint` adds the library versions and `GF` constants, so a `Fingerprint` can key any cache of built or
+exported geometry.
+
+Example:
+    key = fingerprint(spec).hexdigest()
+
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+import functools
+import hashlib
+import json
+import numbers
+import sys
+from collections.abc import Sequence
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import PurePath
+from typing import Any
+
+from thingsmith._color import rgba
+from thingsmith._fonts import DEFAULT_FONT, font_path
+from thingsmith._gridfinity.spec import GF
+
+FLOAT_DIGITS = 9
+"""Decimals kept of every number, so that float noise does not change a fingerprint."""
+
+FONT_FIELD: dict[str, Any] = {"fingerprint": "font"}
+"""Dataclass field metadata marking a font name, fingerprinted by the contents of its font file."""
+
+LABEL_FIELD: dict[str, Any] = {"fingerprint": "label"}
+"""Dataclass field metadata marking a value printed on labels, fingerprinted by its value and its text."""
+
+COLOR_FIELD: dict[str, Any] = {"fingerprint": "color"}
+"""Dataclass field metadata marking a `ColorLike`, fingerprinted by its RGBA values however it is written."""
+
+COLOR_DIGITS = 6
+"""Decimals kept of color channels, which build123d stores as 32-bit floats."""
+
+type Canonical = bool | float | str | tuple[Canonical, ...] | Record | Font | None
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Record:
+    """A dataclass instance as its type name and canonical field values."""
+
+    kind: str
+    fields: tuple[tuple[str, Canonical], ...]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Font:
+    """A font name with the SHA-256 of the file it resolves to, empty if it is not installed."""
+
+    name: str
+    digest: str
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Fingerprint:
+    """
+    Canonical value together with the environment it is built in.
+
+    Attributes:
+        value: The canonical input.
+        environment: Library versions, `GF` constants and the default label font.
+
+    """
+
+    value: Canonical
+    environment: tuple[tuple[str, Canonical], ...]
+
+    def hexdigest(self) -> str:
+        """Return a SHA-256 of the fingerprint that is stable across processes and machines."""
+        payload = json.dumps([_json(self.value), _json(self.environment)], separators=(",", ":"))
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@functools.cache
+def font(name: str) -> Font:
+    path = font_path(name)
+    try:
+        digest = hashlib.sha256(path.read_bytes()).hexdigest() if path else ""
+    except OSError:
+        digest = ""
+    return Font(name, digest)
+
+
+def _number(value: float) -> float:
+    # + 0.0 turns -0.0 into 0.0
+    return round(float(value), FLOAT_DIGITS) + 0.0
+
+
+def _record(value: Any) -> Record:  # noqa: ANN401
+    fields: list[tuple[str, Canonical]] = []
+    for f in dataclasses.fields(value):
+        v = getattr(value, f.name)
+        if f.metadata == FONT_FIELD:
+            fields.append((f.name, font(v)))
+        elif f.metadata == COLOR_FIELD:
+            fields.append((f.name, color(v)))
+        elif f.metadata == LABEL_FIELD:
+            fields.append((f.name, (canonical(v), str(v))))
+        else:
+            fields.append((f.name, canonical(v)))
+    return Record(type(value).__qualname__, tuple(fields))
+
+
+def color(value: Any) -> Canonical:  # noqa: ANN401
+    return tuple(round(c, COLOR_DIGITS) + 0.0 for c in rgba(value))
+
+
+def _is_color(value: object) -> bool:
+    # a build123d color can only exist once build123d is imported
+    build123d = sys.modules.get("build123d")
+    return build123d is not None and isinstance(value, build123d.Color)
+
+
+def canonical(value: object) -> Canonical:
+    """
+    Return the canonical form of `value`.
+
+    Supports dataclass instances, enums and flags, build123d colors, numbers, strings, paths, and sequences,
+    sets and dicts of these.
+    """
+    if value is None or isinstance(value, (bool, str, Record, Font)):
+        return value
+    if isinstance(value, numbers.Real):
+        return _number(float(value))
+    if isinstance(value, enum.Flag):
+        return tuple(sorted(m.name or "" for m in value))
+    if isinstance(value, enum.Enum):
+        return value.name
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _record(value)
+    if _is_color(value):
+        return color(value)
+    if isinstance(value, PurePath):
+        return value.as_posix()
+    return _collection(value)
+
+
+def _collection(value: object) -> Canonical:
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), canonical(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted((canonical(v) for v in value), key=repr))
+    if isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
+        # any sequence, e.g. a `SocketSet`, is the same as a list of its items
+        return tuple(canonical(v) for v in value)
+    msg = f"cannot fingerprint {type(value).__name__}"
+    raise TypeError(msg)
+
+
+@functools.cache
+def _package_version(name: str) -> str:
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def environment() -> tuple[tuple[str, Canonical], ...]:
+    """Return the library versions, `GF` constants and default label font builds depend on."""
+    return (
+        ("thingsmith", _package_version("thingsmith")),
+        ("build123d", _package_version("build123d")),
+        ("ocp", _package_version("cadquery-ocp")),
+        ("gf", canonical(dict(GF.values()))),
+        ("default_font", font(DEFAULT_FONT)),
+    )
+
+
+def fingerprint(value: object) -> Fingerprint:
+    """Return the fingerprint of `value` in the current environment."""
+    return Fingerprint(canonical(value), environment())
+
+
+def _json(value: Canonical) -> object:
+    if isinstance(value, Record):
+        return {"kind": value.kind, "fields": [[k, _json(v)] for k, v in value.fields]}
+    if isinstance(value, Font):
+        return {"font": value.name, "digest": value.digest}
+    if isinstance(value, tuple):
+        return [_json(v) for v in value]
+    return value
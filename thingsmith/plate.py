@@ -0,0 +1,235 @@
+"""
+Arrange organizers on printer beds.
+
+Organizers are packed by their footprint in grid units, so nothing is built or measured to place them.
+Footprints are placed with a MaxRects packer (best short side fit, optionally turned by 90°), largest first,
+each into the first plate it fits on.
+
+Example:
+    plates = pack([socket.LazyOrganizer(spec) for spec in specs], bed=(256, 256))
+    export_plates(plates, "./plates")
+
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol, cast
+
+from build123d import Location, Part
+
+from thingsmith._gridfinity.spec import GF
+from thingsmith._lazy import LazyOrganizer
+from thingsmith.export import Quality, export_shape
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from build123d import Shape
+
+type Rect = tuple[float, float, float, float]
+"""x, y, width and depth."""
+
+
+class Placeable(Protocol):
+    """An organizer, built or lazy, with a known size in grid units."""
+
+    name: str
+    grid_x: int
+    grid_y: int
+
+
+class PlateOverflowError(ValueError):
+    def __init__(self, item: Placeable, bed: tuple[float, float]) -> None:
+        super().__init__(f"{item.name} does not fit a {bed[0]:g}x{bed[1]:g}mm bed")
+
+
+def footprint(item: Placeable) -> tuple[float, float]:
+    """Return the width and depth of `item` in mm."""
+    return item.grid_x * GF.GRID_UNIT, item.grid_y * GF.GRID_UNIT
+
+
+def fits(item: Placeable, bed: tuple[float, float], *, rotate: bool = True) -> bool:
+    """Return whether `item` fits an empty bed, e.g. to set aside the organizers `pack` would reject."""
+    width, depth = footprint(item)
+    return (width <= bed[0] and depth <= bed[1]) or (rotate and depth <= bed[0] and width <= bed[1])
+
+
+@dataclass(frozen=True)
+class Placement:
+    """
+    Position of one organizer on a plate.
+
+    Attributes:
+        item: The organizer.
+        x: X of the footprint's front left corner on the bed.
+        y: Y of the footprint's front left corner on the bed.
+        rotated: Whether the organizer is turned by 90° about Z.
+
+    """
+
+    item: Placeable
+    x: float
+    y: float
+    rotated: bool = False
+
+    @property
+    def location(self) -> Location:
+        """Location that moves the organizer from its origin to its place on the bed."""
+        if not self.rotated:
+            return Location((self.x, self.y, 0))
+        # turning about Z moves the footprint to negative X, so shift it back by its depth
+        _, depth = footprint(self.item)
+        return Location((self.x + depth, self.y, 0), (0, 0, 90))
+
+    def shape(self) -> Shape:
+        """Return the organizer moved to its place, building it first if it is lazy."""
+        shape = self.item.shape if isinstance(self.item, LazyOrganizer) else cast("Shape", self.item)
+        return shape.moved(self.location)
+
+
+@dataclass
+class Plate:
+    """Organizers placed on one bed."""
+
+    bed: tuple[float, float]
+    placements: list[Placement] = field(default_factory=list)
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the bed covered by footprints."""
+        used = sum(w * d for w, d in (footprint(p.item) for p in self.placements))
+        return used / (self.bed[0] * self.bed[1])
+
+    def assembly(self, name: str = "plate") -> Part:
+        """Return every organizer of the plate in place, as children of one part."""
+        return Part(label=name, children=[p.shape() for p in self.placements])
+
+    def export(
+        self,
+        path: str | Path,
+        quality: Quality = Quality.ARCHIVAL,
+        overrides: Mapping[str, Quality] | None = None,
+    ) -> Path:
+        """Write the plate as one 3MF file."""
+        path = Path(path)
+        return export_shape(self.assembly(path.stem), path, "3mf", quality, overrides)
+
+
+class _Bin:
+    """Free space of one bed as maximal free rectangles."""
+
+    def __init__(self, width: float, depth: float) -> None:
+        self.free: list[Rect] = [(0, 0, width, depth)]
+
+    def find(self, width: float, depth: float, *, rotate: bool) -> tuple[tuple[float, float], Rect, bool] | None:
+        """Return the best (score, rectangle, rotated) to place a `width` by `depth` footprint, if any fits."""
+        sizes = [(width, depth, False)]
+        if rotate and width != depth:
+            sizes.append((depth, width, True))
+        best = None
+        for fx, fy, fw, fd in self.free:
+            for w, d, rotated in sizes:
+                if w <= fw and d <= fd:
+                    leftover = (fw - w, fd - d)
+                    score = (min(leftover), max(leftover))
+                    if best is None or score < best[0]:
+                        best = (score, (fx, fy, w, d), rotated)
+        return best
+
+    def place(self, rect: Rect) -> None:
+        x, y, w, d = rect
+        free: list[Rect] = []
+        for fx, fy, fw, fd in self.free:
+            if x >= fx + fw or x + w <= fx or y >= fy + fd or y + d <= fy:
+                free.append((fx, fy, fw, fd))
+                continue
+            # keep the parts of the free rectangle on each side of the placed one
+            if x > fx:
+                free.append((fx, fy, x - fx, fd))
+            if x + w < fx + fw:
+                free.append((x + w, fy, fx + fw - x - w, fd))
+            if y > fy:
+                free.append((fx, fy, fw, y - fy))
+            if y + d < fy + fd:
+                free.append((fx, y + d, fw, fy + fd - y - d))
+        self.free = _maximal(free)
+
+
+def _contains(outer: Rect, inner: Rect) -> bool:
+    ox, oy, ow, od = outer
+    ix, iy, iw, id_ = inner
+    return ox <= ix and oy <= iy and ix + iw <= ox + ow and iy + id_ <= oy + od
+
+
+def _maximal(rects: list[Rect]) -> list[Rect]:
+    """Drop the rectangles that lie inside another one, keeping the first of identical ones."""
+    kept = []
+    for i, r in enumerate(rects):
+        if not any(_contains(o, r) and (o != r or j < i) for j, o in enumerate(rects) if j != i):
+            kept.append(r)
+    return kept
+
+
+def _first_fit(
+    plates: list[tuple[Plate, _Bin]],
+    size: tuple[float, float],
+    *,
+    rotate: bool,
+) -> tuple[Plate, _Bin, tuple[tuple[float, float], Rect, bool]] | None:
+    for plate, free in plates:
+        found = free.find(*size, rotate=rotate)
+        if found is not None:
+            return plate, free, found
+    return None
+
+
+def pack(
+    items: Iterable[Placeable],
+    bed: tuple[float, float] = (256, 256),
+    spacing: float = 5,
+    *,
+    rotate: bool = True,
+) -> list[Plate]:
+    """
+    Arrange `items` on as few plates of size `bed` as the packer finds.
+
+    Args:
+        items: Organizers to place, built or lazy.
+        bed: Width and depth of the printable area in mm.
+        spacing: Gap between neighboring organizers in mm.
+        rotate: Allow turning organizers by 90° to make them fit.
+
+    Raises:
+        PlateOverflowError: If an organizer is larger than the bed, see `fits`.
+
+    """
+    # a gap is kept after every footprint, and the bed is grown by one gap so the last one may touch its edge
+    sized = [(item, *footprint(item)) for item in items]
+    sized.sort(key=lambda s: (max(s[1], s[2]), s[1] * s[2]), reverse=True)
+
+    plates: list[tuple[Plate, _Bin]] = []
+    for item, width, depth in sized:
+        size = (width + spacing, depth + spacing)
+        target = _first_fit(plates, size, rotate=rotate)
+        if target is None:
+            plates.append((Plate(bed), _Bin(bed[0] + spacing, bed[1] + spacing)))
+            target = _first_fit(plates[-1:], size, rotate=rotate)
+            if target is None:
+                raise PlateOverflowError(item, bed)
+        plate, free, (_, rect, rotated) = target
+        free.place(rect)
+        plate.placements.append(Placement(item, rect[0], rect[1], rotated))
+    return [plate for plate, _ in plates]
+
+
+def export_plates(
+    plates: Iterable[Plate],
+    directory: str | Path,
+    name: str = "plate",
+    quality: Quality = Quality.ARCHIVAL,
+    overrides: Mapping[str, Quality] | None = None,
+) -> list[Path]:
+    """Write each plate as `<name>-<n>.3mf` into `directory`, building lazy organizers one plate at a time."""
+    return [plate.export(Path(directory) / f"{name}-{i}.3mf", quality, overrides) for i, plate in enumerate(plates, 1)]
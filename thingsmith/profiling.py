@@ -0,0 +1,246 @@
+"""
+Per-phase timing of organizer builds.
+
+Builds are split into named spans (frame, pockets, fillets, labels, ...). Spans are only measured while a
+`Recorder` is active; otherwise `span` returns a shared no-op context manager, so instrumented code costs
+next to nothing.
+
+Example:
+    with Recorder() as rec:
+        Organizer(spec)
+    rec.write_chrome_trace("build.trace.json")  # open in chrome://tracing or https://ui.perfetto.dev
+
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+_active: ContextVar[Recorder | None] = ContextVar("thingsmith_recorder", default=None)
+_disabled = contextlib.nullcontext()
+
+
+def _rss() -> int | None:
+    """Return the current resident set size of this process in bytes, or None where it cannot be read."""
+    # only Linux reports the current size without extra dependencies; getrusage has just the process peak
+    try:
+        pages = int(Path("/proc/self/statm").read_text().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+class _PeakSampler:
+    """
+    Raise the peak of every open span to the current resident set size while any span is open.
+
+    Memory that is allocated and freed again within a phase, e.g. by a large boolean or tessellation, is only
+    seen by sampling during the phase, so a background thread reads it every `interval` seconds.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._open: dict[int, list[int]] = {}
+        self._stop: threading.Event | None = None
+
+    def _raise(self, rss: int) -> None:
+        for peak in self._open.values():
+            peak[0] = max(peak[0], rss)
+
+    def _run(self, stop: threading.Event) -> None:
+        while not stop.wait(self.interval):
+            rss = _rss()
+            if rss is None:
+                continue
+            with self._lock:
+                self._raise(rss)
+
+    def open(self, rss: int) -> list[int]:
+        """Start tracking the peak of a new span, starting from the resident set size `rss`."""
+        peak = [rss]
+        with self._lock:
+            self._open[id(peak)] = peak
+            if self._stop is None:
+                self._stop = threading.Event()
+                threading.Thread(target=self._run, args=(self._stop,), name="thingsmith-rss", daemon=True).start()
+        return peak
+
+    def close(self, peak: list[int], rss: int) -> int:
+        """Stop tracking `peak` at the resident set size `rss` and return the highest value seen."""
+        with self._lock:
+            self._raise(rss)
+            del self._open[id(peak)]
+            if not self._open and self._stop is not None:
+                self._stop.set()
+                self._stop = None
+        return peak[0]
+
+
+@dataclass(frozen=True)
+class Span:
+    """
+    One measured phase.
+
+    Attributes:
+        name: Phase name, e.g. `socket.pockets`.
+        start: Seconds from the start of the recording.
+        wall: Elapsed wall time in seconds.
+        cpu: CPU time of the whole process in seconds, including threads started by OCC.
+        rss: Resident set size of the process in bytes when the phase ended.
+        rss_delta: Change of the resident set size over the phase in bytes; negative if memory was released.
+        rss_peak: Highest resident set size of the process in bytes during the phase, sampled every
+            `sample_interval` seconds of the `Recorder` and at both ends, including memory freed before the phase ended.
+
+    The memory fields are only measured on Linux, and None elsewhere.
+        depth: Nesting level, 0 for top level phases.
+        thread: Identifier of the thread the phase ran in.
+        attrs: Extra values passed to `span`.
+
+    """
+
+    name: str
+    start: float
+    wall: float
+    cpu: float
+    rss: int | None
+    rss_delta: int | None
+    rss_peak: int | None
+    depth: int
+    thread: int
+    attrs: dict[str, Any] = field(default_factory=dict)
+
+
+class Recorder:
+    """
+    Collect the spans of everything built while the recorder is active.
+
+    Args:
+        on_span: Called with each span as it ends, e.g. to stream them to a log.
+        sample_interval: Seconds between readings of the resident set size while a span is open.
+
+    """
+
+    def __init__(self, on_span: Callable[[Span], None] | None = None, sample_interval: float = 0.005) -> None:
+        self.spans: list[Span] = []
+        self.on_span = on_span
+        self._sampler = _PeakSampler(sample_interval)
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._tokens: list[Any] = []
+
+    def __enter__(self) -> Self:
+        self._tokens.append(_active.set(self))
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        _active.reset(self._tokens.pop())
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attrs: Any) -> Iterator[None]:  # noqa: ANN401
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        start = time.perf_counter()
+        cpu = time.process_time()
+        rss = _rss()
+        peak = self._sampler.open(rss) if rss is not None else None
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            end_rss = _rss()
+            peak_rss = None
+            if peak is not None:
+                peak_rss = self._sampler.close(peak, end_rss if end_rss is not None else 0)
+            self._local.depth = depth
+            s = Span(
+                name=name,
+                start=start - self._origin,
+                wall=end - start,
+                cpu=time.process_time() - cpu,
+                rss=end_rss,
+                rss_delta=end_rss - rss if end_rss is not None and rss is not None else None,
+                rss_peak=peak_rss,
+                depth=depth,
+                thread=threading.get_ident(),
+                attrs=attrs,
+            )
+            with self._lock:
+                self.spans.append(s)
+            if self.on_span is not None:
+                self.on_span(s)
+
+    def totals(self) -> dict[str, float]:
+        """Return the total wall time per span name."""
+        totals: dict[str, float] = {}
+        for s in self.spans:
+            totals[s.name] = totals.get(s.name, 0) + s.wall
+        return totals
+
+    def to_json(self) -> list[dict[str, Any]]:
+        return [asdict(s) for s in sorted(self.spans, key=lambda s: s.start)]
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Return the spans in the Chrome trace event format."""
+        pid = os.getpid()
+        events = [
+            {
+                "name": s.name,
+                "ph": "X",
+                "ts": s.start * 1e6,
+                "dur": s.wall * 1e6,
+                "pid": pid,
+                "tid": s.thread,
+                "args": {"cpu": s.cpu, "rss": s.rss, "rss_delta": s.rss_delta, "rss_peak": s.rss_peak, **s.attrs},
+            }
+            for s in self.spans
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_json(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.write_text(json.dumps(self.to_json(), indent=2, default=str))
+        return path
+
+    def write_chrome_trace(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.write_text(json.dumps(self.to_chrome_trace(), default=str))
+        return path
+
+
+def span(name: str, **attrs: Any) -> contextlib.AbstractContextManager[None]:  # noqa: ANN401
+    """Measure the enclosed block as phase `name` if a recorder is active."""
+    recorder = _active.get()
+    if recorder is None:
+        return _disabled
+    return recorder.span(name, **attrs)
+
+
+def traced[**P, R](name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Measure every call of the decorated function as phase `name` if a recorder is active."""
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            recorder = _active.get()
+            if recorder is None:
+                return func(*args, **kwargs)
+            with recorder.span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
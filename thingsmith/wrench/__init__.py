@@ -1,9 +1,28 @@
-from thingsmith.wrench._organizer import Organizer, OrganizerSpec
+from typing import TYPE_CHECKING
+
+from thingsmith._imports import lazy_attributes
+from thingsmith._validation import InvalidSpecError, SpecError
+from thingsmith.wrench._spec import OrganizerSpec
 from thingsmith.wrench._wrench import Wrench, WrenchUnit
 
+if TYPE_CHECKING:
+    from thingsmith.wrench._organizer import LazyOrganizer, Organizer
+
 __all__ = [
+    "InvalidSpecError",
+    "LazyOrganizer",
     "Organizer",
     "OrganizerSpec",
+    "SpecError",
     "Wrench",
     "WrenchUnit",
 ]
+
+# the organizers import build123d, so they are loaded on first use
+__getattr__ = lazy_attributes(
+    __name__,
+    {
+        "LazyOrganizer": "thingsmith.wrench._organizer",
+        "Organizer": "thingsmith.wrench._organizer",
+    },
+)
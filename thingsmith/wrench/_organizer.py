@@ -1,7 +1,4 @@
-from dataclasses import dataclass
-
 from build123d import (
-    MM,
     Align,
     Axis,
     BasePartObject,
@@ -13,33 +10,30 @@ from build123d import (
     Part,
     Plane,
     RotationLike,
-    Select,
-    Text,
     extrude,
-    fillet,
 )
 
+from thingsmith import _lazy
 from thingsmith._gridfinity import (
     GF,
     OrganizerFrame,
 )
-from thingsmith._gridfinity.block import num_grid_for_mm
+from thingsmith._label import Label
+from thingsmith._layout import WRENCH_INNER_FILLET, WRENCH_TOP_FILLET, WrenchLayout, wrench_layout
+from thingsmith._parts import cached_child
+from thingsmith.booleans import cut
+from thingsmith.profiling import span
 from thingsmith.wrench._profile import InsertProfile
+from thingsmith.wrench._spec import LABEL_SIZE, OrganizerSpec, organizer_name
 from thingsmith.wrench._wrench import Wrench
 
 
-@dataclass
-class OrganizerSpec:
-    grid_y: int = 2
-    min_grid_x: int = 1
-    min_insert_offset: float = 3 * MM
-    radius: float = 3
-    front_offset: float = 0 * MM
-    back_offset: float = 0 * MM
-    add_labels: bool = True
-
-
 class Organizer(BasePartObject):
+    spec: OrganizerSpec
+    name: str
+    grid_x: int
+    grid_y: int
+
     def __init__(
         self,
         wrench_set: list[Wrench],
@@ -50,64 +44,105 @@ class Organizer(BasePartObject):
     ) -> None:
         parts = []
         spec = spec or OrganizerSpec()
+        self.spec = spec
+
+        layout = wrench_layout(wrench_set, spec)
+        self.grid_x = layout.grid_x
+        self.grid_y = spec.grid_y
+        profiles = tuple((w.profile_width, w.profile_height) for w in wrench_set)
 
-        min_height = max([w.profile_height for w in wrench_set])
-        height = min_height + 3
-        width_sum = sum([w.profile_width for w in wrench_set])
-        grid_x = max(
-            num_grid_for_mm(spec.front_offset + width_sum +
-                            (len(wrench_set) + 2) * spec.min_insert_offset),
-            spec.min_grid_x,
+        # the body only depends on the profiles and the labels only on their text, so either is reused when the
+        # other changes
+        body = cached_child(
+            "wrench.body",
+            (profiles, spec.grid_y, spec.radius, layout.grid_x, layout.height, tuple(layout.inserts)),
+            lambda: self._build_body(wrench_set, spec, layout),
         )
-        offset = ((grid_x * GF.GRID_UNIT + spec.front_offset +
-                  spec.back_offset) - width_sum) / (len(wrench_set) + 2)
-
-        with BuildPart() as organizer:
-            OrganizerFrame(
-                height=height,
-                grid_x=grid_x,
-                grid_y=spec.grid_y,
-                radius=spec.radius,
-                align=Align.MIN,
-            )
+        if not body:
+            return
+        parts.append(body)
+
+        if spec.add_labels:
+            with span("wrench.labels", count=len(wrench_set)):
+                labels = cached_child(
+                    "wrench.labels",
+                    (tuple(str(w) for w in wrench_set), tuple(layout.labels)),
+                    lambda: self._build_labels(wrench_set, layout),
+                )
+            if labels:
+                parts.append(labels)
+
+        self.name = organizer_name(wrench_set)
+        part = Part(label=self.name, children=parts)
+        super().__init__(part, rotation, align, mode)
+
+    @staticmethod
+    def _build_body(wrench_set: list[Wrench], spec: OrganizerSpec, layout: WrenchLayout) -> Part | None:
+        with BuildPart():
+            with span("wrench.frame", grid_x=layout.grid_x, grid_y=spec.grid_y):
+                frame = OrganizerFrame(
+                    height=layout.height,
+                    grid_x=layout.grid_x,
+                    grid_y=spec.grid_y,
+                    radius=spec.radius,
+                    align=Align.MIN,
+                    mode=Mode.PRIVATE,
+                )
 
             # cut inserts
-            with BuildSketch(Plane.XZ):
-                distance = offset + spec.front_offset
-                for w in wrench_set:
-                    h = (height - w.profile_height) + (height / 2) - 1
-                    with Locations((distance, h)):
-                        InsertProfile(w.profile_width, w.profile_height, align=(
-                            (Align.MIN, Align.MIN)))
-                        distance += w.profile_width + offset
-            extrude(amount=-spec.grid_y * GF.GRID_UNIT, mode=Mode.SUBTRACT)
-
-            # apply filley to the edges
-            edges = organizer.edges(Select.LAST)
+            with span("wrench.inserts", count=len(wrench_set)):
+                with BuildSketch(Plane.XZ):
+                    for w, position in zip(wrench_set, layout.inserts, strict=True):
+                        with Locations(position):
+                            InsertProfile(w.profile_width, w.profile_height, align=(
+                                (Align.MIN, Align.MIN)))
+                inserts = extrude(amount=-spec.grid_y * GF.GRID_UNIT, mode=Mode.PRIVATE)
+                body = cut(frame, [inserts])
+
+        # fillet the edges made by the cut
+        with span("wrench.fillet"):
+            frame_edges = set(frame.edges())
+            edges = body.edges().filter_by(lambda v: v not in frame_edges)
             top_edges = edges.group_by(Axis.Z)[-1]
             inner_edges = edges.filter_by(
                 lambda v: v not in top_edges).filter_by(Axis.Y)
-            fillet(top_edges, radius=0.4)
-            fillet(inner_edges, radius=0.3)
-        if not organizer.part:
-            return
-        organizer.part.color = Color(0xB3B3B3)
-        organizer.part.label = "organizer"
-        parts.append(organizer.part)
+            body = body.fillet(WRENCH_TOP_FILLET, top_edges)
+            body = body.fillet(WRENCH_INNER_FILLET, inner_edges)
+        if not body:
+            return None
+        body.color = Color(0xB3B3B3)
+        body.label = "organizer"
+        return body
 
-        # add labels
-        if spec.add_labels:
-            topf = organizer.faces().group_by(Axis.Z)[-1].sort_by(Axis.X)
-            with BuildPart() as labels:
-                for i, w in enumerate(wrench_set):
-                    face = topf[i]
-                    with BuildSketch(face):
-                        Text(f"{w}", 6, rotation=-90)
-                    extrude(amount=0.75)
-            if labels.part:
-                labels.part.color = Color("white")
-                labels.part.label = "labels"
-                parts.append(labels.part)
-
-        part = Part(children=parts)
-        super().__init__(part, rotation, align, mode)
+    @staticmethod
+    def _build_labels(wrench_set: list[Wrench], layout: WrenchLayout) -> Part | None:
+        with BuildPart() as labels:
+            for w, anchor in zip(wrench_set, layout.labels, strict=True):
+                with BuildSketch(Plane(origin=anchor)):
+                    Label(f"{w}", LABEL_SIZE, rotation=-90)
+                extrude(amount=0.75)
+        if not labels.part:
+            return None
+        labels.part.color = Color("white")
+        labels.part.label = "labels"
+        return labels.part
+
+
+class LazyOrganizer(_lazy.LazyOrganizer):
+    """
+    A wrench organizer whose name, size and export paths are available without building it.
+
+    The geometry is built on first access of `shape` or on `export`.
+    """
+
+    def __init__(self, wrench_set: list[Wrench], spec: OrganizerSpec | None = None) -> None:
+        self.wrench_set = wrench_set
+        self.spec = spec or OrganizerSpec()
+        layout = wrench_layout(wrench_set, self.spec)
+        self.name = organizer_name(wrench_set)
+        self.grid_x = layout.grid_x
+        self.grid_y = self.spec.grid_y
+        self.height = GF.HEIGHT_UNIT + layout.height
+
+    def _build(self) -> Organizer:
+        return Organizer(self.wrench_set, self.spec)
@@ -13,6 +13,8 @@ from build123d import (
     make_face,
 )
 
+from thingsmith._layout import PROFILE_ANGLE, PROFILE_BOTTOM_RATIO, PROFILE_LIP_HEIGHT, PROFILE_LIP_WIDTH
+
 
 class InsertProfile(BaseSketchObject):
     def __init__(
@@ -23,13 +25,12 @@ class InsertProfile(BaseSketchObject):
         align: Align | tuple[Align, Align] | None = None,
         mode: Mode = Mode.ADD,
     ) -> None:
-        angle_degrees = 40
-        angle_radians = math.radians(angle_degrees)
-        bottom_width = width * (2 / 5)
+        angle_radians = math.radians(PROFILE_ANGLE)
+        bottom_width = width * PROFILE_BOTTOM_RATIO
         angle_height = (width - bottom_width) * math.tan(angle_radians)
 
-        lip_w = 3
-        lip_h = 3
+        lip_w = PROFILE_LIP_WIDTH
+        lip_h = PROFILE_LIP_HEIGHT
         l0 = (lip_w, 0)
         l1 = (lip_w, -lip_h / 2)
         l2 = (0, -lip_h)
@@ -0,0 +1,56 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from thingsmith._gridfinity.spec import GF, MM
+from thingsmith._layout import wrench_layout
+from thingsmith._validation import SpecError, estimate_text_size
+from thingsmith.wrench._wrench import Wrench
+
+LABEL_SIZE = 6
+
+
+def organizer_name(wrench_set: Sequence[Wrench]) -> str:
+    """Return the name of the organizer for `wrench_set`, which also names its export files."""
+    sizes = [float(w.size) for w in wrench_set]
+    units = sorted({w.unit.name for w in wrench_set})
+    return f"wrench-organizer-{'|'.join(units)}[{min(sizes):g}-{max(sizes):g}]"
+
+
+@dataclass
+class OrganizerSpec:
+    grid_y: int = 2
+    min_grid_x: int = 1
+    min_insert_offset: float = 3 * MM
+    radius: float = 3
+    front_offset: float = 0 * MM
+    back_offset: float = 0 * MM
+    add_labels: bool = True
+
+    def validate(self, wrench_set: Sequence[Wrench]) -> list[SpecError]:
+        """
+        Find problems that would make an organizer for `wrench_set` fail to build or come out broken.
+
+        Only arithmetic on the spec and estimated label sizes is used. Returns an empty list if no problem was
+        found.
+        """
+        if not wrench_set:
+            return [SpecError("wrench_set", "at least one wrench is required")]
+        if self.grid_y < 1:
+            return [SpecError("grid_y", "must be at least 1")]
+
+        errors = []
+        layout = wrench_layout(wrench_set, self)
+        length_y = self.grid_y * GF.GRID_UNIT
+        for i, (w, opening, (start, end)) in enumerate(
+            zip(wrench_set, layout.openings, layout.strips, strict=True),
+        ):
+            if opening <= 0:
+                errors.append(SpecError("wrench_set", f"insert for {w} does not open through the top face", i))
+            if end <= start:
+                errors.append(SpecError("min_insert_offset", f"insert for {w} overlaps its neighbor", i))
+            elif self.add_labels:
+                # labels are rotated to run along the inserts
+                width, height = estimate_text_size(str(w), LABEL_SIZE)
+                if height > end - start or width > length_y:
+                    errors.append(SpecError("add_labels", f"label {w} does not fit in front of its insert", i))
+        return errors
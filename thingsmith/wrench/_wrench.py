@@ -1,7 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
 from fractions import Fraction
 
+from thingsmith.fingerprint import LABEL_FIELD
+
 
 class WrenchUnit(Enum):
     METRIC = auto()
@@ -10,7 +12,7 @@ class WrenchUnit(Enum):
 
 @dataclass
 class Wrench:
-    size: int | float | Fraction | str
+    size: int | float | Fraction | str = field(metadata=LABEL_FIELD)
     grip_width_mm: float = 0
     unit: WrenchUnit = WrenchUnit.METRIC
 